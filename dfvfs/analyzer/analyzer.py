@@ -3,6 +3,8 @@
 
 from __future__ import unicode_literals
 
+import collections
+
 import pysigscan
 
 from dfvfs.analyzer import specification
@@ -13,10 +15,16 @@ from dfvfs.resolver import resolver
 class Analyzer(object):
   """Format analyzer."""
 
+  _MAXIMUM_NUMBER_OF_CACHED_TYPE_INDICATORS = 1024
+
   _SCAN_BUFFER_SIZE = 33 * 1024
 
   _analyzer_helpers = {}
 
+  # The type indicators of previously analyzed files, per format category,
+  # path specification comparable and file size.
+  _type_indicators_cache = collections.OrderedDict()
+
   # The archive format category analyzer helpers that do not have
   # a format specification.
   _archive_remainder_list = None
@@ -99,6 +107,10 @@ class Analyzer(object):
       cls._volume_system_scanner = None
       cls._volume_system_store = None
 
+    for cache_key in list(cls._type_indicators_cache.keys()):
+      if cache_key[0] in format_categories:
+        del cls._type_indicators_cache[cache_key]
+
   @classmethod
   def _GetSignatureScanner(cls, specification_store):
     """Initializes a signature scanner based on a specification store.
@@ -161,11 +173,17 @@ class Analyzer(object):
 
   @classmethod
   def _GetTypeIndicators(
-      cls, signature_scanner, specification_store, remainder_list, path_spec,
-      resolver_context=None):
+      cls, format_category, signature_scanner, specification_store,
+      remainder_list, path_spec, resolver_context=None):
     """Determines if a file contains a supported format types.
 
+    The type indicators are cached per format category, path specification
+    and file size, so that analyzing the same file again, for example when
+    a source is rescanned after unlocking an encrypted volume, does not
+    require the file to be scanned again.
+
     Args:
+      format_category (str): format category.
       signature_scanner (pysigscan.scanner): signature scanner.
       specification_store (FormatSpecificationStore): specification store.
       remainder_list (list[AnalyzerHelper]): remaining analyzer helpers that
@@ -181,9 +199,16 @@ class Analyzer(object):
 
     file_object = resolver.Resolver.OpenFileObject(
         path_spec, resolver_context=resolver_context)
-    scan_state = pysigscan.scan_state()
 
     try:
+      cache_key = (
+          format_category, path_spec.comparable, file_object.get_size())
+      cached_type_indicators = cls._type_indicators_cache.pop(cache_key, None)
+      if cached_type_indicators is not None:
+        cls._type_indicators_cache[cache_key] = cached_type_indicators
+        return list(cached_type_indicators)
+
+      scan_state = pysigscan.scan_state()
       signature_scanner.scan_file_object(scan_state, file_object)
 
       for scan_result in iter(scan_state.scan_results):
@@ -202,6 +227,12 @@ class Analyzer(object):
     finally:
       file_object.close()
 
+    if len(cls._type_indicators_cache) >= (
+        cls._MAXIMUM_NUMBER_OF_CACHED_TYPE_INDICATORS):
+      cls._type_indicators_cache.popitem(last=False)
+
+    cls._type_indicators_cache[cache_key] = tuple(type_indicator_list)
+
     return type_indicator_list
 
   @classmethod
@@ -249,8 +280,8 @@ class Analyzer(object):
       cls._archive_scanner = cls._GetSignatureScanner(cls._archive_store)
 
     return cls._GetTypeIndicators(
-        cls._archive_scanner, cls._archive_store,
-        cls._archive_remainder_list, path_spec,
+        definitions.FORMAT_CATEGORY_ARCHIVE, cls._archive_scanner,
+        cls._archive_store, cls._archive_remainder_list, path_spec,
         resolver_context=resolver_context)
 
   @classmethod
@@ -277,6 +308,7 @@ class Analyzer(object):
           cls._compressed_stream_store)
 
     return cls._GetTypeIndicators(
+        definitions.FORMAT_CATEGORY_COMPRESSED_STREAM,
         cls._compressed_stream_scanner, cls._compressed_stream_store,
         cls._compressed_stream_remainder_list, path_spec,
         resolver_context=resolver_context)
@@ -305,8 +337,8 @@ class Analyzer(object):
           cls._file_system_store)
 
     return cls._GetTypeIndicators(
-        cls._file_system_scanner, cls._file_system_store,
-        cls._file_system_remainder_list, path_spec,
+        definitions.FORMAT_CATEGORY_FILE_SYSTEM, cls._file_system_scanner,
+        cls._file_system_store, cls._file_system_remainder_list, path_spec,
         resolver_context=resolver_context)
 
   @classmethod
@@ -333,6 +365,7 @@ class Analyzer(object):
           cls._storage_media_image_store)
 
     return cls._GetTypeIndicators(
+        definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE,
         cls._storage_media_image_scanner, cls._storage_media_image_store,
         cls._storage_media_image_remainder_list, path_spec,
         resolver_context=resolver_context)
@@ -361,8 +394,8 @@ class Analyzer(object):
           cls._volume_system_store)
 
     return cls._GetTypeIndicators(
-        cls._volume_system_scanner, cls._volume_system_store,
-        cls._volume_system_remainder_list, path_spec,
+        definitions.FORMAT_CATEGORY_VOLUME_SYSTEM, cls._volume_system_scanner,
+        cls._volume_system_store, cls._volume_system_remainder_list, path_spec,
         resolver_context=resolver_context)
 
   @classmethod
@@ -11,6 +11,18 @@ class Decompressor(object):
 
   # pylint: disable=redundant-returns-doc
 
+  def CopyState(self):
+    """Copies the decompressor and its decompression state.
+
+    The copy can be used to resume decompression from the current position
+    in the compressed data, for example after a seek.
+
+    Returns:
+      Decompressor: copy of the decompressor or None if the decompressor does
+          not support copying its decompression state.
+    """
+    return None
+
   @abc.abstractmethod
   def Decompress(self, compressed_data):
     """Decompresses the compressed data.
@@ -10,11 +10,13 @@ from dfvfs.encryption import manager
 from dfvfs.lib import definitions
 
 
-class AESDecrypter(decrypter.Decrypter):
+class AESDecrypter(decrypter.BlockCipherDecrypter):
   """AES decrypter using pycrypto."""
 
   ENCRYPTION_METHOD = definitions.ENCRYPTION_METHOD_AES
 
+  _CIPHER_MODULE = AES
+
   ENCRYPTION_MODES = {
       definitions.ENCRYPTION_MODE_CBC : AES.MODE_CBC,
       definitions.ENCRYPTION_MODE_CFB : AES.MODE_CFB,
@@ -48,6 +50,10 @@ class AESDecrypter(decrypter.Decrypter):
       raise ValueError('Missing initialization vector.')
 
     super(AESDecrypter, self).__init__()
+    self._cipher_mode = cipher_mode
+    self._initialization_vector = initialization_vector
+    self._key = key
+
     if cipher_mode == AES.MODE_ECB:
       self._aes_cipher = AES.new(key, mode=cipher_mode)
     else:
@@ -24,6 +24,11 @@ class Decrypter(object):
 
     super(Decrypter, self).__init__()
 
+  @property
+  def random_access_block_size(self):
+    """int: block size of random-access decryption or None if not supported."""
+    return None
+
   # pylint: disable=redundant-returns-doc
   @abc.abstractmethod
   def Decrypt(self, encrypted_data):
@@ -35,3 +40,80 @@ class Decrypter(object):
     Returns:
       tuple[bytes, bytes]: decrypted data and remaining encrypted data.
     """
+
+
+class BlockCipherDecrypter(Decrypter):
+  """Block cipher decrypter interface.
+
+  In ECB and CBC mode, encrypted blocks can be decrypted independent of the
+  state of the decrypter, since a block only depends on the key and, in CBC
+  mode, the preceding encrypted block. This allows for random-access
+  decryption.
+  """
+
+  # The pycrypto block cipher module, such as Crypto.Cipher.AES, which should
+  # be defined by the subclass.
+  _CIPHER_MODULE = None
+
+  def __init__(self, **kwargs):
+    """Initializes a block cipher decrypter.
+
+    Args:
+      kwargs (dict): keyword arguments depending on the decrypter.
+
+    Raises:
+      ValueError: when there are unused keyword arguments.
+    """
+    super(BlockCipherDecrypter, self).__init__(**kwargs)
+    self._cipher_mode = None
+    self._initialization_vector = None
+    self._key = None
+
+  @property
+  def random_access_block_size(self):
+    """int: block size of random-access decryption or None if not supported."""
+    if self._cipher_mode not in (
+        self._CIPHER_MODULE.MODE_CBC, self._CIPHER_MODULE.MODE_ECB):
+      return None
+
+    return self._CIPHER_MODULE.block_size
+
+  def DecryptBlocks(self, encrypted_data, preceding_encrypted_block=None):
+    """Decrypts encrypted blocks independent of the state of the decrypter.
+
+    Since the state of the decrypter is not changed, this method can be
+    called from multiple threads.
+
+    Args:
+      encrypted_data (bytes): encrypted data, where the size of the data is
+          a multiple of the block size.
+      preceding_encrypted_block (Optional[bytes]): encrypted block that
+          precedes the encrypted data, where None represents the encrypted
+          data is at the start of the encrypted stream.
+
+    Returns:
+      bytes: decrypted data.
+
+    Raises:
+      ValueError: if the cipher mode does not support random-access
+          decryption or the size of the encrypted data is not a multiple of
+          the block size.
+    """
+    block_size = self.random_access_block_size
+    if not block_size:
+      raise ValueError(
+          'Random-access decryption not supported by cipher mode.')
+
+    if len(encrypted_data) % block_size:
+      raise ValueError(
+          'Encrypted data size is not a multiple of the block size.')
+
+    if self._cipher_mode == self._CIPHER_MODULE.MODE_ECB:
+      cipher = self._CIPHER_MODULE.new(self._key, mode=self._cipher_mode)
+    else:
+      initialization_vector = (
+          preceding_encrypted_block or self._initialization_vector)
+      cipher = self._CIPHER_MODULE.new(
+          self._key, IV=initialization_vector, mode=self._cipher_mode)
+
+    return cipher.decrypt(encrypted_data)
@@ -10,11 +10,13 @@ from dfvfs.encryption import manager
 from dfvfs.lib import definitions
 
 
-class DES3Decrypter(decrypter.Decrypter):
+class DES3Decrypter(decrypter.BlockCipherDecrypter):
   """Triple DES decrypter using pycrypto."""
 
   ENCRYPTION_METHOD = definitions.ENCRYPTION_METHOD_DES3
 
+  _CIPHER_MODULE = DES3
+
   ENCRYPTION_MODES = {
       definitions.ENCRYPTION_MODE_CBC : DES3.MODE_CBC,
       definitions.ENCRYPTION_MODE_CFB : DES3.MODE_CFB,
@@ -48,6 +50,10 @@ class DES3Decrypter(decrypter.Decrypter):
       raise ValueError('Missing initialization vector.')
 
     super(DES3Decrypter, self).__init__()
+    self._cipher_mode = cipher_mode
+    self._initialization_vector = initialization_vector
+    self._key = key
+
     if cipher_mode == DES3.MODE_ECB:
       self._des3_cipher = DES3.new(key, mode=cipher_mode)
     else:
@@ -3,6 +3,7 @@
 
 from __future__ import unicode_literals
 
+import bisect
 import os
 
 from dfvfs.compression import manager as compression_manager
@@ -11,12 +12,65 @@ from dfvfs.lib import errors
 from dfvfs.resolver import resolver
 
 
+class CompressedStreamSeekPoint(object):
+  """Compressed stream seek point.
+
+  A seek point allows to resume decompression at a specific offset in the
+  uncompressed stream without decompressing the data that precedes it.
+
+  Attributes:
+    compressed_data (bytes): compressed data that was read but not yet
+        decompressed.
+    compressed_data_offset (int): offset in the compressed stream from which
+        to continue reading compressed data.
+    decompressor (Decompressor): copy of the decompressor with
+        the decompression state at the seek point.
+    uncompressed_data_offset (int): offset in the uncompressed stream of
+        the seek point.
+  """
+
+  def __init__(
+      self, compressed_data, compressed_data_offset, decompressor,
+      uncompressed_data_offset):
+    """Initializes a compressed stream seek point.
+
+    Args:
+      compressed_data (bytes): compressed data that was read but not yet
+          decompressed.
+      compressed_data_offset (int): offset in the compressed stream from which
+          to continue reading compressed data.
+      decompressor (Decompressor): copy of the decompressor with
+          the decompression state at the seek point.
+      uncompressed_data_offset (int): offset in the uncompressed stream of
+          the seek point.
+    """
+    super(CompressedStreamSeekPoint, self).__init__()
+    self.compressed_data = compressed_data
+    self.compressed_data_offset = compressed_data_offset
+    self.decompressor = decompressor
+    self.uncompressed_data_offset = uncompressed_data_offset
+
+
 class CompressedStream(file_io.FileIO):
-  """File-like object of a compressed stream."""
+  """File-like object of a compressed stream.
+
+  When the decompressor supports copying its decompression state, seek points
+  are recorded while the compressed stream is decompressed. Seek points allow
+  subsequent seeks to resume decompression from the nearest preceding seek
+  point instead of from the start of the compressed stream.
+  """
 
   # The size of the compressed data buffer.
   _COMPRESSED_DATA_BUFFER_SIZE = 8 * 1024 * 1024
 
+  # The initial minimum distance, in bytes of uncompressed data, between seek
+  # points.
+  _SEEK_POINT_INTERVAL = 8 * 1024 * 1024
+
+  # The maximum number of seek points, where every seek point holds a copy of
+  # the decompression state.
+  _MAXIMUM_NUMBER_OF_SEEK_POINTS = 64
+
   def __init__(
       self, resolver_context, compression_method=None, file_object=None):
     """Initializes a file-like object.
@@ -42,13 +96,19 @@ class CompressedStream(file_io.FileIO):
     self._file_object = file_object
     self._file_object_set_in_init = bool(file_object)
     self._compressed_data = b''
+    self._compressed_data_offset = 0
     self._current_offset = 0
     self._decompressor = None
     self._realign_offset = True
+    self._seek_point_interval = self._SEEK_POINT_INTERVAL
+    self._seek_points = []
+    self._seek_points_offsets = []
     self._uncompressed_data = b''
     self._uncompressed_data_offset = 0
     self._uncompressed_data_size = 0
+    self._uncompressed_data_stream_offset = 0
     self._uncompressed_stream_size = None
+    self._stream_metadata_identifier = None
 
   def _Close(self):
     """Closes the file-like object.
@@ -64,6 +124,49 @@ class CompressedStream(file_io.FileIO):
     self._compressed_data = b''
     self._uncompressed_data = b''
     self._decompressor = None
+    self._seek_point_interval = self._SEEK_POINT_INTERVAL
+    self._seek_points = []
+    self._seek_points_offsets = []
+    self._stream_metadata_identifier = None
+
+  def _AddSeekPoint(self):
+    """Adds a seek point at the current decompression state if needed.
+
+    A seek point is only added when the decompressor supports copying its
+    decompression state and the last seek point is at least the seek point
+    interval before the current uncompressed data offset.
+
+    When the maximum number of seek points is exceeded, every other seek
+    point is removed and the seek point interval is doubled, so that the
+    seek points remain evenly spread over the uncompressed data.
+    """
+    uncompressed_data_offset = (
+        self._uncompressed_data_stream_offset + self._uncompressed_data_size)
+
+    if self._seek_points_offsets:
+      last_seek_point_offset = self._seek_points_offsets[-1]
+    else:
+      last_seek_point_offset = 0
+
+    if uncompressed_data_offset < (
+        last_seek_point_offset + self._seek_point_interval):
+      return
+
+    decompressor = self._decompressor.CopyState()
+    if not decompressor:
+      return
+
+    seek_point = CompressedStreamSeekPoint(
+        self._compressed_data, self._compressed_data_offset, decompressor,
+        uncompressed_data_offset)
+
+    self._seek_points.append(seek_point)
+    self._seek_points_offsets.append(uncompressed_data_offset)
+
+    if len(self._seek_points) > self._MAXIMUM_NUMBER_OF_SEEK_POINTS:
+      self._seek_points = self._seek_points[1::2]
+      self._seek_points_offsets = self._seek_points_offsets[1::2]
+      self._seek_point_interval *= 2
 
   def _GetDecompressor(self):
     """Retrieves the decompressor.
@@ -74,28 +177,46 @@ class CompressedStream(file_io.FileIO):
     return compression_manager.CompressionManager.GetDecompressor(
         self._compression_method)
 
+  def _GetSeekPoint(self, uncompressed_data_offset):
+    """Retrieves the nearest seek point preceding an uncompressed data offset.
+
+    Args:
+      uncompressed_data_offset (int): uncompressed data offset.
+
+    Returns:
+      CompressedStreamSeekPoint: seek point or None if not available.
+    """
+    seek_point_index = bisect.bisect_right(
+        self._seek_points_offsets, uncompressed_data_offset)
+    if seek_point_index == 0:
+      return None
+
+    return self._seek_points[seek_point_index - 1]
+
   def _GetUncompressedStreamSize(self):
     """Retrieves the uncompressed stream size.
 
     Returns:
       int: uncompressed stream size.
     """
-    self._file_object.seek(0, os.SEEK_SET)
+    self._ResetDecompressionState()
 
-    self._decompressor = self._GetDecompressor()
-    self._uncompressed_data = b''
-
-    compressed_data_offset = 0
     compressed_data_size = self._file_object.get_size()
-    uncompressed_stream_size = 0
 
-    while compressed_data_offset < compressed_data_size:
+    while self._compressed_data_offset < compressed_data_size:
       read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
       if read_count == 0:
         break
 
-      compressed_data_offset += read_count
-      uncompressed_stream_size += self._uncompressed_data_size
+    # Make sure the uncompressed data is realigned before the next read.
+    self._realign_offset = True
+
+    uncompressed_stream_size = (
+        self._uncompressed_data_stream_offset + self._uncompressed_data_size)
+
+    if self._stream_metadata_identifier:
+      self._resolver_context.stream_metadata_cache.SetStreamSize(
+          self._stream_metadata_identifier, uncompressed_stream_size)
 
     return uncompressed_stream_size
 
@@ -130,32 +251,55 @@ class CompressedStream(file_io.FileIO):
       self._file_object = resolver.Resolver.OpenFileObject(
           path_spec.parent, resolver_context=self._resolver_context)
 
+      stream_metadata_cache = self._resolver_context.stream_metadata_cache
+      if stream_metadata_cache:
+        self._stream_metadata_identifier = (
+            stream_metadata_cache.GetStreamIdentifier(
+                path_spec, self._file_object, self._resolver_context))
+
+      if self._stream_metadata_identifier:
+        self._uncompressed_stream_size = stream_metadata_cache.GetStreamSize(
+            self._stream_metadata_identifier)
+
   def _AlignUncompressedDataOffset(self, uncompressed_data_offset):
     """Aligns the compressed file with the uncompressed data offset.
 
+    Decompression is resumed from the current decompression state or from
+    the nearest preceding seek point, whichever is closer to the uncompressed
+    data offset, otherwise it is restarted from the start of the compressed
+    stream.
+
     Args:
       uncompressed_data_offset (int): uncompressed data offset.
     """
-    self._file_object.seek(0, os.SEEK_SET)
+    seek_point = self._GetSeekPoint(uncompressed_data_offset)
 
-    self._decompressor = self._GetDecompressor()
-    self._uncompressed_data = b''
+    if seek_point:
+      seek_point_offset = seek_point.uncompressed_data_offset
+    else:
+      seek_point_offset = 0
+
+    if (not self._decompressor or
+        uncompressed_data_offset < self._uncompressed_data_stream_offset or
+        seek_point_offset > self._uncompressed_data_stream_offset):
+      if seek_point:
+        self._RestoreSeekPoint(seek_point)
+      else:
+        self._ResetDecompressionState()
 
-    compressed_data_offset = 0
     compressed_data_size = self._file_object.get_size()
 
-    while compressed_data_offset < compressed_data_size:
-      read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
-      if read_count == 0:
+    while uncompressed_data_offset >= (
+        self._uncompressed_data_stream_offset + self._uncompressed_data_size):
+      if self._compressed_data_offset >= compressed_data_size:
         break
 
-      compressed_data_offset += read_count
-
-      if uncompressed_data_offset < self._uncompressed_data_size:
-        self._uncompressed_data_offset = uncompressed_data_offset
+      read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
+      if read_count == 0:
         break
 
-      uncompressed_data_offset -= self._uncompressed_data_size
+    self._uncompressed_data_offset = (
+        uncompressed_data_offset - self._uncompressed_data_stream_offset)
 
   def _ReadCompressedData(self, read_size):
     """Reads compressed data from the file-like object.
@@ -166,10 +310,15 @@ class CompressedStream(file_io.FileIO):
     Returns:
       int: number of bytes of compressed data read.
     """
+    self._AddSeekPoint()
+
     compressed_data = self._file_object.read(read_size)
 
     read_count = len(compressed_data)
 
+    self._compressed_data_offset += read_count
+    self._uncompressed_data_stream_offset += self._uncompressed_data_size
+
     self._compressed_data = b''.join([self._compressed_data, compressed_data])
 
     self._uncompressed_data, self._compressed_data = (
@@ -179,26 +328,18 @@ class CompressedStream(file_io.FileIO):
 
     return read_count
 
-  # Note: that the following functions do not follow the style guide
-  # because they are part of the file-like object interface.
-  # pylint: disable=invalid-name
-
-  def read(self, size=None):
-    """Reads a byte string from the file-like object at the current offset.
-
-    The function will read a byte string of the specified size or
-    all of the remaining data if no size was specified.
-
-    Args:
-      size (Optional[int]): number of bytes to read, where None is all
-          remaining data.
+  def _PrepareRead(self):
+    """Prepares a read at the current offset.
 
     Returns:
-      bytes: data read.
+      int: number of bytes of uncompressed data remaining from the current
+          offset.
 
     Raises:
-      IOError: if the read failed.
-      OSError: if the read failed.
+      IOError: if the file-like object has not been opened or the current
+          offset is invalid.
+      OSError: if the file-like object has not been opened or the current
+          offset is invalid.
     """
     if not self._is_open:
       raise IOError('Not opened.')
@@ -215,53 +356,145 @@ class CompressedStream(file_io.FileIO):
       raise IOError('Invalid uncompressed stream size.')
 
     if self._current_offset >= self._uncompressed_stream_size:
-      return b''
+      return 0
 
     if self._realign_offset:
       self._AlignUncompressedDataOffset(self._current_offset)
       self._realign_offset = False
 
-    if size is None:
-      size = self._uncompressed_stream_size
-    if self._current_offset + size > self._uncompressed_stream_size:
-      size = self._uncompressed_stream_size - self._current_offset
+    return self._uncompressed_stream_size - self._current_offset
 
-    uncompressed_data = b''
+  def _ReadUncompressedData(self, buffer_view):
+    """Reads uncompressed data at the current offset into a buffer.
 
-    if size == 0:
-      return uncompressed_data
+    Args:
+      buffer_view (memoryview): buffer to read the uncompressed data into.
 
-    while size > self._uncompressed_data_size:
-      uncompressed_data = b''.join([
-          uncompressed_data,
-          self._uncompressed_data[self._uncompressed_data_offset:]])
+    Returns:
+      int: number of bytes read.
+    """
+    buffer_size = len(buffer_view)
+    buffer_offset = 0
 
-      remaining_uncompressed_data_size = (
+    while buffer_offset < buffer_size:
+      available_size = (
           self._uncompressed_data_size - self._uncompressed_data_offset)
+      if available_size <= 0:
+        if self._current_offset >= self._uncompressed_stream_size:
+          break
 
-      self._current_offset += remaining_uncompressed_data_size
-      size -= remaining_uncompressed_data_size
+        read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
+        self._uncompressed_data_offset = 0
+        if read_count == 0 and self._uncompressed_data_size == 0:
+          break
 
-      if self._current_offset >= self._uncompressed_stream_size:
-        break
+        continue
 
-      read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
-      self._uncompressed_data_offset = 0
-      if read_count == 0:
-        break
+      copy_size = min(available_size, buffer_size - buffer_offset)
+      data_start_offset = self._uncompressed_data_offset
+      data_end_offset = data_start_offset + copy_size
+
+      # A memoryview is used to copy the data without an intermediate copy.
+      buffer_view[buffer_offset:buffer_offset + copy_size] = memoryview(
+          self._uncompressed_data)[data_start_offset:data_end_offset]
+
+      buffer_offset += copy_size
+      self._uncompressed_data_offset += copy_size
+      self._current_offset += copy_size
+
+    return buffer_offset
+
+  def _ResetDecompressionState(self):
+    """Resets the decompression state to the start of the compressed stream."""
+    self._file_object.seek(0, os.SEEK_SET)
+
+    self._compressed_data = b''
+    self._compressed_data_offset = 0
+    self._decompressor = self._GetDecompressor()
+    self._uncompressed_data = b''
+    self._uncompressed_data_offset = 0
+    self._uncompressed_data_size = 0
+    self._uncompressed_data_stream_offset = 0
+
+  def _RestoreSeekPoint(self, seek_point):
+    """Restores the decompression state of a seek point.
+
+    Args:
+      seek_point (CompressedStreamSeekPoint): seek point.
+    """
+    self._file_object.seek(seek_point.compressed_data_offset, os.SEEK_SET)
+
+    # A copy of the decompressor is used so the seek point can be reused.
+    self._compressed_data = seek_point.compressed_data
+    self._compressed_data_offset = seek_point.compressed_data_offset
+    self._decompressor = seek_point.decompressor.CopyState()
+    self._uncompressed_data = b''
+    self._uncompressed_data_offset = 0
+    self._uncompressed_data_size = 0
+    self._uncompressed_data_stream_offset = seek_point.uncompressed_data_offset
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+  # pylint: disable=invalid-name
 
-    if size > 0:
-      slice_start_offset = self._uncompressed_data_offset
-      slice_end_offset = slice_start_offset + size
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+    The function will read a byte string of the specified size or
+    all of the remaining data if no size was specified.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None is all
+          remaining data.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    remaining_size = self._PrepareRead()
+
+    if size is None or size > remaining_size:
+      size = remaining_size
+
+    if size <= 0:
+      return b''
+
+    uncompressed_data = bytearray(size)
+    read_count = self._ReadUncompressedData(memoryview(uncompressed_data))
+    if read_count < size:
+      del uncompressed_data[read_count:]
+
+    return bytes(uncompressed_data)
+
+  def readinto(self, buffer_object):
+    """Reads data from the file-like object at the current offset into a buffer.
+
+    Args:
+      buffer_object (bytearray|memoryview): pre-allocated writable buffer,
+          where the size of the buffer is the number of bytes to read.
+
+    Returns:
+      int: number of bytes read into the buffer, where 0 indicates the end
+          of the stream.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    remaining_size = self._PrepareRead()
 
-      uncompressed_data = b''.join([
-          uncompressed_data,
-          self._uncompressed_data[slice_start_offset:slice_end_offset]])
+    buffer_view = memoryview(buffer_object)
+    read_size = min(len(buffer_view), remaining_size)
+    if read_size <= 0:
+      return 0
 
-      self._uncompressed_data_offset += size
-      self._current_offset += size
+    if read_size < len(buffer_view):
+      buffer_view = buffer_view[:read_size]
 
-    return uncompressed_data
+    return self._ReadUncompressedData(buffer_view)
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
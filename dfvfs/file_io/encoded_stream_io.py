@@ -42,6 +42,7 @@ class EncodedStream(file_io.FileIO):
     self._decoded_data_offset = 0
     self._decoded_data_size = 0
     self._decoded_stream_size = None
+    self._stream_metadata_identifier = None
     self._decoder = None
     self._encoded_data = b''
     self._encoding_method = encoding_method
@@ -63,6 +64,7 @@ class EncodedStream(file_io.FileIO):
     self._decoder = None
     self._decoded_data = b''
     self._encoded_data = b''
+    self._stream_metadata_identifier = None
 
   def _GetDecoder(self):
     """Retrieves the decoder.
@@ -95,6 +97,10 @@ class EncodedStream(file_io.FileIO):
       encoded_data_offset += read_count
       decoded_stream_size += self._decoded_data_size
 
+    if self._stream_metadata_identifier:
+      self._resolver_context.stream_metadata_cache.SetStreamSize(
+          self._stream_metadata_identifier, decoded_stream_size)
+
     return decoded_stream_size
 
   def _Open(self, path_spec=None, mode='rb'):
@@ -128,6 +134,16 @@ class EncodedStream(file_io.FileIO):
       self._file_object = resolver.Resolver.OpenFileObject(
           path_spec.parent, resolver_context=self._resolver_context)
 
+      stream_metadata_cache = self._resolver_context.stream_metadata_cache
+      if stream_metadata_cache:
+        self._stream_metadata_identifier = (
+            stream_metadata_cache.GetStreamIdentifier(
+                path_spec, self._file_object, self._resolver_context))
+
+      if self._stream_metadata_identifier:
+        self._decoded_stream_size = stream_metadata_cache.GetStreamSize(
+            self._stream_metadata_identifier)
+
   def _AlignDecodedDataOffset(self, decoded_data_offset):
     """Aligns the encoded file with the decoded data offset.
 
@@ -155,6 +171,80 @@ class EncodedStream(file_io.FileIO):
 
       decoded_data_offset -= self._decoded_data_size
 
+  def _PrepareRead(self):
+    """Prepares a read at the current offset.
+
+    Returns:
+      int: number of bytes of decoded data remaining from the current offset.
+
+    Raises:
+      IOError: if the file-like object has not been opened or the current
+          offset is invalid.
+      OSError: if the file-like object has not been opened or the current
+          offset is invalid.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if self._current_offset < 0:
+      raise IOError(
+          'Invalid current offset: {0:d} value less than zero.'.format(
+              self._current_offset))
+
+    if self._decoded_stream_size is None:
+      self._decoded_stream_size = self._GetDecodedStreamSize()
+
+    if self._decoded_stream_size < 0:
+      raise IOError('Invalid decoded stream size.')
+
+    if self._current_offset >= self._decoded_stream_size:
+      return 0
+
+    if self._realign_offset:
+      self._AlignDecodedDataOffset(self._current_offset)
+      self._realign_offset = False
+
+    return self._decoded_stream_size - self._current_offset
+
+  def _ReadDecodedData(self, buffer_view):
+    """Reads decoded data at the current offset into a buffer.
+
+    Args:
+      buffer_view (memoryview): buffer to read the decoded data into.
+
+    Returns:
+      int: number of bytes read.
+    """
+    buffer_size = len(buffer_view)
+    buffer_offset = 0
+
+    while buffer_offset < buffer_size:
+      available_size = self._decoded_data_size - self._decoded_data_offset
+      if available_size <= 0:
+        if self._current_offset >= self._decoded_stream_size:
+          break
+
+        read_count = self._ReadEncodedData(self._ENCODED_DATA_BUFFER_SIZE)
+        self._decoded_data_offset = 0
+        if read_count == 0 and self._decoded_data_size == 0:
+          break
+
+        continue
+
+      copy_size = min(available_size, buffer_size - buffer_offset)
+      data_start_offset = self._decoded_data_offset
+      data_end_offset = data_start_offset + copy_size
+
+      # A memoryview is used to copy the data without an intermediate copy.
+      buffer_view[buffer_offset:buffer_offset + copy_size] = memoryview(
+          self._decoded_data)[data_start_offset:data_end_offset]
+
+      buffer_offset += copy_size
+      self._decoded_data_offset += copy_size
+      self._current_offset += copy_size
+
+    return buffer_offset
+
   def _ReadEncodedData(self, read_size):
     """Reads encoded data from the file-like object.
 
@@ -222,68 +312,47 @@ class EncodedStream(file_io.FileIO):
       IOError: if the read failed.
       OSError: if the read failed.
     """
-    if not self._is_open:
-      raise IOError('Not opened.')
-
-    if self._current_offset < 0:
-      raise IOError(
-          'Invalid current offset: {0:d} value less than zero.'.format(
-              self._current_offset))
+    remaining_size = self._PrepareRead()
 
-    if self._decoded_stream_size is None:
-      self._decoded_stream_size = self._GetDecodedStreamSize()
-
-    if self._decoded_stream_size < 0:
-      raise IOError('Invalid decoded stream size.')
+    if size is None or size > remaining_size:
+      size = remaining_size
 
-    if self._current_offset >= self._decoded_stream_size:
+    if size <= 0:
       return b''
 
-    if self._realign_offset:
-      self._AlignDecodedDataOffset(self._current_offset)
-      self._realign_offset = False
-
-    if size is None:
-      size = self._decoded_stream_size
-    if self._current_offset + size > self._decoded_stream_size:
-      size = self._decoded_stream_size - self._current_offset
+    decoded_data = bytearray(size)
+    read_count = self._ReadDecodedData(memoryview(decoded_data))
+    if read_count < size:
+      del decoded_data[read_count:]
 
-    decoded_data = b''
+    return bytes(decoded_data)
 
-    if size == 0:
-      return decoded_data
+  def readinto(self, buffer_object):
+    """Reads data from the file-like object at the current offset into a buffer.
 
-    while size > self._decoded_data_size:
-      decoded_data = b''.join([
-          decoded_data,
-          self._decoded_data[self._decoded_data_offset:]])
-
-      remaining_decoded_data_size = (
-          self._decoded_data_size - self._decoded_data_offset)
-
-      self._current_offset += remaining_decoded_data_size
-      size -= remaining_decoded_data_size
-
-      if self._current_offset >= self._decoded_stream_size:
-        break
+    Args:
+      buffer_object (bytearray|memoryview): pre-allocated writable buffer,
+          where the size of the buffer is the number of bytes to read.
 
-      read_count = self._ReadEncodedData(self._ENCODED_DATA_BUFFER_SIZE)
-      self._decoded_data_offset = 0
-      if read_count == 0:
-        break
+    Returns:
+      int: number of bytes read into the buffer, where 0 indicates the end
+          of the stream.
 
-    if size > 0:
-      slice_start_offset = self._decoded_data_offset
-      slice_end_offset = slice_start_offset + size
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    remaining_size = self._PrepareRead()
 
-      decoded_data = b''.join([
-          decoded_data,
-          self._decoded_data[slice_start_offset:slice_end_offset]])
+    buffer_view = memoryview(buffer_object)
+    read_size = min(len(buffer_view), remaining_size)
+    if read_size <= 0:
+      return 0
 
-      self._decoded_data_offset += size
-      self._current_offset += size
+    if read_size < len(buffer_view):
+      buffer_view = buffer_view[:read_size]
 
-    return decoded_data
+    return self._ReadDecodedData(buffer_view)
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
@@ -5,6 +5,8 @@ from __future__ import unicode_literals
 
 import os
 
+from multiprocessing import pool
+
 from dfvfs.encryption import manager as encryption_manager
 from dfvfs.file_io import file_io
 from dfvfs.lib import errors
@@ -12,11 +14,24 @@ from dfvfs.resolver import resolver
 
 
 class EncryptedStream(file_io.FileIO):
-  """File-like object of a encrypted stream."""
+  """File-like object of a encrypted stream.
+
+  If the decrypter supports random-access decryption, such as AES and triple
+  DES in ECB or CBC mode, seeking does not require the stream to be decrypted
+  from the start and large reads can be decrypted by a pool of worker threads.
+  """
 
   # The size of the encrypted data buffer.
   _ENCRYPTED_DATA_BUFFER_SIZE = 8 * 1024 * 1024
 
+  # The minimum size of the encrypted data buffer when the decrypter supports
+  # random-access decryption.
+  _RANDOM_ACCESS_DATA_BUFFER_SIZE = 64 * 1024
+
+  # The size of the encrypted data decrypted per worker thread, which must be
+  # a multiple of the block size of the decrypter.
+  _THREADED_DECRYPTION_DATA_SIZE = 1024 * 1024
+
   def __init__(
       self, resolver_context, encryption_method=None, file_object=None):
     """Initializes a file-like object.
@@ -42,13 +57,17 @@ class EncryptedStream(file_io.FileIO):
     self._decrypted_data_offset = 0
     self._decrypted_data_size = 0
     self._decrypted_stream_size = None
+    self._stream_metadata_identifier = None
     self._decrypter = None
     self._encrypted_data = b''
     self._encryption_method = encryption_method
     self._file_object = file_object
     self._file_object_set_in_init = bool(file_object)
     self._path_spec = None
+    self._preceding_encrypted_block = None
+    self._random_access_block_size = None
     self._realign_offset = True
+    self._thread_pool = None
 
   def _Close(self):
     """Closes the file-like object.
@@ -61,9 +80,70 @@ class EncryptedStream(file_io.FileIO):
       self._file_object.close()
       self._file_object = None
 
+    if self._thread_pool:
+      self._thread_pool.close()
+      self._thread_pool.join()
+      self._thread_pool = None
+
     self._decrypter = None
     self._decrypted_data = b''
     self._encrypted_data = b''
+    self._preceding_encrypted_block = None
+    self._random_access_block_size = None
+    self._stream_metadata_identifier = None
+
+  def _DecryptBlocks(self, encrypted_data):
+    """Decrypts encrypted data with random-access decryption.
+
+    Args:
+      encrypted_data (bytes): encrypted data.
+
+    Returns:
+      tuple[bytes, bytes]: decrypted data and remaining encrypted data.
+    """
+    block_size = self._random_access_block_size
+
+    encrypted_data_size = len(encrypted_data)
+    encrypted_data_size -= encrypted_data_size % block_size
+
+    remaining_encrypted_data = encrypted_data[encrypted_data_size:]
+    encrypted_data = encrypted_data[:encrypted_data_size]
+
+    if not encrypted_data_size:
+      return b'', remaining_encrypted_data
+
+    number_of_threads = (
+        self._resolver_context.maximum_number_of_decryption_threads or 0)
+    data_size = self._THREADED_DECRYPTION_DATA_SIZE
+
+    if number_of_threads <= 0 or encrypted_data_size < 2 * data_size:
+      decrypted_data = self._decrypter.DecryptBlocks(
+          encrypted_data, self._preceding_encrypted_block)
+
+    else:
+      if not self._thread_pool:
+        self._thread_pool = pool.ThreadPool(processes=number_of_threads)
+
+      decryption_results = []
+      for data_offset in range(0, encrypted_data_size, data_size):
+        if data_offset == 0:
+          preceding_encrypted_block = self._preceding_encrypted_block
+        else:
+          preceding_encrypted_block = encrypted_data[
+              data_offset - block_size:data_offset]
+
+        decryption_result = self._thread_pool.apply_async(
+            self._decrypter.DecryptBlocks, (
+                encrypted_data[data_offset:data_offset + data_size],
+                preceding_encrypted_block))
+        decryption_results.append(decryption_result)
+
+      decrypted_data = b''.join([
+          decryption_result.get() for decryption_result in decryption_results])
+
+    self._preceding_encrypted_block = encrypted_data[-block_size:]
+
+    return decrypted_data, remaining_encrypted_data
 
   def _GetDecrypter(self):
     """Retrieves a decrypter.
@@ -90,13 +170,21 @@ class EncryptedStream(file_io.FileIO):
     Returns:
       int: decrypted stream size.
     """
-    self._file_object.seek(0, os.SEEK_SET)
+    self._SetDecrypter()
 
-    self._decrypter = self._GetDecrypter()
-    self._decrypted_data = b''
+    # The decryption state was reset, hence the offset needs to be realigned.
+    self._realign_offset = True
 
-    encrypted_data_offset = 0
     encrypted_data_size = self._file_object.get_size()
+
+    if self._random_access_block_size:
+      # The decrypted data only consists of complete blocks.
+      return encrypted_data_size - (
+          encrypted_data_size % self._random_access_block_size)
+
+    self._file_object.seek(0, os.SEEK_SET)
+
+    encrypted_data_offset = 0
     decrypted_stream_size = 0
 
     while encrypted_data_offset < encrypted_data_size:
@@ -107,6 +195,10 @@ class EncryptedStream(file_io.FileIO):
       encrypted_data_offset += read_count
       decrypted_stream_size += self._decrypted_data_size
 
+    if self._stream_metadata_identifier:
+      self._resolver_context.stream_metadata_cache.SetStreamSize(
+          self._stream_metadata_identifier, decrypted_stream_size)
+
     return decrypted_stream_size
 
   def _Open(self, path_spec=None, mode='rb'):
@@ -140,6 +232,17 @@ class EncryptedStream(file_io.FileIO):
       self._file_object = resolver.Resolver.OpenFileObject(
           path_spec.parent, resolver_context=self._resolver_context)
 
+      stream_metadata_cache = self._resolver_context.stream_metadata_cache
+      if stream_metadata_cache:
+        self._stream_metadata_identifier = (
+            stream_metadata_cache.GetStreamIdentifier(
+                path_spec, self._file_object, self._resolver_context))
+
+      if (self._stream_metadata_identifier and
+          self._decrypted_stream_size is None):
+        self._decrypted_stream_size = stream_metadata_cache.GetStreamSize(
+            self._stream_metadata_identifier)
+
     self._path_spec = path_spec
 
   def _AlignDecryptedDataOffset(self, decrypted_data_offset):
@@ -148,10 +251,25 @@ class EncryptedStream(file_io.FileIO):
     Args:
       decrypted_data_offset (int): decrypted data offset.
     """
-    self._file_object.seek(0, os.SEEK_SET)
+    self._SetDecrypter()
 
-    self._decrypter = self._GetDecrypter()
-    self._decrypted_data = b''
+    if self._random_access_block_size:
+      block_size = self._random_access_block_size
+      encrypted_data_offset = decrypted_data_offset - (
+          decrypted_data_offset % block_size)
+
+      if encrypted_data_offset > 0:
+        self._file_object.seek(encrypted_data_offset - block_size, os.SEEK_SET)
+        self._preceding_encrypted_block = self._file_object.read(block_size)
+
+      self._file_object.seek(encrypted_data_offset, os.SEEK_SET)
+
+      self._ReadEncryptedData(self._RANDOM_ACCESS_DATA_BUFFER_SIZE)
+      self._decrypted_data_offset = (
+          decrypted_data_offset - encrypted_data_offset)
+      return
+
+    self._file_object.seek(0, os.SEEK_SET)
 
     encrypted_data_offset = 0
     encrypted_data_size = self._file_object.get_size()
@@ -169,6 +287,99 @@ class EncryptedStream(file_io.FileIO):
 
       decrypted_data_offset -= self._decrypted_data_size
 
+  def _GetEncryptedDataReadSize(self, size):
+    """Determines the size of the encrypted data to read.
+
+    Args:
+      size (int): number of bytes of decrypted data that remain to be read.
+
+    Returns:
+      int: number of bytes of encrypted data to read.
+    """
+    if not self._random_access_block_size:
+      return self._ENCRYPTED_DATA_BUFFER_SIZE
+
+    # With random-access decryption seeks are cheap, hence only the data that
+    # is read is decrypted.
+    return min(
+        max(size, self._RANDOM_ACCESS_DATA_BUFFER_SIZE),
+        self._ENCRYPTED_DATA_BUFFER_SIZE)
+
+  def _PrepareRead(self):
+    """Prepares a read at the current offset.
+
+    Returns:
+      int: number of bytes of decrypted data remaining from the current offset.
+
+    Raises:
+      IOError: if the file-like object has not been opened or the current
+          offset is invalid.
+      OSError: if the file-like object has not been opened or the current
+          offset is invalid.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if self._current_offset < 0:
+      raise IOError(
+          'Invalid current offset: {0:d} value less than zero.'.format(
+              self._current_offset))
+
+    if self._decrypted_stream_size is None:
+      self._decrypted_stream_size = self._GetDecryptedStreamSize()
+
+    if self._decrypted_stream_size < 0:
+      raise IOError('Invalid decrypted stream size.')
+
+    if self._current_offset >= self._decrypted_stream_size:
+      return 0
+
+    if self._realign_offset:
+      self._AlignDecryptedDataOffset(self._current_offset)
+      self._realign_offset = False
+
+    return self._decrypted_stream_size - self._current_offset
+
+  def _ReadDecryptedData(self, buffer_view):
+    """Reads decrypted data at the current offset into a buffer.
+
+    Args:
+      buffer_view (memoryview): buffer to read the decrypted data into.
+
+    Returns:
+      int: number of bytes read.
+    """
+    buffer_size = len(buffer_view)
+    buffer_offset = 0
+
+    while buffer_offset < buffer_size:
+      available_size = self._decrypted_data_size - self._decrypted_data_offset
+      if available_size <= 0:
+        if self._current_offset >= self._decrypted_stream_size:
+          break
+
+        read_size = self._GetEncryptedDataReadSize(buffer_size - buffer_offset)
+        read_count = self._ReadEncryptedData(read_size)
+        self._decrypted_data_offset = 0
+        if read_count == 0 and self._decrypted_data_size == 0:
+          break
+
+        continue
+
+      copy_size = min(available_size, buffer_size - buffer_offset)
+      data_start_offset = self._decrypted_data_offset
+      data_end_offset = data_start_offset + copy_size
+
+      # A memoryview is used to copy the data without an intermediate copy.
+      buffer_view[buffer_offset:buffer_offset + copy_size] = memoryview(
+          self._decrypted_data)[data_start_offset:data_end_offset]
+
+      buffer_offset += copy_size
+      self._decrypted_data_offset += copy_size
+      self._current_offset += copy_size
+
+    return buffer_offset
+
   def _ReadEncryptedData(self, read_size):
     """Reads encrypted data from the file-like object.
 
@@ -184,13 +395,32 @@ class EncryptedStream(file_io.FileIO):
 
     self._encrypted_data = b''.join([self._encrypted_data, encrypted_data])
 
-    self._decrypted_data, self._encrypted_data = (
-        self._decrypter.Decrypt(self._encrypted_data))
+    if self._random_access_block_size:
+      self._decrypted_data, self._encrypted_data = self._DecryptBlocks(
+          self._encrypted_data)
+    else:
+      self._decrypted_data, self._encrypted_data = (
+          self._decrypter.Decrypt(self._encrypted_data))
 
     self._decrypted_data_size = len(self._decrypted_data)
 
     return read_count
 
+  def _SetDecrypter(self):
+    """Sets a new decrypter and resets the decryption state.
+
+    Raises:
+      IOError: if the decrypter cannot be initialized.
+      OSError: if the decrypter cannot be initialized.
+    """
+    self._decrypter = self._GetDecrypter()
+    self._decrypted_data = b''
+    self._decrypted_data_offset = 0
+    self._decrypted_data_size = 0
+    self._encrypted_data = b''
+    self._preceding_encrypted_block = None
+    self._random_access_block_size = self._decrypter.random_access_block_size
+
   def SetDecryptedStreamSize(self, decrypted_stream_size):
     """Sets the decrypted stream size.
 
@@ -236,68 +466,47 @@ class EncryptedStream(file_io.FileIO):
       IOError: if the read failed.
       OSError: if the read failed.
     """
-    if not self._is_open:
-      raise IOError('Not opened.')
+    remaining_size = self._PrepareRead()
 
-    if self._current_offset < 0:
-      raise IOError(
-          'Invalid current offset: {0:d} value less than zero.'.format(
-              self._current_offset))
+    if size is None or size > remaining_size:
+      size = remaining_size
 
-    if self._decrypted_stream_size is None:
-      self._decrypted_stream_size = self._GetDecryptedStreamSize()
-
-    if self._decrypted_stream_size < 0:
-      raise IOError('Invalid decrypted stream size.')
-
-    if self._current_offset >= self._decrypted_stream_size:
+    if size <= 0:
       return b''
 
-    if self._realign_offset:
-      self._AlignDecryptedDataOffset(self._current_offset)
-      self._realign_offset = False
+    decrypted_data = bytearray(size)
+    read_count = self._ReadDecryptedData(memoryview(decrypted_data))
+    if read_count < size:
+      del decrypted_data[read_count:]
 
-    if size is None:
-      size = self._decrypted_stream_size
-    if self._current_offset + size > self._decrypted_stream_size:
-      size = self._decrypted_stream_size - self._current_offset
+    return bytes(decrypted_data)
 
-    decrypted_data = b''
+  def readinto(self, buffer_object):
+    """Reads data from the file-like object at the current offset into a buffer.
 
-    if size == 0:
-      return decrypted_data
-
-    while size > self._decrypted_data_size:
-      decrypted_data = b''.join([
-          decrypted_data,
-          self._decrypted_data[self._decrypted_data_offset:]])
-
-      remaining_decrypted_data_size = (
-          self._decrypted_data_size - self._decrypted_data_offset)
-
-      self._current_offset += remaining_decrypted_data_size
-      size -= remaining_decrypted_data_size
-
-      if self._current_offset >= self._decrypted_stream_size:
-        break
+    Args:
+      buffer_object (bytearray|memoryview): pre-allocated writable buffer,
+          where the size of the buffer is the number of bytes to read.
 
-      read_count = self._ReadEncryptedData(self._ENCRYPTED_DATA_BUFFER_SIZE)
-      self._decrypted_data_offset = 0
-      if read_count == 0:
-        break
+    Returns:
+      int: number of bytes read into the buffer, where 0 indicates the end
+          of the stream.
 
-    if size > 0:
-      slice_start_offset = self._decrypted_data_offset
-      slice_end_offset = slice_start_offset + size
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    remaining_size = self._PrepareRead()
 
-      decrypted_data = b''.join([
-          decrypted_data,
-          self._decrypted_data[slice_start_offset:slice_end_offset]])
+    buffer_view = memoryview(buffer_object)
+    read_size = min(len(buffer_view), remaining_size)
+    if read_size <= 0:
+      return 0
 
-      self._decrypted_data_offset += size
-      self._current_offset += size
+    if read_size < len(buffer_view):
+      buffer_view = buffer_view[:read_size]
 
-    return decrypted_data
+    return self._ReadDecryptedData(buffer_view)
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
@@ -66,6 +66,14 @@ class FileIO(object):
       PathSpecError: if the path specification is incorrect.
       ValueError: if the path specification or mode is invalid.
     """
+    if self._is_open and self._is_cached and (
+        not path_spec or
+        self._resolver_context.GetFileObject(path_spec) is not self):
+      # The file-like object was closed but kept open by the resolver context
+      # and is now reopened with a different path specification.
+      if not self._resolver_context.EvictFileObject(self):
+        raise IOError('Already open.')
+
     if self._is_open and not self._is_cached:
       raise IOError('Already open.')
 
@@ -80,6 +88,11 @@ class FileIO(object):
         self._resolver_context.CacheFileObject(path_spec, self)
         self._is_cached = True
 
+    elif self._resolver_context.GetFileObjectReferenceCount(path_spec) == 0:
+      # A file-like object kept open by the resolver context is reused and
+      # should behave as if it was newly opened.
+      self.seek(0, os.SEEK_SET)
+
     if self._is_cached:
       self._resolver_context.GrabFileObject(path_spec)
 
@@ -3,12 +3,14 @@
 
 from __future__ import unicode_literals
 
-import collections
+import bisect
+import multiprocessing
 import os
 
 from dfvfs.file_io import file_io
 from dfvfs.lib import errors
 from dfvfs.lib import gzipfile
+from dfvfs.resolver import cache
 from dfvfs.resolver import resolver
 
 
@@ -17,11 +19,26 @@ class GzipFile(file_io.FileIO):
 
   The gzip file format is defined in RFC1952: http://www.zlib.org/rfc-gzip.html
 
+  Small members, such as those of multi-member gzip files created by bgzip,
+  are decompressed ahead of reading by a pool of worker threads, that is
+  shared by the gzip files of the resolver context.
+
   Attributes:
     uncompressed_data_size (int): total size of the decompressed data stored
         in the gzip file.
   """
 
+  # The default maximum size of the uncompressed data cache shared by
+  # the members.
+  _MAXIMUM_CACHE_SIZE = 16 * 1024 * 1024
+
+  # The default maximum number of worker threads used to decompress members.
+  _MAXIMUM_NUMBER_OF_THREADS = 4
+
+  # The maximum uncompressed data size of a member decompressed by a worker
+  # thread. Larger members are decompressed on demand.
+  _MAXIMUM_THREADED_MEMBER_SIZE = 4 * 1024 * 1024
+
   def __init__(self, resolver_context):
     """Initializes a file-like object.
 
@@ -32,10 +49,14 @@ class GzipFile(file_io.FileIO):
       ValueError: when file_object is set.
     """
     super(GzipFile, self).__init__(resolver_context)
+    self._block_cache = None
     self._compressed_data_size = -1
     self._current_offset = 0
+    self._decompression_results = {}
     self._gzip_file_object = None
-    self._members_by_end_offset = collections.OrderedDict()
+    self._members = []
+    self._members_end_offsets = []
+    self._number_of_threads = 0
 
     self.uncompressed_data_size = 0
 
@@ -43,25 +64,68 @@ class GzipFile(file_io.FileIO):
   def original_filenames(self):
     """list(str): The original filenames stored in the gzip file."""
     return [member.original_filename
-            for member in self._members_by_end_offset.values()]
+            for member in self._members]
 
   @property
   def modification_times(self):
     """list(int): The modification times stored in the gzip file."""
     return [member.modification_time
-            for member in self._members_by_end_offset.values()]
+            for member in self._members]
 
   @property
   def operating_systems(self):
     """list(int): The operating system values stored in the gzip file."""
     return [member.operating_system
-            for member in self._members_by_end_offset.values()]
+            for member in self._members]
 
   @property
   def comments(self):
     """list(str): The comments in the gzip file."""
     return [member.comment
-            for member in self._members_by_end_offset.values()]
+            for member in self._members]
+
+  def _DecompressMembers(self, member_index):
+    """Decompresses a member and the members that follow it in worker threads.
+
+    Members that are too large or are already cached are skipped.
+
+    Args:
+      member_index (int): index of the member that is read.
+    """
+    # The thread pool is retrieved every time, since it is terminated when
+    # the resolver context is emptied.
+    thread_pool = self._resolver_context.GetGzipThreadPool(
+        self._number_of_threads)
+
+    last_member_index = min(
+        member_index + (2 * self._number_of_threads), len(self._members))
+
+    # Discard the results of members that are no longer read ahead and of
+    # a thread pool that has been terminated.
+    for index, (result_thread_pool, _) in list(
+        self._decompression_results.items()):
+      if (index < member_index or index >= last_member_index or
+          result_thread_pool is not thread_pool):
+        del self._decompression_results[index]
+
+    for index in range(member_index, last_member_index):
+      member = self._members[index]
+      if (index in self._decompression_results or
+          not member.uncompressed_data_size or
+          member.uncompressed_data_size > self._MAXIMUM_THREADED_MEMBER_SIZE or
+          member.GetCacheSize()):
+        continue
+
+      compressed_data = member.ReadCompressedData()
+      decompression_result = thread_pool.apply_async(
+          gzipfile.GzipMember.DecompressData, (compressed_data, ))
+      self._decompression_results[index] = (thread_pool, decompression_result)
+
+    _, decompression_result = self._decompression_results.pop(
+        member_index, (None, None))
+    if decompression_result:
+      member = self._members[member_index]
+      member.CacheUncompressedData(decompression_result.get())
 
   def _GetMemberForOffset(self, offset):
     """Finds the member whose data includes the provided offset.
@@ -73,6 +137,23 @@ class GzipFile(file_io.FileIO):
     Returns:
       gzipfile.GzipMember: gzip file member or None if not available.
 
+    Raises:
+      ValueError: if the provided offset is outside of the bounds of the
+          uncompressed data.
+    """
+    member_index = self._GetMemberIndexForOffset(offset)
+    return self._members[member_index]
+
+  def _GetMemberIndexForOffset(self, offset):
+    """Finds the index of the member whose data includes the provided offset.
+
+    Args:
+      offset (int): offset in the uncompressed data to find the
+          containing member for.
+
+    Returns:
+      int: index of the gzip file member.
+
     Raises:
       ValueError: if the provided offset is outside of the bounds of the
           uncompressed data.
@@ -81,11 +162,9 @@ class GzipFile(file_io.FileIO):
       raise ValueError('Offset {0:d} is larger than file size {1:d}.'.format(
           offset, self.uncompressed_data_size))
 
-    for end_offset, member in iter(self._members_by_end_offset.items()):
-      if offset < end_offset:
-        return member
-
-    return None
+    # Note that members without uncompressed data have the same end offset
+    # as the preceding member and are skipped.
+    return bisect.bisect_right(self._members_end_offsets, offset)
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
@@ -131,17 +210,31 @@ class GzipFile(file_io.FileIO):
       IOError: if the read failed.
       OSError: if the read failed.
     """
-    data = b''
-    while ((size and len(data) < size) and
+    if not self._gzip_file_object:
+      raise IOError('Not opened.')
+
+    if size is None:
+      size = max(0, self.uncompressed_data_size - self._current_offset)
+
+    data = []
+    data_size = 0
+    while (data_size < size and
            self._current_offset < self.uncompressed_data_size):
-      member = self._GetMemberForOffset(self._current_offset)
+      member_index = self._GetMemberIndexForOffset(self._current_offset)
+      if self._number_of_threads:
+        self._DecompressMembers(member_index)
+
+      member = self._members[member_index]
       member_offset = self._current_offset - member.uncompressed_data_offset
-      data_read = member.ReadAtOffset(member_offset, size)
-      if data_read:
-        self._current_offset += len(data_read)
-        data = b''.join([data, data_read])
+      data_read = member.ReadAtOffset(member_offset, size - data_size)
+      if not data_read:
+        break
+
+      self._current_offset += len(data_read)
+      data_size += len(data_read)
+      data.append(data_read)
 
-    return data
+    return b''.join(data)
 
   def get_offset(self):
     """Retrieves the current offset into the file-like object.
@@ -173,7 +266,16 @@ class GzipFile(file_io.FileIO):
 
   def _Close(self):
     """Closes the file-like object."""
-    self._members_by_end_offset = []
+    # The thread pool is owned by the resolver context. Members that are still
+    # being decompressed ahead of reading are no longer referenced.
+    self._decompression_results = {}
+    self._number_of_threads = 0
+    self._members = []
+    self._members_end_offsets = []
+
+    if self._block_cache:
+      self._block_cache.Empty()
+      self._block_cache = None
     if self._gzip_file_object:
       self._gzip_file_object.close()
 
@@ -204,14 +306,41 @@ class GzipFile(file_io.FileIO):
 
     self._gzip_file_object.seek(0, os.SEEK_SET)
 
+    maximum_cache_size = self._resolver_context.maximum_gzip_cache_size
+    if maximum_cache_size is None:
+      maximum_cache_size = self._MAXIMUM_CACHE_SIZE
+
+    if maximum_cache_size <= 0:
+      raise ValueError('Invalid maximum gzip cache size: {0:d}.'.format(
+          maximum_cache_size))
+
+    self._block_cache = cache.BlocksCache(maximum_cache_size)
+
     uncompressed_data_offset = 0
     next_member_offset = 0
 
     while next_member_offset < file_size:
       member = gzipfile.GzipMember(
-          self._gzip_file_object, next_member_offset, uncompressed_data_offset)
+          self._gzip_file_object, next_member_offset, uncompressed_data_offset,
+          block_cache=self._block_cache)
       uncompressed_data_offset = (
           uncompressed_data_offset + member.uncompressed_data_size)
-      self._members_by_end_offset[uncompressed_data_offset] = member
+      self._members.append(member)
+      self._members_end_offsets.append(uncompressed_data_offset)
       self.uncompressed_data_size += member.uncompressed_data_size
       next_member_offset = member.member_end_offset
+
+    number_of_threaded_members = len([
+        member for member in self._members
+        if 0 < member.uncompressed_data_size <= (
+            self._MAXIMUM_THREADED_MEMBER_SIZE)])
+
+    number_of_threads = self._resolver_context.maximum_number_of_gzip_threads
+    if number_of_threads is None:
+      number_of_threads = min(
+          multiprocessing.cpu_count(), self._MAXIMUM_NUMBER_OF_THREADS)
+
+    # Worker threads are only used when multiple members can be decompressed
+    # ahead of reading.
+    if number_of_threads > 0 and number_of_threaded_members > 1:
+      self._number_of_threads = number_of_threads
@@ -8,7 +8,6 @@ import os
 from dfvfs.file_io import file_io
 from dfvfs.lib import errors
 from dfvfs.lib import py2to3
-from dfvfs.lib import sqlite_database
 from dfvfs.resolver import resolver
 
 
@@ -25,18 +24,30 @@ class SQLiteBlobFile(file_io.FileIO):
     """
     super(SQLiteBlobFile, self).__init__(resolver_context)
     self._blob = None
+    self._blob_object = None
+    self._column_name = None
     self._current_offset = 0
     self._database_object = None
+    self._file_system = None
     self._number_of_rows = None
+    self._row_identifier = None
     self._size = 0
     self._table_name = None
 
   def _Close(self):
     """Closes the file-like object."""
-    if self._database_object:
-      self._database_object.Close()
+    if self._blob_object:
+      self._blob_object.close()
+
+    if self._file_system:
+      self._file_system.Close()
 
     self._blob = None
+    self._blob_object = None
+    self._column_name = None
+    self._database_object = None
+    self._file_system = None
+    self._row_identifier = None
     self._current_offset = 0
     self._size = 0
     self._table_name = None
@@ -90,17 +101,16 @@ class SQLiteBlobFile(file_io.FileIO):
     if self._database_object:
       raise IOError('Database file already set.')
 
-    file_object = resolver.Resolver.OpenFileObject(
-        path_spec.parent, resolver_context=self._resolver_context)
-
-    try:
-      database_object = sqlite_database.SQLiteDatabaseFile()
-      database_object.Open(file_object)
-    finally:
-      file_object.close()
+    # The SQLite database is shared with other file-like objects through
+    # the file system, so that the parent is only copied once.
+    file_system = resolver.Resolver.OpenFileSystem(
+        path_spec, resolver_context=self._resolver_context)
+    database_object = file_system.GetDatabaseObject()
 
     # Sanity check the table and column names.
     error_string = ''
+    query_filter = None
+    query_parameters = None
     if not database_object.HasTable(table_name):
       error_string = 'Missing table: {0:s}'.format(table_name)
 
@@ -109,9 +119,20 @@ class SQLiteBlobFile(file_io.FileIO):
           column_name, table_name)
 
     elif not row_condition:
-      query = 'SELECT {0:s} FROM {1:s} LIMIT 1 OFFSET {2:d}'.format(
-          column_name, table_name, row_index)
-      rows = database_object.Query(query)
+      # Retrieving the row by its row identifier prevents the rows before it
+      # from being skipped by every open.
+      row_identifiers = file_system.GetRowIdentifiers(table_name)
+      if row_identifiers is None:
+        query_filter = 'LIMIT 1 OFFSET {0:d}'.format(row_index)
+
+      elif row_index < 0 or row_index >= len(row_identifiers):
+        error_string = (
+            'Unable to open blob in table: {0:s} and column: {1:s} '
+            'for row: {2:d}.').format(table_name, column_name, row_index)
+
+      else:
+        query_filter = 'WHERE rowid = ?'
+        query_parameters = (row_identifiers[row_index], )
 
     elif not database_object.HasColumn(table_name, row_condition[0]):
       error_string = (
@@ -124,13 +145,40 @@ class SQLiteBlobFile(file_io.FileIO):
               row_condition[1]))
 
     else:
-      query = 'SELECT {0:s} FROM {1:s} WHERE {2:s} {3:s} ?'.format(
-          column_name, table_name, row_condition[0], row_condition[1])
-      rows = database_object.Query(query, parameters=(row_condition[2], ))
+      query_filter = 'WHERE {0:s} {1:s} ?'.format(
+          row_condition[0], row_condition[1])
+      query_parameters = (row_condition[2], )
+
+    blob_size = None
+    row_identifier = None
+    rows = []
+
+    if not error_string:
+      # The data of a blob is read incrementally, hence only the row
+      # identifier and the size of the blob are retrieved.
+      query = (
+          'SELECT rowid, typeof({0:s}), length({0:s}) FROM {1:s} {2:s}').format(
+              column_name, table_name, query_filter)
+      try:
+        rows = database_object.Query(query, parameters=query_parameters)
+      except IOError:
+        # The table has no rowid, for example a "WITHOUT ROWID" table.
+        rows = []
+
+      if (len(rows) == 1 and len(rows[0]) == 3 and rows[0][0] is not None and
+          rows[0][1] in (b'blob', 'blob')):
+        row_identifier, _, blob_size = rows[0]
+
+      else:
+        # Other values, such as text, are read into memory.
+        query = 'SELECT {0:s} FROM {1:s} {2:s}'.format(
+            column_name, table_name, query_filter)
+        rows = database_object.Query(query, parameters=query_parameters)
 
     # Make sure the query returns a single row, using cursor.rowcount
     # is not reliable for this purpose.
-    if not error_string and (len(rows) != 1 or len(rows[0]) != 1):
+    if (not error_string and row_identifier is None and (
+        len(rows) != 1 or len(rows[0]) != 1)):
       if not row_condition:
         error_string = (
             'Unable to open blob in table: {0:s} and column: {1:s} '
@@ -144,14 +192,30 @@ class SQLiteBlobFile(file_io.FileIO):
             'where: {2:s}.').format(
                 table_name, column_name, row_condition_string)
 
+    blob_object = None
+    if not error_string and row_identifier is not None:
+      try:
+        blob_object = database_object.OpenBlob(
+            table_name, column_name, row_identifier)
+      except IOError as exception:
+        error_string = '{0!s}'.format(exception)
+
     if error_string:
-      database_object.Close()
+      file_system.Close()
       raise IOError(error_string)
 
-    self._blob = rows[0][0]
+    if row_identifier is None:
+      self._blob = rows[0][0]
+      self._size = len(self._blob)
+    else:
+      self._blob_object = blob_object
+      self._size = blob_size
+
+    self._column_name = column_name
     self._current_offset = 0
     self._database_object = database_object
-    self._size = len(self._blob)
+    self._file_system = file_system
+    self._row_identifier = row_identifier
     self._table_name = table_name
 
   # TODO: remove this when there is a move this to a central temp file
@@ -212,7 +276,17 @@ class SQLiteBlobFile(file_io.FileIO):
 
     start_offset = self._current_offset
     self._current_offset += size
-    return self._blob[start_offset:self._current_offset]
+
+    if self._blob is not None:
+      return self._blob[start_offset:self._current_offset]
+
+    if self._blob_object is not None:
+      self._blob_object.seek(start_offset, os.SEEK_SET)
+      return self._blob_object.read(size)
+
+    return self._database_object.ReadBlob(
+        self._table_name, self._column_name, self._row_identifier,
+        start_offset, size)
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
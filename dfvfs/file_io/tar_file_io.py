@@ -106,7 +106,10 @@ class TARFile(file_io.FileIO):
     if size is None or self._current_offset + size > self._size:
       size = self._size - self._current_offset
 
-    self._tar_ext_file.seek(self._current_offset, os.SEEK_SET)
+    # Only seek when necessary, since sequential reads do not change the
+    # offset of the extracted file.
+    if self._tar_ext_file.tell() != self._current_offset:
+      self._tar_ext_file.seek(self._current_offset, os.SEEK_SET)
 
     data = self._tar_ext_file.read(size)
 
@@ -3,6 +3,7 @@
 
 from __future__ import unicode_literals
 
+import collections
 import os
 
 import pytsk3
@@ -12,7 +13,18 @@ from dfvfs.resolver import resolver
 
 
 class TSKFile(file_io.FileIO):
-  """File-like object using pytsk3."""
+  """File-like object using pytsk3.
+
+  Reads smaller than the read-ahead block size are served from a small LRU
+  cache of block aligned data, to reduce the number of pytsk3 read_random
+  calls for parsers that issue many small reads.
+  """
+
+  # The default size of a read-ahead block.
+  _READ_AHEAD_BLOCK_SIZE = 64 * 1024
+
+  # The default maximum number of cached read-ahead blocks.
+  _MAXIMUM_NUMBER_OF_READ_AHEAD_BLOCKS = 4
 
   def __init__(self, resolver_context):
     """Initializes a file-like object.
@@ -23,12 +35,20 @@ class TSKFile(file_io.FileIO):
     super(TSKFile, self).__init__(resolver_context)
     self._current_offset = 0
     self._file_system = None
+    self._maximum_number_of_read_ahead_blocks = (
+        self._MAXIMUM_NUMBER_OF_READ_AHEAD_BLOCKS)
+    self._read_ahead_block_size = self._READ_AHEAD_BLOCK_SIZE
+    self._read_ahead_blocks = collections.OrderedDict()
     self._size = 0
     self._tsk_attribute = None
     self._tsk_file = None
 
+    self.read_ahead_cache_hits = 0
+    self.read_ahead_cache_misses = 0
+
   def _Close(self):
     """Closes the file-like object."""
+    self._read_ahead_blocks = collections.OrderedDict()
     self._tsk_attribute = None
     self._tsk_file = None
 
@@ -140,6 +160,75 @@ class TSKFile(file_io.FileIO):
     else:
       self._size = self._tsk_file.info.meta.size
 
+  def _ReadRandom(self, offset, size):
+    """Reads data from pytsk3.
+
+    Args:
+      offset (int): offset of the data.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+    """
+    if self._tsk_attribute:
+      return self._tsk_file.read_random(
+          offset, size, self._tsk_attribute.info.type,
+          self._tsk_attribute.info.id)
+
+    return self._tsk_file.read_random(offset, size)
+
+  def _ReadReadAheadBlock(self, block_offset):
+    """Reads a read-ahead block.
+
+    Args:
+      block_offset (int): offset of the block, which is a multiple of
+          the read-ahead block size.
+
+    Returns:
+      bytes: block data.
+    """
+    block_data = self._read_ahead_blocks.pop(block_offset, None)
+    if block_data is not None:
+      self.read_ahead_cache_hits += 1
+
+    else:
+      self.read_ahead_cache_misses += 1
+
+      read_size = min(self._read_ahead_block_size, self._size - block_offset)
+      block_data = self._ReadRandom(block_offset, read_size)
+
+      while (len(self._read_ahead_blocks) >=
+             self._maximum_number_of_read_ahead_blocks):
+        self._read_ahead_blocks.popitem(last=False)
+
+    # Re-insert the block to mark it as most recently used.
+    self._read_ahead_blocks[block_offset] = block_data
+
+    return block_data
+
+  def SetReadAheadCache(self, block_size, maximum_number_of_blocks):
+    """Sets the read-ahead cache of the file-like object.
+
+    Args:
+      block_size (int): size of a read-ahead block, where 0 disables
+          the read-ahead cache.
+      maximum_number_of_blocks (int): maximum number of cached read-ahead
+          blocks, where 0 disables the read-ahead cache.
+
+    Raises:
+      ValueError: if the block size or maximum number of blocks is invalid.
+    """
+    if block_size < 0:
+      raise ValueError('Invalid block size value less than zero.')
+
+    if maximum_number_of_blocks < 0:
+      raise ValueError(
+          'Invalid maximum number of blocks value less than zero.')
+
+    self._maximum_number_of_read_ahead_blocks = maximum_number_of_blocks
+    self._read_ahead_block_size = block_size
+    self._read_ahead_blocks = collections.OrderedDict()
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
   # pylint: disable=invalid-name
@@ -175,12 +264,35 @@ class TSKFile(file_io.FileIO):
     if size is None or self._current_offset + size > self._size:
       size = self._size - self._current_offset
 
-    if self._tsk_attribute:
-      data = self._tsk_file.read_random(
-          self._current_offset, size, self._tsk_attribute.info.type,
-          self._tsk_attribute.info.id)
+    if (size >= self._read_ahead_block_size or
+        not self._maximum_number_of_read_ahead_blocks):
+      data = self._ReadRandom(self._current_offset, size)
+
     else:
-      data = self._tsk_file.read_random(self._current_offset, size)
+      data_segments = []
+      data_size = 0
+
+      while data_size < size:
+        offset = self._current_offset + data_size
+        block_offset = offset - (offset % self._read_ahead_block_size)
+
+        block_data = self._ReadReadAheadBlock(block_offset)
+        data_offset = offset - block_offset
+        data_end_offset = data_offset + size - data_size
+
+        data_segment = block_data[data_offset:data_end_offset]
+        if not data_segment:
+          break
+
+        data_segments.append(data_segment)
+        data_size += len(data_segment)
+
+        # Stop at a block that contains less data than requested.
+        if (len(block_data) < self._read_ahead_block_size and
+            data_size < size):
+          break
+
+      data = b''.join(data_segments)
 
     # It is possible the that returned data size is not the same as the
     # requested data size. At this layer we don't care and this discrepancy
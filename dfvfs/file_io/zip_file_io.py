@@ -6,15 +6,39 @@ from __future__ import unicode_literals
 # Note: that zipfile.ZipExtFile is not seekable, hence it is wrapped in
 # an instance of file_io.FileIO.
 
+import bisect
 import os
+import struct
 import zipfile
+import zlib
 
 from dfvfs.file_io import file_io
 from dfvfs.resolver import resolver
 
 
 class ZipFile(file_io.FileIO):
-  """File-like object using zipfile."""
+  """File-like object using zipfile.
+
+  The data of unencrypted stored members is read directly from the ZIP file
+  and the data of unencrypted deflate compressed members is decompressed
+  directly from the ZIP file, where the decompression state is checkpointed
+  at regular intervals to speed up random access. Other members are read
+  using zipfile.
+  """
+
+  # The size of the compressed data buffer.
+  _COMPRESSED_DATA_BUFFER_SIZE = 64 * 1024
+
+  # The minimum number of bytes of uncompressed data between deflate
+  # decompression state checkpoints.
+  _DEFLATE_CHECKPOINT_INTERVAL = 4 * 1024 * 1024
+
+  # The flag that indicates the member is encrypted.
+  _FLAG_ENCRYPTED = 0x0001
+
+  _LOCAL_FILE_HEADER_SIGNATURE = b'PK\x03\x04'
+
+  _LOCAL_FILE_HEADER_SIZE = 30
 
   # The size of the uncompressed data buffer.
   _UNCOMPRESSED_DATA_BUFFER_SIZE = 16 * 1024 * 1024
@@ -27,11 +51,19 @@ class ZipFile(file_io.FileIO):
     """
     super(ZipFile, self).__init__(resolver_context)
     self._compressed_data = b''
+    self._compressed_data_offset = 0
+    self._compressed_stream_offset = None
+    self._compressed_stream_size = 0
     self._current_offset = 0
+    self._decompressor = None
+    self._deflate_checkpoints = []
+    self._deflate_checkpoint_offsets = []
+    self._file_object = None
     self._file_system = None
     self._realign_offset = True
     self._uncompressed_data = b''
     self._uncompressed_data_offset = 0
+    self._uncompressed_data_offset_end = 0
     self._uncompressed_data_size = 0
     self._uncompressed_stream_size = None
     self._zip_ext_file = None
@@ -47,6 +79,11 @@ class ZipFile(file_io.FileIO):
     self._zip_file = None
     self._zip_info = None
 
+    self._decompressor = None
+    self._deflate_checkpoints = []
+    self._deflate_checkpoint_offsets = []
+    self._file_object = None
+
     self._file_system.Close()
     self._file_system = None
 
@@ -86,6 +123,69 @@ class ZipFile(file_io.FileIO):
     self._current_offset = 0
     self._uncompressed_stream_size = self._zip_info.file_size
 
+    self._compressed_stream_offset = None
+    if (not self._zip_info.flag_bits & self._FLAG_ENCRYPTED and
+        self._zip_info.compress_type in (
+            zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED)):
+      self._file_object = self._file_system.GetParentFileObject()
+      self._compressed_stream_offset = self._GetCompressedStreamOffset()
+      self._compressed_stream_size = self._zip_info.compress_size
+
+    if self._compressed_stream_offset is None:
+      self._file_object = None
+
+  def _AlignDeflateUncompressedDataOffset(self, uncompressed_data_offset):
+    """Aligns the deflate decompression with the uncompressed data offset.
+
+    Decompression continues from the current decompression state or is
+    restarted from the last checkpoint before the uncompressed data offset,
+    whichever is nearest.
+
+    Args:
+      uncompressed_data_offset (int): uncompressed data offset.
+
+    Raises:
+      IOError: if the deflate compressed data could not be decompressed.
+      OSError: if the deflate compressed data could not be decompressed.
+    """
+    checkpoint_index = bisect.bisect_right(
+        self._deflate_checkpoint_offsets, uncompressed_data_offset) - 1
+
+    if checkpoint_index < 0:
+      checkpoint_offset = 0
+    else:
+      checkpoint_offset = self._deflate_checkpoint_offsets[checkpoint_index]
+
+    data_offset = self._uncompressed_data_offset_end - (
+        self._uncompressed_data_size)
+
+    if (self._decompressor is None or data_offset < checkpoint_offset or
+        data_offset > uncompressed_data_offset):
+      if checkpoint_index < 0:
+        self._compressed_data_offset = 0
+        self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+      else:
+        self._compressed_data_offset, decompressor = (
+            self._deflate_checkpoints[checkpoint_index])
+        self._decompressor = decompressor.copy()
+
+      self._uncompressed_data = b''
+      self._uncompressed_data_offset_end = checkpoint_offset
+      self._uncompressed_data_size = 0
+      data_offset = checkpoint_offset
+
+    while uncompressed_data_offset - data_offset >= (
+        self._uncompressed_data_size):
+      self._ReadDeflateCompressedData()
+      if not self._uncompressed_data_size:
+        break
+
+      data_offset = self._uncompressed_data_offset_end - (
+          self._uncompressed_data_size)
+
+    self._uncompressed_data_offset = min(
+        uncompressed_data_offset - data_offset, self._uncompressed_data_size)
+
   def _AlignUncompressedDataOffset(self, uncompressed_data_offset):
     """Aligns the compressed file with the uncompressed data offset.
 
@@ -96,6 +196,10 @@ class ZipFile(file_io.FileIO):
       IOError: if the ZIP file could not be opened.
       OSError: if the ZIP file could not be opened.
     """
+    if self._compressed_stream_offset is not None:
+      self._AlignDeflateUncompressedDataOffset(uncompressed_data_offset)
+      return
+
     if self._zip_ext_file:
       self._zip_ext_file.close()
       self._zip_ext_file = None
@@ -122,15 +226,111 @@ class ZipFile(file_io.FileIO):
 
       uncompressed_data_offset -= self._uncompressed_data_size
 
+  def _GetCompressedStreamOffset(self):
+    """Retrieves the offset of the member data in the ZIP file.
+
+    Returns:
+      int: offset of the member data or None if the local file header is not
+          supported.
+
+    Raises:
+      IOError: if the local file header could not be read.
+      OSError: if the local file header could not be read.
+    """
+    self._file_object.seek(self._zip_info.header_offset, os.SEEK_SET)
+    local_file_header = self._file_object.read(self._LOCAL_FILE_HEADER_SIZE)
+
+    if (len(local_file_header) != self._LOCAL_FILE_HEADER_SIZE or
+        local_file_header[:4] != self._LOCAL_FILE_HEADER_SIGNATURE):
+      return None
+
+    name_size, extra_fields_size = struct.unpack(
+        '<HH', local_file_header[26:30])
+
+    return (
+        self._zip_info.header_offset + self._LOCAL_FILE_HEADER_SIZE +
+        name_size + extra_fields_size)
+
   def _ReadCompressedData(self, read_size):
     """Reads compressed data from the file-like object.
 
     Args:
       read_size (int): number of bytes of compressed data to read.
     """
+    if self._compressed_stream_offset is not None:
+      self._ReadDeflateCompressedData()
+      return
+
     self._uncompressed_data = self._zip_ext_file.read(read_size)
     self._uncompressed_data_size = len(self._uncompressed_data)
 
+  def _ReadDeflateCompressedData(self):
+    """Reads and decompresses deflate compressed data from the ZIP file.
+
+    A checkpoint of the decompression state is stored every time the
+    uncompressed data passes the checkpoint interval.
+
+    Raises:
+      IOError: if the deflate compressed data could not be decompressed.
+      OSError: if the deflate compressed data could not be decompressed.
+    """
+    self._uncompressed_data = b''
+    self._uncompressed_data_size = 0
+
+    while (not self._uncompressed_data_size and
+           self._compressed_data_offset < self._compressed_stream_size):
+      read_size = min(
+          self._COMPRESSED_DATA_BUFFER_SIZE,
+          self._compressed_stream_size - self._compressed_data_offset)
+
+      self._file_object.seek(
+          self._compressed_stream_offset + self._compressed_data_offset,
+          os.SEEK_SET)
+      compressed_data = self._file_object.read(read_size)
+      if not compressed_data:
+        break
+
+      try:
+        self._uncompressed_data = self._decompressor.decompress(
+            compressed_data)
+      except zlib.error as exception:
+        raise IOError((
+            'Unable to decompress deflate compressed data with error: '
+            '{0!s}').format(exception))
+
+      self._compressed_data_offset += len(compressed_data)
+      self._uncompressed_data_size = len(self._uncompressed_data)
+      self._uncompressed_data_offset_end += self._uncompressed_data_size
+
+      if self._deflate_checkpoint_offsets:
+        last_checkpoint_offset = self._deflate_checkpoint_offsets[-1]
+      else:
+        last_checkpoint_offset = 0
+
+      if (self._uncompressed_data_offset_end >=
+          last_checkpoint_offset + self._DEFLATE_CHECKPOINT_INTERVAL):
+        self._deflate_checkpoint_offsets.append(
+            self._uncompressed_data_offset_end)
+        self._deflate_checkpoints.append((
+            self._compressed_data_offset, self._decompressor.copy()))
+
+  def _ReadStoredData(self, size):
+    """Reads the data of a stored member directly from the ZIP file.
+
+    Args:
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+    """
+    self._file_object.seek(
+        self._compressed_stream_offset + self._current_offset, os.SEEK_SET)
+
+    data = self._file_object.read(size)
+    self._current_offset += len(data)
+
+    return data
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
   # pylint: disable=invalid-name
@@ -165,6 +365,10 @@ class ZipFile(file_io.FileIO):
         self._current_offset + size > self._uncompressed_stream_size):
       size = self._uncompressed_stream_size - self._current_offset
 
+    if (self._compressed_stream_offset is not None and
+        self._zip_info.compress_type == zipfile.ZIP_STORED):
+      return self._ReadStoredData(size)
+
     if self._realign_offset:
       self._AlignUncompressedDataOffset(self._current_offset)
       self._realign_offset = False
@@ -187,6 +391,9 @@ class ZipFile(file_io.FileIO):
 
       self._uncompressed_data_offset = 0
 
+      if not self._uncompressed_data_size:
+        break
+
     # Read in partial block of uncompressed data.
     if (size > 0 and
         self._uncompressed_data_offset + size <= self._uncompressed_data_size):
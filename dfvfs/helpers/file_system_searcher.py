@@ -3,14 +3,23 @@
 
 from __future__ import unicode_literals
 
+import multiprocessing
 import re
 import sre_constants
 
+try:
+  import Queue as queue  # pylint: disable=import-error
+except ImportError:
+  import queue  # pylint: disable=import-error
+
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.lib import glob2regex
 from dfvfs.lib import py2to3
 from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+from dfvfs.serializer import json_serializer
 
 
 class FindSpec(object):
@@ -114,6 +123,21 @@ class FindSpec(object):
     # TODO: add support for expression e.g.
     # attribute['$FILE_NAME'].creation_type == 'x'
 
+  @property
+  def is_case_sensitive(self):
+    """bool: True if the location is matched case sensitive."""
+    return self._is_case_sensitive
+
+  @property
+  def is_regex(self):
+    """bool: True if the location segments are regular expressions."""
+    return self._is_regex
+
+  @property
+  def location_segments(self):
+    """list[str]: location segments or None if not available."""
+    return self._location_segments
+
   def _CheckFileEntryType(self, file_entry):
     """Checks the file entry type find specifications.
 
@@ -234,6 +258,18 @@ class FindSpec(object):
     Returns:
       bool: True if the file entry matches the find specification, False if not.
     """
+    return self._CheckLocationName(file_entry.name, search_depth)
+
+  def _CheckLocationName(self, name, search_depth):
+    """Checks the location find specification against a name.
+
+    Args:
+      name (str): name of the file entry.
+      search_depth (int): number of location path segments to compare.
+
+    Returns:
+      bool: True if the name matches the find specification, False if not.
+    """
     if self._location_segments is None:
       return False
 
@@ -270,14 +306,14 @@ class FindSpec(object):
 
     if search_depth > 0:
       if self._is_regex:
-        if not segment_name.match(file_entry.name):  # pylint: disable=no-member
+        if not segment_name.match(name):  # pylint: disable=no-member
           return False
 
       elif self._is_case_sensitive:
-        if segment_name != file_entry.name:
+        if segment_name != name:
           return False
 
-      elif segment_name != file_entry.name.lower():
+      elif segment_name != name.lower():
         return False
 
     return True
@@ -351,15 +387,27 @@ class FindSpec(object):
       if search_depth != self._number_of_location_segments:
         return False, location_match
 
+    return self.MatchesFileEntry(file_entry), location_match
+
+  def MatchesFileEntry(self, file_entry):
+    """Determines if the file entry matches the non-location criteria.
+
+    Args:
+      file_entry (FileEntry): file entry.
+
+    Returns:
+      bool: True if the file entry matches the file entry type and allocation
+          criteria of the find specification, False otherwise.
+    """
     match = self._CheckFileEntryType(file_entry)
     if match is not None and not match:
-      return False, location_match
+      return False
 
     match = self._CheckIsAllocated(file_entry)
     if match is not None and not match:
-      return False, location_match
+      return False
 
-    return True, location_match
+    return True
 
   def PrepareMatches(self, file_system):
     """Prepare find specification for matching.
@@ -384,9 +432,353 @@ class FindSpec(object):
       self._number_of_location_segments = len(self._location_segments)
 
 
+class _FindSpecsTrieNode(object):
+  """Node of the location trie of a find specifications matcher.
+
+  Attributes:
+    case_insensitive_children (dict[str, _FindSpecsTrieNode]): child nodes
+        of literal location segments that are matched case insensitive,
+        where the key is the lower case location segment.
+    case_sensitive_children (dict[str, _FindSpecsTrieNode]): child nodes
+        of literal location segments that are matched case sensitive.
+    find_specs (list[FindSpec]): find specifications of which the location
+        ends at the node.
+    regex_children (dict[tuple[str, bool], tuple[re.RegexObject,
+        _FindSpecsTrieNode]]): compiled regular expressions and child nodes
+        of location segments that are matched with a regular expression,
+        where the key consists of the pattern and the case sensitivity.
+  """
+
+  def __init__(self):
+    """Initializes a find specifications trie node."""
+    super(_FindSpecsTrieNode, self).__init__()
+    self.case_insensitive_children = {}
+    self.case_sensitive_children = {}
+    self.find_specs = []
+    self.regex_children = {}
+
+  @property
+  def has_children(self):
+    """bool: True if the node has child nodes."""
+    return bool(
+        self.case_insensitive_children or self.case_sensitive_children or
+        self.regex_children)
+
+
+class FindSpecsMatcher(object):
+  """Matcher that evaluates multiple find specifications at once.
+
+  The location segments of the find specifications are merged into a trie,
+  where literal location segments, including regular expressions and globs
+  without special characters, are matched with a dictionary look up and
+  only the remaining regular expressions are evaluated. The cost of matching
+  a name therefore depends on the number of distinct regular expressions
+  at a specific depth rather than on the total number of find
+  specifications.
+
+  The matching state of a file entry is represented by the list of trie
+  nodes that match its location.
+  """
+
+  # Characters that have a special meaning in a regular expression.
+  _REGEX_SPECIAL_CHARACTERS = frozenset('$()*+.?[\\]^{|}')
+
+  def __init__(self, find_specs):
+    """Initializes a find specifications matcher.
+
+    Note that the find specifications must be prepared for matching with
+    PrepareMatches.
+
+    Args:
+      find_specs (list[FindSpec]): find specifications.
+    """
+    super(FindSpecsMatcher, self).__init__()
+    self._any_location_find_specs = []
+    self._root_node = _FindSpecsTrieNode()
+
+    for find_spec in find_specs:
+      self._AddFindSpec(find_spec)
+
+  def _AddFindSpec(self, find_spec):
+    """Adds a find specification to the trie.
+
+    Args:
+      find_spec (FindSpec): find specification.
+    """
+    location_segments = find_spec.location_segments
+    if location_segments is None:
+      self._any_location_find_specs.append(find_spec)
+      return
+
+    case_sensitive = find_spec.is_case_sensitive
+
+    node = self._root_node
+    for location_segment in location_segments:
+      if not find_spec.is_regex:
+        literal_segment = location_segment
+      else:
+        # A location segment can already have been compiled by
+        # FindSpec._CheckLocationName.
+        pattern = getattr(location_segment, 'pattern', None)
+        if pattern is not None:
+          location_segment = pattern[1:-1]
+
+        literal_segment = self._GetLiteralSegment(location_segment)
+
+      if literal_segment is None:
+        key = (location_segment, case_sensitive)
+        regex_child = node.regex_children.get(key, None)
+        if not regex_child:
+          # Allow '\n' to be matched by '.' and make '\w', '\W', '\b', '\B',
+          # '\d', '\D', '\s' and '\S' Unicode safe.
+          flags = re.DOTALL | re.UNICODE
+          if not case_sensitive:
+            flags |= re.IGNORECASE
+
+          try:
+            compiled_regex = re.compile(
+                r'^{0:s}$'.format(location_segment), flags=flags)
+          except sre_constants.error:
+            # A find specification with an invalid regular expression never
+            # matches.
+            return
+
+          regex_child = (compiled_regex, _FindSpecsTrieNode())
+          node.regex_children[key] = regex_child
+
+        node = regex_child[1]
+
+      elif case_sensitive:
+        node = node.case_sensitive_children.setdefault(
+            literal_segment, _FindSpecsTrieNode())
+
+      else:
+        node = node.case_insensitive_children.setdefault(
+            literal_segment.lower(), _FindSpecsTrieNode())
+
+    node.find_specs.append(find_spec)
+
+  def _GetLiteralSegment(self, location_segment):
+    """Retrieves the literal value of a regular expression location segment.
+
+    Args:
+      location_segment (str): regular expression location segment.
+
+    Returns:
+      str: literal value or None if the regular expression contains special
+          characters.
+    """
+    literal_segment = []
+
+    segment_index = 0
+    segment_length = len(location_segment)
+    while segment_index < segment_length:
+      character = location_segment[segment_index]
+      segment_index += 1
+
+      if character == '\\':
+        if segment_index >= segment_length:
+          return None
+
+        # An escaped alphanumeric character, such as '\d', has a special
+        # meaning.
+        character = location_segment[segment_index]
+        segment_index += 1
+        if character.isalnum() or character == '_':
+          return None
+
+      elif character in self._REGEX_SPECIAL_CHARACTERS:
+        return None
+
+      literal_segment.append(character)
+
+    return ''.join(literal_segment)
+
+  def GetMatchingFindSpecs(self, file_entry, nodes):
+    """Retrieves the find specifications that match a file entry.
+
+    Args:
+      file_entry (FileEntry): file entry.
+      nodes (list[_FindSpecsTrieNode]): trie nodes that match the location of
+          the file entry.
+
+    Returns:
+      list[FindSpec]: find specifications that match the file entry.
+    """
+    matching_find_specs = []
+    for node in nodes:
+      for find_spec in node.find_specs:
+        if find_spec.MatchesFileEntry(file_entry):
+          matching_find_specs.append(find_spec)
+
+    for find_spec in self._any_location_find_specs:
+      if find_spec.MatchesFileEntry(file_entry):
+        matching_find_specs.append(find_spec)
+
+    return matching_find_specs
+
+  def GetRootNodes(self):
+    """Retrieves the trie nodes that match the location of the root.
+
+    Returns:
+      list[_FindSpecsTrieNode]: trie nodes that match the location of the
+          root.
+    """
+    return [self._root_node]
+
+  def GetSubNodes(self, nodes, name):
+    """Retrieves the trie nodes that match the location of a sub file entry.
+
+    Args:
+      nodes (list[_FindSpecsTrieNode]): trie nodes that match the location of
+          the parent file entry.
+      name (str): name of the sub file entry.
+
+    Returns:
+      list[_FindSpecsTrieNode]: trie nodes that match the location of the sub
+          file entry.
+    """
+    lower_case_name = None
+
+    sub_nodes = []
+    for node in nodes:
+      sub_node = node.case_sensitive_children.get(name, None)
+      if sub_node:
+        sub_nodes.append(sub_node)
+
+      if node.case_insensitive_children:
+        if lower_case_name is None:
+          lower_case_name = name.lower()
+
+        sub_node = node.case_insensitive_children.get(lower_case_name, None)
+        if sub_node:
+          sub_nodes.append(sub_node)
+
+      for compiled_regex, sub_node in node.regex_children.values():
+        if compiled_regex.match(name):
+          sub_nodes.append(sub_node)
+
+    return sub_nodes
+
+  def HasSubNodes(self, nodes):
+    """Determines if sub file entries can match.
+
+    Args:
+      nodes (list[_FindSpecsTrieNode]): trie nodes that match the location of
+          the parent file entry.
+
+    Returns:
+      bool: True if a sub file entry can match any of the find specifications.
+    """
+    if self._any_location_find_specs:
+      return True
+
+    return any(node.has_children for node in nodes)
+
+  def MatchesAnyLocation(self):
+    """Determines if the matcher contains find specifications without location.
+
+    Returns:
+      bool: True if find specifications without location match any location.
+    """
+    return bool(self._any_location_find_specs)
+
+
+class _FindProcess(multiprocessing.Process):
+  """Process that searches for matching file entries within sub trees.
+
+  The process receives tasks from the task queue, where each task consists
+  of a JSON serialized path specification and the name of a sub file entry
+  of the root to search. A task of None signals the process to stop.
+
+  Every result put on the result queue is a tuple of a JSON serialized path
+  specification and an error message. The path specification of every
+  matching file entry is put on the result queue, followed by a path
+  specification of None to signal the task has been completed. If the
+  search of the sub tree failed, the error message of the completed task
+  is set.
+  """
+
+  def __init__(self, mount_point, matcher, task_queue, result_queue):
+    """Initializes a find process.
+
+    Args:
+      mount_point (str): JSON serialized mount point path specification.
+      matcher (FindSpecsMatcher): find specifications matcher.
+      task_queue (multiprocessing.Queue): task queue.
+      result_queue (multiprocessing.Queue): result queue.
+    """
+    super(_FindProcess, self).__init__()
+    self._matcher = matcher
+    self._mount_point = mount_point
+    self._result_queue = result_queue
+    self._task_queue = task_queue
+
+    self.daemon = True
+
+  def run(self):
+    """Runs the process."""
+    resolver_context = context.Context()
+    mount_point = json_serializer.JsonPathSpecSerializer.ReadSerialized(
+        self._mount_point)
+
+    file_system = None
+    searcher = None
+
+    try:
+      task = self._task_queue.get()
+      while task is not None:
+        serialized_path_spec, name = task
+        path_spec = json_serializer.JsonPathSpecSerializer.ReadSerialized(
+            serialized_path_spec)
+
+        error_string = None
+        try:
+          # All tasks refer to the same file system, hence it is only opened
+          # once per process.
+          if not file_system:
+            file_system = resolver.Resolver.OpenFileSystem(
+                path_spec, resolver_context=resolver_context)
+            searcher = FileSystemSearcher(file_system, mount_point)
+
+          file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+          if file_entry:
+            nodes = self._matcher.GetSubNodes(
+                self._matcher.GetRootNodes(), name)
+
+            # pylint: disable=protected-access
+            for matching_path_spec in searcher._FindInFileEntry(
+                file_entry, self._matcher, nodes):
+              self._result_queue.put((
+                  json_serializer.JsonPathSpecSerializer.WriteSerialized(
+                      matching_path_spec), None))
+
+        except (IOError, errors.AccessError, errors.BackEndError,
+                errors.PathSpecError) as exception:
+          error_string = (
+              'Unable to search sub file entry: {0:s} with error: '
+              '{1!s}').format(name, exception)
+
+        self._result_queue.put((None, error_string))
+
+        task = self._task_queue.get()
+
+    finally:
+      if file_system:
+        file_system.Close()
+
+
 class FileSystemSearcher(object):
   """Searcher to find file entries within a file system."""
 
+  # The maximum number of matches that can be pending in the result queue
+  # of a parallel search.
+  _MAXIMUM_NUMBER_OF_QUEUED_RESULTS = 1024
+
+  # The number of seconds to wait for a result of a parallel search before
+  # checking if the find processes are still alive.
+  _RESULT_QUEUE_TIMEOUT = 1.0
+
   def __init__(self, file_system, mount_point):
     """Initializes a file system searcher.
 
@@ -412,48 +804,172 @@ class FileSystemSearcher(object):
     self._file_system = file_system
     self._mount_point = mount_point
 
-  def _FindInFileEntry(self, file_entry, find_specs, search_depth):
+  def _FindInFileEntry(self, file_entry, matcher, nodes):
     """Searches for matching file entries within the file entry.
 
     Args:
       file_entry (FileEntry): file entry.
-      find_specs (list[FindSpec]): find specifications.
-      search_depth (int): number of location path segments to compare.
+      matcher (FindSpecsMatcher): find specifications matcher.
+      nodes (list[_FindSpecsTrieNode]): trie nodes of the matcher that match
+          the location of the file entry.
 
     Yields:
       PathSpec: path specification of a matching file entry.
     """
-    sub_find_specs = []
-    for find_spec in find_specs:
-      match, location_match = find_spec.Matches(file_entry, search_depth)
-      if match:
-        yield file_entry.path_spec
-
-      # pylint: disable=singleton-comparison
-      if location_match != False and not find_spec.AtMaximumDepth(search_depth):
-        sub_find_specs.append(find_spec)
+    for _ in matcher.GetMatchingFindSpecs(file_entry, nodes):
+      yield file_entry.path_spec
 
-    if not sub_find_specs:
+    if not matcher.HasSubNodes(nodes):
       return
 
-    search_depth += 1
     try:
-      for sub_file_entry in file_entry.sub_file_entries:
+      for directory_entry in file_entry.ListDirectoryEntries():
+        name = directory_entry.name
+
+        sub_file_entry = None
+        if name is None:
+          sub_file_entry = self._file_system.GetFileEntryByPathSpec(
+              directory_entry.path_spec)
+          if not sub_file_entry:
+            continue
+
+          name = sub_file_entry.name
+
+        # Directory entries that do not match the location of any of the find
+        # specifications are skipped without opening their file entry.
+        sub_nodes = matcher.GetSubNodes(nodes, name)
+        if not sub_nodes and not matcher.MatchesAnyLocation():
+          continue
+
+        if not sub_file_entry:
+          sub_file_entry = self._file_system.GetFileEntryByPathSpec(
+              directory_entry.path_spec)
+          if not sub_file_entry:
+            continue
+
         for matching_path_spec in self._FindInFileEntry(
-            sub_file_entry, sub_find_specs, search_depth):
+            sub_file_entry, matcher, sub_nodes):
           yield matching_path_spec
     except errors.AccessError:
       pass
 
-  def Find(self, find_specs=None):
+  def _FindInParallel(self, file_entry, matcher, number_of_workers):
+    """Searches for matching file entries using multiple processes.
+
+    The sub file entries of the file entry are searched by a pool of find
+    processes, each with its own resolver context. Path specifications are
+    exchanged between processes in JSON serialized form.
+
+    Args:
+      file_entry (FileEntry): file entry.
+      matcher (FindSpecsMatcher): find specifications matcher.
+      number_of_workers (int): number of find processes.
+
+    Yields:
+      PathSpec: path specification of a matching file entry.
+
+    Raises:
+      BackEndError: if the find processes stopped unexpectedly or failed to
+          search a sub file entry.
+    """
+    nodes = matcher.GetRootNodes()
+    for _ in matcher.GetMatchingFindSpecs(file_entry, nodes):
+      yield file_entry.path_spec
+
+    if not matcher.HasSubNodes(nodes):
+      return
+
+    task_queue = multiprocessing.Queue()
+    result_queue = multiprocessing.Queue(
+        maxsize=self._MAXIMUM_NUMBER_OF_QUEUED_RESULTS)
+
+    number_of_tasks = 0
+    try:
+      for directory_entry in file_entry.ListDirectoryEntries():
+        name = directory_entry.name
+        if name is None:
+          sub_file_entry = self._file_system.GetFileEntryByPathSpec(
+              directory_entry.path_spec)
+          if not sub_file_entry:
+            continue
+
+          name = sub_file_entry.name
+
+        if (not matcher.GetSubNodes(nodes, name) and
+            not matcher.MatchesAnyLocation()):
+          continue
+
+        task_queue.put((
+            json_serializer.JsonPathSpecSerializer.WriteSerialized(
+                directory_entry.path_spec), name))
+        number_of_tasks += 1
+
+    except errors.AccessError:
+      pass
+
+    if not number_of_tasks:
+      return
+
+    number_of_workers = min(number_of_workers, number_of_tasks)
+    for _ in range(number_of_workers):
+      task_queue.put(None)
+
+    mount_point = json_serializer.JsonPathSpecSerializer.WriteSerialized(
+        self._mount_point)
+
+    find_processes = []
+    try:
+      for _ in range(number_of_workers):
+        find_process = _FindProcess(
+            mount_point, matcher, task_queue, result_queue)
+        find_process.start()
+        find_processes.append(find_process)
+
+      while number_of_tasks > 0:
+        try:
+          result = result_queue.get(timeout=self._RESULT_QUEUE_TIMEOUT)
+        except queue.Empty:
+          if not any(
+              find_process.is_alive() for find_process in find_processes):
+            raise errors.BackEndError('Find processes stopped unexpectedly.')
+          continue
+
+        serialized_path_spec, error_string = result
+        if error_string:
+          raise errors.BackEndError(error_string)
+
+        if serialized_path_spec is None:
+          number_of_tasks -= 1
+        else:
+          yield json_serializer.JsonPathSpecSerializer.ReadSerialized(
+              serialized_path_spec)
+
+    finally:
+      for find_process in find_processes:
+        if number_of_tasks > 0:
+          find_process.terminate()
+        find_process.join()
+
+  def Find(self, find_specs=None, number_of_workers=0):
     """Searches for matching file entries within the file system.
 
+    When number_of_workers is set the sub trees of the root are searched
+    in parallel by separate processes. This requires that the file system
+    can be opened by the resolver from its path specification. Note that
+    matching file entries are then returned in no particular order.
+
     Args:
       find_specs (list[FindSpec]): find specifications. where None
           will return all allocated file entries.
+      number_of_workers (Optional[int]): number of processes to search
+          with, where 0 represents searching in the current process.
 
     Yields:
       PathSpec: path specification of a matching file entry.
+
+    Raises:
+      BackEndError: if the find processes stopped unexpectedly or failed to
+          search a sub file entry.
     """
     if not find_specs:
       find_specs.append(FindSpec())
@@ -467,7 +983,16 @@ class FileSystemSearcher(object):
     else:
       file_entry = self._file_system.GetRootFileEntry()
 
-    for matching_path_spec in self._FindInFileEntry(file_entry, find_specs, 0):
+    matcher = FindSpecsMatcher(find_specs)
+
+    if number_of_workers > 0:
+      matching_path_specs = self._FindInParallel(
+          file_entry, matcher, number_of_workers)
+    else:
+      matching_path_specs = self._FindInFileEntry(
+          file_entry, matcher, matcher.GetRootNodes())
+
+    for matching_path_spec in matching_path_specs:
       yield matching_path_spec
 
   def GetFileEntryByPathSpec(self, path_spec):
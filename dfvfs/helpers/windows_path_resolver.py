@@ -3,6 +3,7 @@
 
 from __future__ import unicode_literals
 
+import collections
 import re
 
 from dfvfs.lib import errors
@@ -16,6 +17,9 @@ class WindowsPathResolver(object):
   _PATH_SEPARATOR = '\\'
   _PATH_EXPANSION_VARIABLE = re.compile(r'^[%][^%]+[%]$')
 
+  # The maximum number of resolved path prefixes to cache.
+  _MAXIMUM_NUMBER_OF_CACHED_PREFIXES = 1024
+
   def __init__(self, file_system, mount_point, drive_letter='C'):
     """Initializes a Windows path helper.
 
@@ -48,6 +52,7 @@ class WindowsPathResolver(object):
     self._environment_variables = {}
     self._file_system = file_system
     self._mount_point = mount_point
+    self._prefixes_cache = collections.OrderedDict()
 
   # Windows paths:
   # Device path:                    \\.\PhysicalDrive0
@@ -104,21 +109,55 @@ class WindowsPathResolver(object):
 
     return path
 
-  def _ResolvePath(self, path, expand_variables=True):
-    """Resolves a Windows path in file system specific format.
+  def _CachePrefix(self, path_segments, value):
+    """Caches a resolved path prefix.
 
-    This function will check if the individual path segments exists within
-    the file system. For this it will prefer the first case sensitive match
-    above a case insensitive match. If no match was found None is returned.
+    Args:
+      path_segments (tuple[str]): search path segments of the prefix.
+      value (tuple[PathSpec, tuple[str]]): path specification and expanded
+          path segments of the prefix or None if the prefix does not exist.
+    """
+    if path_segments in self._prefixes_cache:
+      del self._prefixes_cache[path_segments]
+
+    elif (len(self._prefixes_cache) >=
+          self._MAXIMUM_NUMBER_OF_CACHED_PREFIXES):
+      self._prefixes_cache.popitem(last=False)
+
+    self._prefixes_cache[path_segments] = value
+
+  def _GetCachedPrefix(self, path_segments):
+    """Retrieves the longest cached prefix of the search path segments.
 
     Args:
-      path (str): Windows path to resolve.
+      path_segments (tuple[str]): search path segments.
+
+    Returns:
+      tuple[int, tuple[PathSpec, tuple[str]]]: number of search path segments
+          of the prefix and the cached value or (0, None) if no prefix was
+          cached. Note that the cached value is None if the prefix does not
+          exist.
+    """
+    for number_of_path_segments in range(len(path_segments), 0, -1):
+      prefix_path_segments = path_segments[:number_of_path_segments]
+      if prefix_path_segments in self._prefixes_cache:
+        value = self._prefixes_cache.pop(prefix_path_segments)
+        self._prefixes_cache[prefix_path_segments] = value
+        return number_of_path_segments, value
+
+    return 0, None
+
+  def _GetSearchPathSegments(self, path, expand_variables=True):
+    """Retrieves the normalized search path segments of a Windows path.
+
+    Args:
+      path (str): Windows path.
       expand_variables (Optional[bool]): True if path variables should be
           expanded or not.
 
     Returns:
-      tuple[str, PathSpec]: location and matching path specification or
-          (None, None) if not available.
+      tuple[str]: search path segments relative to the mount point or None
+          if the path is not supported.
     """
     # Allow for paths that start with an environment variable e.g.
     # %SystemRoot%\file.txt
@@ -130,62 +169,114 @@ class WindowsPathResolver(object):
       path = self._PathStripPrefix(path)
 
     if path is None:
+      return None
+
+    search_path_segments = []
+    for path_segment in path.split(self._PATH_SEPARATOR):
+      if (expand_variables and
+          self._PATH_EXPANSION_VARIABLE.match(path_segment)):
+        path_segment = self._environment_variables.get(
+            path_segment[1:-1].upper(), path_segment)
+
+      # The expanded path segment itself can consist of multiple path
+      # segments.
+      for expanded_path_segment in path_segment.split(self._PATH_SEPARATOR):
+        # Ignore empty path segments or path segments containing a single dot.
+        if not expanded_path_segment or expanded_path_segment == '.':
+          continue
+
+        if expanded_path_segment == '..':
+          # Only allow to traverse back up to the mount point.
+          if search_path_segments:
+            search_path_segments.pop()
+          continue
+
+        search_path_segments.append(expanded_path_segment)
+
+    return tuple(search_path_segments)
+
+  def _ResolvePath(self, path, expand_variables=True):
+    """Resolves a Windows path in file system specific format.
+
+    This function will check if the individual path segments exists within
+    the file system. For this it will prefer the first case sensitive match
+    above a case insensitive match. If no match was found None is returned.
+
+    Resolved path prefixes, including prefixes that do not exist, are cached
+    so that paths that share a prefix, such as the Windows system directory,
+    do not need to be traversed from the mount point every time. Since the
+    cache is keyed by the expanded path segments, changing an environment
+    variable does not require the cache to be invalidated. The path
+    specifications of the prefixes are cached instead of the file entries,
+    so that the cache does not keep file entries, and the back-end handles
+    they hold, open.
+
+    Args:
+      path (str): Windows path to resolve.
+      expand_variables (Optional[bool]): True if path variables should be
+          expanded or not.
+
+    Returns:
+      tuple[str, PathSpec]: location and matching path specification or
+          (None, None) if not available.
+    """
+    search_path_segments = self._GetSearchPathSegments(
+        path, expand_variables=expand_variables)
+    if search_path_segments is None:
       return None, None
 
-    if path_spec_factory.Factory.IsSystemLevelTypeIndicator(
-        self._file_system.type_indicator):
-      file_entry = self._file_system.GetFileEntryByPathSpec(self._mount_point)
-      expanded_path_segments = self._file_system.SplitPath(
-          self._mount_point.location)
-    else:
-      file_entry = self._file_system.GetRootFileEntry()
-      expanded_path_segments = []
+    number_of_path_segments, value = self._GetCachedPrefix(
+        search_path_segments)
 
-    number_of_expanded_path_segments = 0
+    if number_of_path_segments == 0:
+      if path_spec_factory.Factory.IsSystemLevelTypeIndicator(
+          self._file_system.type_indicator):
+        file_entry = self._file_system.GetFileEntryByPathSpec(
+            self._mount_point)
+        expanded_path_segments = tuple(self._file_system.SplitPath(
+            self._mount_point.location))
+      else:
+        file_entry = self._file_system.GetRootFileEntry()
+        expanded_path_segments = ()
 
-    search_path_segments = path.split(self._PATH_SEPARATOR)
-    while search_path_segments:
-      path_segment = search_path_segments.pop(0)
       if file_entry is None:
         return None, None
 
-      # Ignore empty path segments or path segments containing a single dot.
-      if not path_segment or path_segment == '.':
-        continue
+      path_spec = file_entry.path_spec
 
-      if path_segment == '..':
-        # Only allow to traverse back up to the mount point.
-        if number_of_expanded_path_segments > 0:
-          _ = expanded_path_segments.pop(0)
-          number_of_expanded_path_segments -= 1
-          file_entry = file_entry.GetParentFileEntry()
-        continue
+    elif value is None:
+      return None, None
 
-      if (expand_variables and
-          self._PATH_EXPANSION_VARIABLE.match(path_segment)):
-        path_segment = self._environment_variables.get(
-            path_segment[1:-1].upper(), path_segment)
+    else:
+      path_spec, expanded_path_segments = value
+
+      # The file entry of the prefix is only needed to resolve the remaining
+      # path segments.
+      if number_of_path_segments < len(search_path_segments):
+        file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+        if file_entry is None:
+          return None, None
 
-        if self._PATH_SEPARATOR in path_segment:
-          # The expanded path segment itself can consist of multiple
-          # path segments, hence we need to split it and prepend it to
-          # the search path segments list.
-          path_segments = path_segment.split(self._PATH_SEPARATOR)
-          path_segments.extend(search_path_segments)
-          search_path_segments = path_segments
-          path_segment = search_path_segments.pop(0)
+    while number_of_path_segments < len(search_path_segments):
+      path_segment = search_path_segments[number_of_path_segments]
+      number_of_path_segments += 1
 
       sub_file_entry = file_entry.GetSubFileEntryByName(
           path_segment, case_sensitive=False)
       if sub_file_entry is None:
+        self._CachePrefix(
+            search_path_segments[:number_of_path_segments], None)
         return None, None
 
-      expanded_path_segments.append(sub_file_entry.name)
-      number_of_expanded_path_segments += 1
       file_entry = sub_file_entry
+      path_spec = file_entry.path_spec
+      expanded_path_segments += (file_entry.name, )
+      self._CachePrefix(
+          search_path_segments[:number_of_path_segments],
+          (path_spec, expanded_path_segments))
 
     location = self._file_system.JoinPath(expanded_path_segments)
-    return location, file_entry.path_spec
+    return location, path_spec
 
   def GetWindowsPath(self, path_spec):
     """Returns the Windows path based on a resolved path specification.
@@ -258,6 +349,31 @@ class WindowsPathResolver(object):
     return path_spec_factory.Factory.NewPathSpec(
         self._file_system.type_indicator, **kwargs)
 
+  def ResolvePaths(self, paths, expand_variables=True):
+    """Resolves Windows paths in file system specific format.
+
+    The paths are resolved in sorted order so that paths that share a prefix
+    are resolved consecutively and reuse the cached prefix traversal.
+
+    Args:
+      paths (iterable[str]): Windows paths to resolve.
+      expand_variables (Optional[bool]): True if path variables should be
+          expanded or not.
+
+    Returns:
+      list[PathSpec]: path specifications in file system specific format,
+          in the order of the paths, where a path specification is None if
+          the corresponding path could not be resolved.
+    """
+    paths = list(paths)
+    path_specs = [None] * len(paths)
+
+    for index, path in sorted(enumerate(paths), key=lambda item: item[1]):
+      path_specs[index] = self.ResolvePath(
+          path, expand_variables=expand_variables)
+
+    return path_specs
+
   def SetEnvironmentVariable(self, name, value):
     """Sets an environment variable in the Windows path helper.
 
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""Hierarchical index of the members of an archive."""
+
+from __future__ import unicode_literals
+
+import collections
+
+
+class ArchiveMemberIndex(object):
+  """Hierarchical index of the members of an archive.
+
+  The index maps every directory to the names of its sub entries, in the
+  order they were first encountered. This includes directories that are
+  implied by the paths of the members but have no member of their own.
+  Paths are stored without leading and trailing path separators and the
+  root directory is represented by an empty string.
+  """
+
+  def __init__(self, path_separator='/'):
+    """Initializes an archive member index.
+
+    Args:
+      path_separator (Optional[str]): path segment separator.
+    """
+    super(ArchiveMemberIndex, self).__init__()
+    self._directories = {'': collections.OrderedDict()}
+    self._members = {}
+    self._path_separator = path_separator
+
+  def _GetPathSegments(self, path):
+    """Splits a path into path segments.
+
+    Args:
+      path (str): path.
+
+    Returns:
+      list[str]: path segments without empty path segments.
+    """
+    return list(filter(None, path.split(self._path_separator)))
+
+  def AddMember(self, path, member, is_directory=False):
+    """Adds a member to the index.
+
+    The directories that contain the member are added to the index as well.
+    A member with a path that is already in the index replaces the existing
+    member.
+
+    Args:
+      path (str): path of the member as stored in the archive.
+      member (object): member, such as a TAR info object, or a value to
+          look up the member with, such as its path.
+      is_directory (Optional[bool]): True if the member is a directory.
+          A member with a path that ends with the path separator is
+          considered a directory as well.
+    """
+    self._members[path] = member
+
+    path_segments = self._GetPathSegments(path)
+    if not path_segments:
+      return
+
+    if is_directory or path.endswith(self._path_separator):
+      last_directory_index = len(path_segments)
+    else:
+      last_directory_index = len(path_segments) - 1
+
+    directory_path = ''
+    for index, path_segment in enumerate(path_segments):
+      sub_entries = self._directories[directory_path]
+      if path_segment not in sub_entries:
+        sub_entries[path_segment] = None
+
+      if directory_path:
+        directory_path = self._path_separator.join([
+            directory_path, path_segment])
+      else:
+        directory_path = path_segment
+
+      if index < last_directory_index:
+        if directory_path not in self._directories:
+          self._directories[directory_path] = collections.OrderedDict()
+
+  def DirectoryExists(self, path):
+    """Determines if a directory exists.
+
+    Args:
+      path (str): path of the directory.
+
+    Returns:
+      bool: True if the directory exists, either as member or implied by
+          the paths of other members.
+    """
+    path = self._path_separator.join(self._GetPathSegments(path))
+    return path in self._directories
+
+  def GetMember(self, path):
+    """Retrieves a member.
+
+    Args:
+      path (str): path of the member as stored in the archive.
+
+    Returns:
+      object: member or None if not available.
+    """
+    return self._members.get(path, None)
+
+  def GetSubEntryNames(self, path):
+    """Retrieves the names of the sub entries of a directory.
+
+    Args:
+      path (str): path of the directory.
+
+    Returns:
+      list[str]: names of the sub entries, which is empty if the directory
+          does not exist.
+    """
+    path = self._path_separator.join(self._GetPathSegments(path))
+    sub_entries = self._directories.get(path, None)
+    if not sub_entries:
+      return []
+
+    return list(sub_entries.keys())
+
+  def PathExists(self, path):
+    """Determines if a path exists.
+
+    Args:
+      path (str): path.
+
+    Returns:
+      bool: True if the path refers to a member or a directory implied by
+          the paths of other members.
+    """
+    path_segments = self._GetPathSegments(path)
+    if not path_segments:
+      return True
+
+    directory_path = self._path_separator.join(path_segments[:-1])
+    sub_entries = self._directories.get(directory_path, None)
+    return bool(sub_entries) and path_segments[-1] in sub_entries
@@ -3,7 +3,9 @@
 
 from __future__ import unicode_literals
 
+import binascii
 import os
+import struct
 
 from dtfabric.runtime import fabric as dtfabric_fabric
 
@@ -96,6 +98,16 @@ class CPIOArchiveFile(data_format.DataFormat):
       'special_device_major_number', 'special_device_minor_number',
       'checksum')
 
+  # Structures used to decode all the values of a file entry header at once.
+  _CPIO_BINARY_BIG_ENDIAN_FILE_ENTRY_STRUCT = struct.Struct('>13H')
+  _CPIO_BINARY_LITTLE_ENDIAN_FILE_ENTRY_STRUCT = struct.Struct('<13H')
+  _CPIO_NEW_ASCII_FILE_ENTRY_VALUES_STRUCT = struct.Struct('>13I')
+  _CPIO_PORTABLE_ASCII_FILE_ENTRY_STRUCT = struct.Struct(
+      '6s6s6s6s6s6s6s6s11s6s11s')
+
+  # The size of the buffer used to read file entry headers.
+  _READ_BUFFER_SIZE = 64 * 1024
+
   def __init__(self):
     """Initializes a CPIO archive file."""
     super(CPIOArchiveFile, self).__init__()
@@ -103,6 +115,8 @@ class CPIOArchiveFile(data_format.DataFormat):
     self._file_object = None
     self._file_object_opened_in_object = False
     self._file_size = 0
+    self._read_buffer = b''
+    self._read_buffer_offset = 0
 
     self.file_format = None
 
@@ -228,26 +242,217 @@ class CPIOArchiveFile(data_format.DataFormat):
 
     return archive_file_entry
 
+  def _CreateFileEntry(self, path, file_entry_values):
+    """Creates a file entry.
+
+    Args:
+      path (str): path of the file entry.
+      file_entry_values (tuple[int, ...]): data offset, data size, group
+          identifier, inode number, mode, modification time, archive file
+          entry record size and user identifier of the file entry.
+
+    Returns:
+      CPIOArchiveFileEntry: a file entry.
+    """
+    archive_file_entry = CPIOArchiveFileEntry()
+
+    (archive_file_entry.data_offset, archive_file_entry.data_size,
+     archive_file_entry.group_identifier, archive_file_entry.inode_number,
+     archive_file_entry.mode, archive_file_entry.modification_time,
+     archive_file_entry.size,
+     archive_file_entry.user_identifier) = file_entry_values
+
+    archive_file_entry.path = path
+
+    return archive_file_entry
+
+  def _GetPaddingSize(self, file_offset):
+    """Determines the size of the padding after a file entry path or data.
+
+    Args:
+      file_offset (int): offset of the end of the file entry path or data.
+
+    Returns:
+      int: padding size.
+    """
+    if self.file_format in ('bin-big-endian', 'bin-little-endian'):
+      alignment = 2
+    elif self.file_format in ('crc', 'newc'):
+      alignment = 4
+    else:
+      return 0
+
+    padding_size = file_offset % alignment
+    if padding_size > 0:
+      padding_size = alignment - padding_size
+
+    return padding_size
+
+  def _ReadBufferedData(self, file_object, file_offset, data_size):
+    """Reads data using the read buffer.
+
+    Args:
+      file_object (FileIO): file-like object.
+      file_offset (int): offset of the data relative from the start of
+          the file-like object.
+      data_size (int): size of the data.
+
+    Returns:
+      bytes: data, which can be smaller than the requested size at the end
+          of the file-like object.
+    """
+    buffer_offset = file_offset - self._read_buffer_offset
+    if (buffer_offset < 0 or
+        buffer_offset + data_size > len(self._read_buffer)):
+      file_object.seek(file_offset, os.SEEK_SET)
+      self._read_buffer = file_object.read(
+          max(data_size, self._READ_BUFFER_SIZE))
+      self._read_buffer_offset = file_offset
+      buffer_offset = 0
+
+    return self._read_buffer[buffer_offset:buffer_offset + data_size]
+
+  def _ReadFileEntryHeaderValues(self, header_data):
+    """Reads the values of a file entry header.
+
+    Args:
+      header_data (bytes): file entry header data.
+
+    Returns:
+      tuple[int, ...]: inode number, mode, user identifier, group identifier,
+          modification time, path size and file size or None if the values
+          could not be decoded.
+    """
+    try:
+      if self.file_format == 'bin-big-endian':
+        values = self._CPIO_BINARY_BIG_ENDIAN_FILE_ENTRY_STRUCT.unpack(
+            header_data)
+
+      elif self.file_format == 'bin-little-endian':
+        values = self._CPIO_BINARY_LITTLE_ENDIAN_FILE_ENTRY_STRUCT.unpack(
+            header_data)
+
+      elif self.file_format == 'odc':
+        values = self._CPIO_PORTABLE_ASCII_FILE_ENTRY_STRUCT.unpack(
+            header_data)
+        return (
+            int(values[2], 8), int(values[3], 8), int(values[4], 8),
+            int(values[5], 8), int(values[8], 8), int(values[9], 8),
+            int(values[10], 8))
+
+      else:
+        # Decoding all the hexadecimal values at once is considerably faster
+        # than decoding them individually.
+        values = self._CPIO_NEW_ASCII_FILE_ENTRY_VALUES_STRUCT.unpack(
+            binascii.unhexlify(header_data[6:]))
+        return values[0:4] + (values[5], values[11], values[6])
+
+    except (TypeError, ValueError, struct.error):
+      return None
+
+    return (
+        values[2], values[3], values[4], values[5],
+        (values[8] << 16) | values[9], values[10],
+        (values[11] << 16) | values[12])
+
+  def _ReadFileEntryValues(self, file_object, file_offset):
+    """Reads the values of a file entry.
+
+    This function reads file entry headers through the read buffer and
+    decodes the header values with a single structure unpack. If the fast
+    decoding fails, for example due to leading white space in an ASCII
+    value, the file entry is read with _ReadFileEntry instead.
+
+    Args:
+      file_object (FileIO): file-like object.
+      file_offset (int): offset of the file entry relative from the start of
+          the file-like object.
+
+    Returns:
+      tuple[str, tuple[int, ...]]: path and values of the file entry, where
+          the values consist of the data offset, data size, group identifier,
+          inode number, mode, modification time, archive file entry record
+          size and user identifier.
+
+    Raises:
+      FileFormatError: if the file entry cannot be read.
+    """
+    if self.file_format in ('bin-big-endian', 'bin-little-endian'):
+      file_entry_data_size = self._CPIO_BINARY_BIG_ENDIAN_FILE_ENTRY_SIZE
+    elif self.file_format == 'odc':
+      file_entry_data_size = self._CPIO_PORTABLE_ASCII_FILE_ENTRY_SIZE
+    else:
+      file_entry_data_size = self._CPIO_NEW_ASCII_FILE_ENTRY_SIZE
+
+    header_data = self._ReadBufferedData(
+        file_object, file_offset, file_entry_data_size)
+    if len(header_data) != file_entry_data_size:
+      raise errors.FileFormatError((
+          'Unable to read file entry data at offset: 0x{0:08x} with error: '
+          'missing data').format(file_offset))
+
+    header_values = self._ReadFileEntryHeaderValues(header_data)
+    if header_values is None:
+      archive_file_entry = self._ReadFileEntry(file_object, file_offset)
+      return archive_file_entry.path, (
+          archive_file_entry.data_offset, archive_file_entry.data_size,
+          archive_file_entry.group_identifier,
+          archive_file_entry.inode_number, archive_file_entry.mode,
+          archive_file_entry.modification_time, archive_file_entry.size,
+          archive_file_entry.user_identifier)
+
+    (inode_number, mode, user_identifier, group_identifier,
+     modification_time, path_size, file_size) = header_values
+
+    path_offset = file_offset + file_entry_data_size
+    path_data = self._ReadBufferedData(file_object, path_offset, path_size)
+
+    # TODO: should this be ASCII?
+    path = path_data.decode('ascii')
+    path, _, _ = path.partition('\x00')
+
+    data_offset = path_offset + path_size
+    data_offset += self._GetPaddingSize(data_offset)
+
+    data_end_offset = data_offset + file_size
+    size = (
+        data_end_offset + self._GetPaddingSize(data_end_offset) - file_offset)
+
+    return path, (
+        data_offset, file_size, group_identifier, inode_number, mode,
+        modification_time, size, user_identifier)
+
   def _ReadFileEntries(self, file_object):
     """Reads the file entries from the cpio archive.
 
+    The file entry values are stored in a compact form and the file entries
+    are only created when they are accessed.
+
     Args:
       file_object (FileIO): file-like object.
     """
     self._file_entries = {}
 
-    file_offset = 0
-    while file_offset < self._file_size or self._file_size == 0:
-      file_entry = self._ReadFileEntry(file_object, file_offset)
-      file_offset += file_entry.size
-      if file_entry.path == 'TRAILER!!!':
-        break
+    try:
+      file_offset = 0
+      while file_offset < self._file_size or self._file_size == 0:
+        path, file_entry_values = self._ReadFileEntryValues(
+            file_object, file_offset)
 
-      if file_entry.path in self._file_entries:
-        # TODO: alert on file entries with duplicate paths?
-        continue
+        # The archive file entry record size is stored as the 7th value.
+        file_offset += file_entry_values[6]
+        if path == 'TRAILER!!!':
+          break
 
-      self._file_entries[file_entry.path] = file_entry
+        if path in self._file_entries:
+          # TODO: alert on file entries with duplicate paths?
+          continue
+
+        self._file_entries[path] = file_entry_values
+
+    finally:
+      self._read_buffer = b''
+      self._read_buffer_offset = 0
 
   def Close(self):
     """Closes the CPIO archive file."""
@@ -276,9 +481,25 @@ class CPIOArchiveFile(data_format.DataFormat):
       CPIOArchiveFileEntry: a CPIO archive file entry.
     """
     if self._file_entries:
-      for path, file_entry in iter(self._file_entries.items()):
+      for path, file_entry_values in iter(self._file_entries.items()):
         if path.startswith(path_prefix):
-          yield file_entry
+          yield self._CreateFileEntry(path, file_entry_values)
+
+  def GetFilePaths(self, path_prefix=''):
+    """Retrieves the paths of the file entries.
+
+    Unlike GetFileEntries, no CPIO archive file entries are created.
+
+    Args:
+      path_prefix (str): path prefix.
+
+    Yields:
+      str: path of a CPIO archive file entry.
+    """
+    if self._file_entries:
+      for path in iter(self._file_entries.keys()):
+        if path.startswith(path_prefix):
+          yield path
 
   def GetFileEntryByPath(self, path):
     """Retrieves a file entry for a specific path.
@@ -288,7 +509,12 @@ class CPIOArchiveFile(data_format.DataFormat):
     """
     if not self._file_entries:
       return None
-    return self._file_entries.get(path, None)
+
+    file_entry_values = self._file_entries.get(path, None)
+    if file_entry_values is None:
+      return None
+
+    return self._CreateFileEntry(path, file_entry_values)
 
   def Open(self, file_object):
     """Opens the CPIO archive file.
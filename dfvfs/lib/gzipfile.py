@@ -7,6 +7,7 @@
 
 from __future__ import unicode_literals
 
+import bisect
 import os
 
 from dtfabric.runtime import fabric as dtfabric_fabric
@@ -14,6 +15,7 @@ from dtfabric.runtime import fabric as dtfabric_fabric
 from dfvfs.compression import zlib_decompressor
 from dfvfs.lib import data_format
 from dfvfs.lib import errors
+from dfvfs.resolver import cache
 
 
 class _GzipDecompressorState(object):
@@ -43,6 +45,20 @@ class _GzipDecompressorState(object):
     self.uncompressed_offset = 0
     self._compressed_data = b''
 
+  def CopyState(self):
+    """Copies the decompressor state.
+
+    Returns:
+      _GzipDecompressorState: copy of the decompressor state.
+    """
+    # pylint: disable=protected-access
+    decompressor_state = self.__class__.__new__(self.__class__)
+    decompressor_state._compressed_data = self._compressed_data
+    decompressor_state._decompressor = self._decompressor.CopyState()
+    decompressor_state.last_read = self.last_read
+    decompressor_state.uncompressed_offset = self.uncompressed_offset
+    return decompressor_state
+
   def Read(self, file_object):
     """Reads the next uncompressed data from the gzip stream.
 
@@ -81,7 +97,18 @@ class GzipMember(data_format.DataFormat):
 
   Gzip files have no index of members, so each member must be read
   sequentially before metadata and random seeks are possible. This class
-  provides caching of gzip member data during the initial read of each member.
+  provides caching of gzip member data in aligned blocks of uncompressed
+  data, that are stored in a least recently used (LRU) block cache.
+
+  Blocked gzip format (BGZF) members, as created by bgzip, store the size of
+  the member in the extra field of the member header. The footer of such
+  members is read without decompressing the member data.
+
+  During the initial read access points are recorded, which are snapshots of
+  the decompressor state, including its 32 KiB history window, at intervals
+  of the uncompressed data. Reading data before the current position of
+  the decompressor resumes decompression from the nearest preceding access
+  point instead of the start of the member.
 
   Attributes:
     comment (str): comment stored in the member.
@@ -117,6 +144,11 @@ class GzipMember(data_format.DataFormat):
 
   _MEMBER_FOOTER_SIZE = _MEMBER_FOOTER.GetByteSize()
 
+  _EXTRA_SUBFIELD_HEADER = _DATA_TYPE_FABRIC.CreateDataTypeMap(
+      'gzip_extra_subfield_header')
+
+  _EXTRA_SUBFIELD_HEADER_SIZE = _EXTRA_SUBFIELD_HEADER.GetByteSize()
+
   _UINT16LE = _DATA_TYPE_FABRIC.CreateDataTypeMap('uint16le')
 
   _UINT16LE_SIZE = _UINT16LE.GetByteSize()
@@ -133,11 +165,28 @@ class GzipMember(data_format.DataFormat):
   _FLAG_FNAME = 0x08
   _FLAG_FCOMMENT = 0x10
 
-  # The maximum size of the uncompressed data cache.
+  # The identifiers of the BGZF extra subfield, which are "B" and "C".
+  _BGZF_SUBFIELD_IDENTIFIER1 = 0x42
+  _BGZF_SUBFIELD_IDENTIFIER2 = 0x43
+
+  # The maximum size of the uncompressed data cache, if the member does not
+  # share a block cache.
   _UNCOMPRESSED_DATA_CACHE_SIZE = 2 * 1024 * 1024
 
+  # The size of the blocks of uncompressed data in the cache.
+  _UNCOMPRESSED_DATA_BLOCK_SIZE = 64 * 1024
+
+  # The initial minimum distance between access points in the uncompressed
+  # data.
+  _ACCESS_POINT_INTERVAL = 1 * 1024 * 1024
+
+  # The maximum number of access points, where every access point holds
+  # a copy of the zlib decompressor state of about 40 KiB.
+  _MAXIMUM_NUMBER_OF_ACCESS_POINTS = 64
+
   def __init__(
-      self, file_object, member_start_offset, uncompressed_data_offset):
+      self, file_object, member_start_offset, uncompressed_data_offset,
+      block_cache=None):
     """Initializes a gzip member.
 
     Args:
@@ -146,19 +195,34 @@ class GzipMember(data_format.DataFormat):
           in the containing file.
       uncompressed_data_offset (int): current offset into the uncompressed data
           in the containing file.
+      block_cache (Optional[BlocksCache]): block cache, that can be shared
+          with other members, where None represents the member uses its own
+          block cache.
     """
+    if block_cache is None:
+      block_cache = cache.BlocksCache(self._UNCOMPRESSED_DATA_CACHE_SIZE)
+
     self.comment = None
     self.modification_time = None
     self.operating_system = None
     self.original_filename = None
 
-    # Offset into this member's uncompressed data of the first item in
-    # the cache.
-    self._cache_start_offset = None
-    # Offset into this member's uncompressed data of the last item in
-    # the cache.
-    self._cache_end_offset = None
-    self._cache = b''
+    self._block_cache = block_cache
+
+    # Size of the member as stored in the BGZF extra subfield.
+    self._bgzf_member_size = None
+
+    # Uncompressed data emitted by the decompressor that has not yet been
+    # stored in the block cache and its offset into this member's
+    # uncompressed data.
+    self._uncompressed_data = b''
+    self._uncompressed_data_offset = 0
+
+    # Snapshots of the decompressor state and their offsets into this member's
+    # uncompressed data.
+    self._access_point_interval = self._ACCESS_POINT_INTERVAL
+    self._access_points = []
+    self._access_points_offsets = []
 
     # Total size of the data in this gzip member after decompression.
     self.uncompressed_data_size = None
@@ -180,7 +244,11 @@ class GzipMember(data_format.DataFormat):
     self._decompressor_state = _GzipDecompressorState(
         self._compressed_data_start)
 
-    self._LoadDataIntoCache(file_object, 0, read_all_data=True)
+    member_footer_offset = self._GetBGZFMemberFooterOffset(file_object)
+    if member_footer_offset is None:
+      self._ReadMemberData(file_object)
+    else:
+      file_object.seek(member_footer_offset, os.SEEK_SET)
 
     # TODO: gracefully handle missing footer.
     self._ReadMemberFooter(file_object)
@@ -188,6 +256,208 @@ class GzipMember(data_format.DataFormat):
     # Offset to the end of the member in the parent file object.
     self.member_end_offset = file_object.get_offset()
 
+  def _AddAccessPoint(self):
+    """Adds an access point at the current decompressor state if needed.
+
+    When the maximum number of access points is exceeded, every other access
+    point is removed and the interval between access points is doubled,
+    so that the access points remain evenly spread over the uncompressed
+    data.
+    """
+    uncompressed_offset = self._decompressor_state.uncompressed_offset
+
+    if self._access_points_offsets:
+      last_access_point_offset = self._access_points_offsets[-1]
+    else:
+      last_access_point_offset = 0
+
+    if (uncompressed_offset - last_access_point_offset >=
+        self._access_point_interval):
+      self._access_points.append(self._decompressor_state.CopyState())
+      self._access_points_offsets.append(uncompressed_offset)
+
+      if len(self._access_points) > self._MAXIMUM_NUMBER_OF_ACCESS_POINTS:
+        self._access_points = self._access_points[1::2]
+        self._access_points_offsets = self._access_points_offsets[1::2]
+        self._access_point_interval *= 2
+
+  def _CacheUncompressedData(self, minimum_offset, end_of_member):
+    """Stores the complete blocks of the uncompressed data in the block cache.
+
+    Args:
+      minimum_offset (int): block aligned offset into this member's
+          uncompressed data of the first block to store.
+      end_of_member (bool): True if the uncompressed data contains the end of
+          the member, in which case the last partial block is stored as well.
+    """
+    block_size = self._UNCOMPRESSED_DATA_BLOCK_SIZE
+    data_offset = minimum_offset - self._uncompressed_data_offset
+    data_size = len(self._uncompressed_data)
+
+    while data_offset + block_size <= data_size or (
+        end_of_member and data_offset < data_size):
+      block_data = self._uncompressed_data[
+          data_offset:data_offset + block_size]
+      self._block_cache.SetBlock(
+          self, self._uncompressed_data_offset + data_offset, block_data)
+
+      data_offset += len(block_data)
+
+    self._uncompressed_data = self._uncompressed_data[data_offset:]
+    self._uncompressed_data_offset += data_offset
+
+  def _GetBGZFMemberFooterOffset(self, file_object):
+    """Determines the offset of the member footer from the BGZF member size.
+
+    Args:
+      file_object (FileIO): file-like object.
+
+    Returns:
+      int: offset of the member footer in the file-like object or None if
+          the member has no (valid) BGZF member size.
+    """
+    if not self._bgzf_member_size:
+      return None
+
+    member_end_offset = self.member_start_offset + self._bgzf_member_size
+    member_footer_offset = member_end_offset - self._MEMBER_FOOTER_SIZE
+
+    if (member_footer_offset < self._compressed_data_start or
+        member_end_offset > file_object.get_size()):
+      return None
+
+    return member_footer_offset
+
+  def _GetAccessPoint(self, offset):
+    """Retrieves the nearest access point at or before an offset.
+
+    Args:
+      offset (int): offset into this member's uncompressed data.
+
+    Returns:
+      _GzipDecompressorState: decompressor state of the access point or None
+          if there is no access point at or before the offset.
+    """
+    index = bisect.bisect_right(self._access_points_offsets, offset)
+    if index == 0:
+      return None
+
+    return self._access_points[index - 1]
+
+  def _LoadDataIntoCache(self, file_object, minimum_offset):
+    """Reads and decompresses the data of the block that contains an offset.
+
+    Other complete blocks that are decompressed while doing so are stored in
+    the block cache as well.
+
+    Args:
+      file_object (FileIO): file-like object.
+      minimum_offset (int): offset into this member's uncompressed data.
+
+    Returns:
+      bytes: uncompressed data of the block that contains the offset.
+    """
+    block_offset = minimum_offset - (
+        minimum_offset % self._UNCOMPRESSED_DATA_BLOCK_SIZE)
+
+    # Decompression can only be performed from beginning to end of the stream.
+    # So, if data before the current position of the decompressor in the stream
+    # is required, it's necessary to throw away the current decompression
+    # state and continue from the nearest preceding access point. An access
+    # point is also used to skip ahead if it is closer to the required data.
+    decompressor_offset = self._decompressor_state.uncompressed_offset
+
+    access_point_offset = 0
+    access_point = self._GetAccessPoint(block_offset)
+    if access_point:
+      access_point_offset = access_point.uncompressed_offset
+
+    if (block_offset < self._uncompressed_data_offset or
+        access_point_offset > decompressor_offset):
+      self._RestoreDecompressorState(block_offset)
+
+    block_end_offset = block_offset + self._UNCOMPRESSED_DATA_BLOCK_SIZE
+
+    end_of_member = False
+    while self._decompressor_state.uncompressed_offset < block_end_offset:
+      decompressed_data, end_of_member = self._ReadUncompressedData(
+          file_object)
+
+      self._uncompressed_data = b''.join([
+          self._uncompressed_data, decompressed_data])
+
+      # Data before the block is not needed.
+      data_offset = min(
+          block_offset - self._uncompressed_data_offset,
+          len(self._uncompressed_data))
+      if data_offset > 0:
+        self._uncompressed_data = self._uncompressed_data[data_offset:]
+        self._uncompressed_data_offset += data_offset
+
+      if end_of_member:
+        break
+
+    data_offset = block_offset - self._uncompressed_data_offset
+    block_data = self._uncompressed_data[
+        data_offset:data_offset + self._UNCOMPRESSED_DATA_BLOCK_SIZE]
+
+    self._CacheUncompressedData(block_offset, end_of_member)
+
+    if end_of_member:
+      self._ResetDecompressorState()
+
+    return block_data
+
+  def _ParseExtraFieldData(self, extra_field_data, file_offset):
+    """Parses the extra field data of a member header.
+
+    Args:
+      extra_field_data (bytes): extra field data.
+      file_offset (int): offset of the extra field data relative from the start
+          of the file-like object.
+
+    Raises:
+      FileFormatError: if the extra field data cannot be parsed.
+    """
+    data_offset = 0
+    data_size = len(extra_field_data)
+
+    while data_offset + self._EXTRA_SUBFIELD_HEADER_SIZE <= data_size:
+      subfield_header = self._ReadStructureFromByteStream(
+          extra_field_data[data_offset:], file_offset + data_offset,
+          self._EXTRA_SUBFIELD_HEADER, 'extra subfield header')
+
+      data_offset += self._EXTRA_SUBFIELD_HEADER_SIZE
+
+      subfield_data = extra_field_data[
+          data_offset:data_offset + subfield_header.data_size]
+
+      if (subfield_header.identifier1 == self._BGZF_SUBFIELD_IDENTIFIER1 and
+          subfield_header.identifier2 == self._BGZF_SUBFIELD_IDENTIFIER2 and
+          len(subfield_data) == self._UINT16LE_SIZE):
+        bgzf_block_size = self._ReadStructureFromByteStream(
+            subfield_data, file_offset + data_offset, self._UINT16LE,
+            'BGZF block size')
+
+        # The BGZF block size is the size of the member minus 1.
+        self._bgzf_member_size = bgzf_block_size + 1
+
+      data_offset += subfield_header.data_size
+
+  def _ReadMemberData(self, file_object):
+    """Reads and decompresses all the data in the member.
+
+    Access points are recorded while the data is decompressed.
+
+    Args:
+      file_object (FileIO): file-like object.
+    """
+    end_of_member = False
+    while not end_of_member:
+      _, end_of_member = self._ReadUncompressedData(file_object)
+
+    self._ResetDecompressorState()
+
   def _ReadMemberHeader(self, file_object):
     """Reads a member header.
 
@@ -220,7 +490,11 @@ class GzipMember(data_format.DataFormat):
           file_object, file_offset, self._UINT16LE_SIZE,
           self._UINT16LE, 'extra field data size')
 
-      file_object.seek(extra_field_data_size, os.SEEK_CUR)
+      file_offset = file_object.get_offset()
+      extra_field_data = self._ReadData(
+          file_object, file_offset, extra_field_data_size, 'extra field data')
+
+      self._ParseExtraFieldData(extra_field_data, file_offset)
 
     if member_header.flags & self._FLAG_FNAME:
       file_offset = file_object.get_offset()
@@ -255,16 +529,99 @@ class GzipMember(data_format.DataFormat):
 
     self.uncompressed_data_size = member_footer.uncompressed_data_size
 
+  def _ReadUncompressedData(self, file_object):
+    """Reads and decompresses the next compressed data in the member.
+
+    Args:
+      file_object (FileIO): file-like object.
+
+    Returns:
+      tuple[bytes, bool]: uncompressed data and True if the end of the member
+          was reached.
+    """
+    decompressed_data = self._decompressor_state.Read(file_object)
+
+    # If there's no more data in the member, the unused_data value is
+    # populated in the decompressor. When this situation arises, we rewind
+    # to the end of the compressed_data section.
+    unused_data = self._decompressor_state.GetUnusedData()
+    if unused_data:
+      seek_offset = -len(unused_data)
+      file_object.seek(seek_offset, os.SEEK_CUR)
+      return decompressed_data, True
+
+    # Note that decompressed_data will be empty if there is no data left
+    # to read and decompress, but also if the compressed data read does not
+    # contain the end of a deflate block.
+    if (not decompressed_data and
+        self._decompressor_state.last_read >= file_object.get_size()):
+      return decompressed_data, True
+
+    self._AddAccessPoint()
+
+    return decompressed_data, False
+
   def _ResetDecompressorState(self):
     """Resets the state of the internal decompression object."""
     self._decompressor_state = _GzipDecompressorState(
         self._compressed_data_start)
+    self._uncompressed_data = b''
+    self._uncompressed_data_offset = 0
+
+  def _RestoreDecompressorState(self, offset):
+    """Restores the state of the internal decompression object.
+
+    The decompression object is restored from the nearest access point at or
+    before the offset, or reset if there is no such access point.
+
+    Args:
+      offset (int): offset into this member's uncompressed data.
+    """
+    access_point = self._GetAccessPoint(offset)
+    if not access_point:
+      self._ResetDecompressorState()
+    else:
+      # A copy is used so that the access point can be restored again.
+      self._decompressor_state = access_point.CopyState()
+      self._uncompressed_data = b''
+      self._uncompressed_data_offset = access_point.uncompressed_offset
+
+  @staticmethod
+  def DecompressData(compressed_data):
+    """Decompresses the compressed data of a member.
+
+    This function does not change the state of the member, hence it can be
+    called from a worker thread.
+
+    Args:
+      compressed_data (bytes): compressed data of the member.
+
+    Returns:
+      bytes: uncompressed data of the member.
+
+    Raises:
+      BackEndError: if the compressed data cannot be decompressed.
+    """
+    decompressor = zlib_decompressor.DeflateDecompressor()
+    uncompressed_data, _ = decompressor.Decompress(compressed_data)
+    return uncompressed_data
+
+  def CacheUncompressedData(self, uncompressed_data):
+    """Stores the uncompressed data of the entire member in the block cache.
+
+    Args:
+      uncompressed_data (bytes): uncompressed data of the member, for example
+          as returned by DecompressData.
+    """
+    self._uncompressed_data = uncompressed_data
+    self._uncompressed_data_offset = 0
+
+    self._CacheUncompressedData(0, True)
+    self._ResetDecompressorState()
 
   def FlushCache(self):
     """Empties the cache that holds cached decompressed data."""
-    self._cache = b''
-    self._cache_start_offset = None
-    self._cache_end_offset = None
+    self._block_cache.RemoveBlocks(self)
     self._ResetDecompressorState()
 
   def GetCacheSize(self):
@@ -273,17 +630,34 @@ class GzipMember(data_format.DataFormat):
     Returns:
       int: number of cached bytes.
     """
-    if not self._cache_start_offset or not self._cache_end_offset:
-      return 0
-    return self._cache_end_offset - self._cache_start_offset
+    return self._block_cache.GetDataSize(self)
 
   def IsCacheFull(self):
     """Checks whether the uncompressed data cache is full.
 
+    Note that the cache can be shared with other members.
+
     Returns:
       bool: True if the cache is full.
     """
-    return self.GetCacheSize() >= self._UNCOMPRESSED_DATA_CACHE_SIZE
+    return self._block_cache.IsFull()
+
+  def ReadCompressedData(self):
+    """Reads the compressed data of the member.
+
+    Returns:
+      bytes: compressed data of the member.
+
+    Raises:
+      FileFormatError: if the compressed data cannot be read.
+    """
+    compressed_data_size = (
+        self.member_end_offset - self._MEMBER_FOOTER_SIZE -
+        self._compressed_data_start)
+
+    return self._ReadData(
+        self._file_object, self._compressed_data_start, compressed_data_size,
+        'compressed data')
 
   def ReadAtOffset(self, offset, size=None):
     """Reads a byte string from the gzip member at the specified offset.
@@ -295,8 +669,8 @@ class GzipMember(data_format.DataFormat):
       offset (int): offset within the uncompressed data in this member to
         read from.
       size (Optional[int]): maximum number of bytes to read, where None
-          represents all remaining data, to a maximum of the uncompressed
-          cache size.
+          represents all remaining data, to a maximum of the end of
+          the uncompressed data block that contains the offset.
 
     Returns:
       bytes: data read.
@@ -314,83 +688,14 @@ class GzipMember(data_format.DataFormat):
     if size == 0 or offset >= self.uncompressed_data_size:
       return b''
 
-    if self._cache_start_offset is None:
-      self._LoadDataIntoCache(self._file_object, offset)
+    block_offset = offset - (offset % self._UNCOMPRESSED_DATA_BLOCK_SIZE)
 
-    if offset > self._cache_end_offset or offset < self._cache_start_offset:
-      self.FlushCache()
-      self._LoadDataIntoCache(self._file_object, offset)
+    block_data = self._block_cache.GetBlock(self, block_offset)
+    if block_data is None:
+      block_data = self._LoadDataIntoCache(self._file_object, offset)
 
-    cache_offset = offset - self._cache_start_offset
+    data_offset = offset - block_offset
     if not size:
-      return self._cache[cache_offset:]
-
-    data_end_offset = cache_offset + size
-
-    if data_end_offset > self._cache_end_offset:
-      return self._cache[cache_offset:]
-
-    return self._cache[cache_offset:data_end_offset]
-
-  def _LoadDataIntoCache(
-      self, file_object, minimum_offset, read_all_data=False):
-    """Reads and decompresses the data in the member.
+      return block_data[data_offset:]
 
-    This function already loads as much data as possible in the cache, up to
-    UNCOMPRESSED_DATA_CACHE_SIZE bytes.
-
-    Args:
-      file_object (FileIO): file-like object.
-      minimum_offset (int): offset into this member's uncompressed data at
-          which the cache should start.
-      read_all_data (bool): True if all the compressed data should be read
-          from the member.
-    """
-    # Decompression can only be performed from beginning to end of the stream.
-    # So, if data before the current position of the decompressor in the stream
-    # is required, it's necessary to throw away the current decompression
-    # state and start again.
-    if minimum_offset < self._decompressor_state.uncompressed_offset:
-      self._ResetDecompressorState()
-
-    while not self.IsCacheFull() or read_all_data:
-      decompressed_data = self._decompressor_state.Read(file_object)
-      # Note that decompressed_data will be empty if there is no data left
-      # to read and decompress.
-      if not decompressed_data:
-        break
-
-      decompressed_data_length = len(decompressed_data)
-      decompressed_end_offset = self._decompressor_state.uncompressed_offset
-      decompressed_start_offset = (
-          decompressed_end_offset - decompressed_data_length)
-
-      data_to_add = decompressed_data
-      added_data_start_offset = decompressed_start_offset
-
-      if decompressed_start_offset < minimum_offset:
-        data_to_add = None
-
-      if decompressed_start_offset < minimum_offset < decompressed_end_offset:
-        data_add_offset = decompressed_end_offset - minimum_offset
-        data_to_add = decompressed_data[-data_add_offset]
-        added_data_start_offset = decompressed_end_offset - data_add_offset
-
-      if not self.IsCacheFull() and data_to_add:
-        self._cache = b''.join([self._cache, data_to_add])
-        if self._cache_start_offset is None:
-          self._cache_start_offset = added_data_start_offset
-        if self._cache_end_offset is None:
-          self._cache_end_offset = self._cache_start_offset + len(data_to_add)
-        else:
-          self._cache_end_offset += len(data_to_add)
-
-      # If there's no more data in the member, the unused_data value is
-      # populated in the decompressor. When this situation arises, we rewind
-      # to the end of the compressed_data section.
-      unused_data = self._decompressor_state.GetUnusedData()
-      if unused_data:
-        seek_offset = -len(unused_data)
-        file_object.seek(seek_offset, os.SEEK_CUR)
-        self._ResetDecompressorState()
-        break
+    return block_data[data_offset:data_offset + size]
@@ -28,6 +28,8 @@ class SQLiteDatabaseFile(object):
 
   _NUMBER_OF_ROWS_QUERY = 'SELECT COUNT(*) FROM {0:s}'
 
+  _READ_BLOB_QUERY = 'SELECT substr({1:s}, ?, ?) FROM {0:s} WHERE rowid = ?'
+
   def __init__(self):
     """Initializes the database file object."""
     super(SQLiteDatabaseFile, self).__init__()
@@ -191,7 +193,6 @@ class SQLiteDatabaseFile(object):
     data = file_object.read(len(self._HEADER_SIGNATURE))
 
     if data != self._HEADER_SIGNATURE:
-      file_object.close()
       raise IOError('Unsupported SQLite database signature.')
 
     with tempfile.NamedTemporaryFile(delete=False) as temp_file:
@@ -204,6 +205,37 @@ class SQLiteDatabaseFile(object):
     self._connection.text_factory = bytes
     self._cursor = self._connection.cursor()
 
+  def OpenBlob(self, table_name, column_name, row_identifier):
+    """Opens a blob for incremental reading.
+
+    Args:
+      table_name (str): name of the table.
+      column_name (str): name of the column.
+      row_identifier (int): row identifier (rowid) of the row.
+
+    Returns:
+      sqlite3.Blob: blob or None if incremental blob reading is not supported
+          by the sqlite3 module.
+
+    Raises:
+      IOError: if the database file is not opened or the blob cannot be
+          opened.
+      OSError: if the database file is not opened or the blob cannot be
+          opened.
+    """
+    if not self._connection:
+      raise IOError('Not opened.')
+
+    # Connection.blobopen() was added in Python 3.11.
+    if not hasattr(self._connection, 'blobopen'):
+      return None
+
+    try:
+      return self._connection.blobopen(
+          table_name, column_name, row_identifier, readonly=True)
+    except sqlite3.Error as exception:
+      raise IOError('Unable to open blob with error: {0!s}'.format(exception))
+
   def Query(self, query, parameters=None):
     """Queries the database file.
 
@@ -213,13 +245,50 @@ class SQLiteDatabaseFile(object):
 
     Returns:
       list[sqlite3.Row]: rows resulting from the query.
+
+    Raises:
+      IOError: if the query failed.
+      OSError: if the query failed.
     """
     # TODO: catch Warning and return None.
     # Note that we cannot pass parameters as a keyword argument here.
     # A parameters value of None is not supported.
-    if parameters:
-      self._cursor.execute(query, parameters)
-    else:
-      self._cursor.execute(query)
+    try:
+      if parameters:
+        self._cursor.execute(query, parameters)
+      else:
+        self._cursor.execute(query)
+
+    except sqlite3.Error as exception:
+      raise IOError('Unable to query database with error: {0!s}'.format(
+          exception))
 
     return self._cursor.fetchall()
+
+  def ReadBlob(self, table_name, column_name, row_identifier, offset, size):
+    """Reads a range of data from a blob.
+
+    Args:
+      table_name (str): name of the table.
+      column_name (str): name of the column.
+      row_identifier (int): row identifier (rowid) of the row.
+      offset (int): offset of the data within the blob.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._connection:
+      raise IOError('Not opened.')
+
+    # Note that substr() uses 1-based offsets.
+    query = self._READ_BLOB_QUERY.format(table_name, column_name)
+    rows = self.Query(query, parameters=(offset + 1, size, row_identifier))
+    if not rows or rows[0][0] is None:
+      return b''
+
+    return bytes(rows[0][0])
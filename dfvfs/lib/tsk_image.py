@@ -8,13 +8,28 @@ import pytsk3
 
 
 class TSKFileSystemImage(pytsk3.Img_Info):
-  """Pytsk3 image object using a file-like object."""
+  """Pytsk3 image object using a file-like object.
 
-  def __init__(self, file_object):
+  The SleuthKit repeatedly reads the same metadata, such as inode tables and
+  directory blocks. Reads of at most the block size can be served from
+  a blocks cache of sector aligned data, which can be shared by multiple image
+  objects that read from the same file-like object.
+  """
+
+  # The size of a cached block, which is a multiple of the sector size and
+  # corresponds to the size of the reads of the image cache of the SleuthKit.
+  _BLOCK_SIZE = 64 * 1024
+
+  def __init__(self, file_object, blocks_cache=None, identifier=None):
     """Initializes an image object.
 
     Args:
       file_object (FileIO): file-like object.
+      blocks_cache (Optional[BlocksCache]): blocks cache, where None
+          represents no data is cached.
+      identifier (Optional[str]): identifier of the data of the file-like
+          object in the blocks cache, such as the comparable of its path
+          specification, where None represents no data is cached.
 
     Raises:
       ValueError: if the file-like object is invalid.
@@ -23,7 +38,13 @@ class TSKFileSystemImage(pytsk3.Img_Info):
       raise ValueError('Missing file-like object.')
 
     # pytsk3.Img_Info does not let you set attributes after initialization.
+    self._blocks_cache = None
     self._file_object = file_object
+    self._identifier = None
+
+    if blocks_cache is not None and identifier is not None:
+      self._blocks_cache = blocks_cache
+      self._identifier = identifier
     # Using the old parent class invocation style otherwise some versions
     # of pylint complain also setting type to RAW or EXTERNAL to make sure
     # Img_Info does not do detection.
@@ -33,12 +54,36 @@ class TSKFileSystemImage(pytsk3.Img_Info):
     # string in Python 3. Hence the string is not prefixed.
     pytsk3.Img_Info.__init__(self, url='', type=tsk_img_type)
 
+  def _ReadBlock(self, block_offset):
+    """Reads a block.
+
+    Args:
+      block_offset (int): offset of the block, which is a multiple of
+          the block size.
+
+    Returns:
+      bytes: block data.
+    """
+    block_data = self._blocks_cache.GetBlock(self._identifier, block_offset)
+    if block_data is None:
+      self._file_object.seek(block_offset, os.SEEK_SET)
+      block_data = self._file_object.read(self._BLOCK_SIZE)
+
+      # Only complete blocks and the last block are cached, since a partial
+      # block can be the result of a short read.
+      if (len(block_data) == self._BLOCK_SIZE or
+          block_offset + len(block_data) == self._file_object.get_size()):
+        self._blocks_cache.SetBlock(self._identifier, block_offset, block_data)
+
+    return block_data
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the pytsk3.Img_Info object interface.
   # pylint: disable=invalid-name
 
   def close(self):
     """Closes the volume IO object."""
+    self._blocks_cache = None
     self._file_object = None
 
   def read(self, offset, size):
@@ -51,8 +96,30 @@ class TSKFileSystemImage(pytsk3.Img_Info):
     Returns:
       bytes: data read.
     """
-    self._file_object.seek(offset, os.SEEK_SET)
-    return self._file_object.read(size)
+    if self._blocks_cache is None or size > self._BLOCK_SIZE:
+      self._file_object.seek(offset, os.SEEK_SET)
+      return self._file_object.read(size)
+
+    data_segments = []
+    data_size = 0
+
+    while data_size < size:
+      block_offset = offset - (offset % self._BLOCK_SIZE)
+      block_data = self._ReadBlock(block_offset)
+
+      data_offset = offset - block_offset
+      data_segment = block_data[data_offset:data_offset + size - data_size]
+      if not data_segment:
+        break
+
+      data_segments.append(data_segment)
+      data_size += len(data_segment)
+      offset += len(data_segment)
+
+      if len(block_data) < self._BLOCK_SIZE:
+        break
+
+    return b''.join(data_segments)
 
   def get_size(self):
     """Retrieves the size."""
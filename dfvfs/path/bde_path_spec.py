@@ -43,9 +43,12 @@ class BDEPathSpec(path_spec.PathSpec):
     self.recovery_password = recovery_password
     self.startup_key = startup_key
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
     string_parts = []
 
     if self.password:
@@ -56,7 +59,7 @@ class BDEPathSpec(path_spec.PathSpec):
     if self.startup_key:
       string_parts.append('startup_key: {0:s}'.format(self.startup_key))
 
-    return self._GetComparable(sub_comparable_string=', '.join(string_parts))
+    return ', '.join(string_parts)
 
 
 factory.Factory.RegisterPathSpec(BDEPathSpec)
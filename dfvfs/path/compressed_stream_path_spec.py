@@ -35,12 +35,13 @@ class CompressedStreamPathSpec(path_spec.PathSpec):
     super(CompressedStreamPathSpec, self).__init__(parent=parent, **kwargs)
     self.compression_method = compression_method
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
-    sub_comparable_string = (
-        'compression_method: {0:s}').format(self.compression_method)
-    return self._GetComparable(sub_comparable_string=sub_comparable_string)
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
+    return 'compression_method: {0:s}'.format(self.compression_method)
 
 
 factory.Factory.RegisterPathSpec(CompressedStreamPathSpec)
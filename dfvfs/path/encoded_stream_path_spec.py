@@ -35,12 +35,13 @@ class EncodedStreamPathSpec(path_spec.PathSpec):
     super(EncodedStreamPathSpec, self).__init__(parent=parent, **kwargs)
     self.encoding_method = encoding_method
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
-    sub_comparable_string = 'encoding_method: {0:s}'.format(
-        self.encoding_method)
-    return self._GetComparable(sub_comparable_string=sub_comparable_string)
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
+    return 'encoding_method: {0:s}'.format(self.encoding_method)
 
 
 factory.Factory.RegisterPathSpec(EncodedStreamPathSpec)
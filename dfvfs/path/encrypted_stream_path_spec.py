@@ -48,9 +48,12 @@ class EncryptedStreamPathSpec(path_spec.PathSpec):
     self.initialization_vector = initialization_vector
     self.key = key
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
     string_parts = []
 
     if self.cipher_mode:
@@ -71,7 +74,7 @@ class EncryptedStreamPathSpec(path_spec.PathSpec):
       key = key.decode('ascii')
       string_parts.append('key: {0:s}'.format(key))
 
-    return self._GetComparable(sub_comparable_string=', '.join(string_parts))
+    return ', '.join(string_parts)
 
 
 factory.Factory.RegisterPathSpec(EncryptedStreamPathSpec)
@@ -29,8 +29,10 @@ class LocationPathSpec(path_spec.PathSpec):
     super(LocationPathSpec, self).__init__(parent=parent, **kwargs)
     self.location = location
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
-    sub_comparable_string = 'location: {0:s}'.format(self.location)
-    return self._GetComparable(sub_comparable_string=sub_comparable_string)
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
+    return 'location: {0:s}'.format(self.location)
@@ -34,11 +34,13 @@ class MountPathSpec(path_spec.PathSpec):
     super(MountPathSpec, self).__init__(parent=None, **kwargs)
     self.identifier = identifier
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
-    sub_comparable_string = 'identifier: {0:s}'.format(self.identifier)
-    return self._GetComparable(sub_comparable_string=sub_comparable_string)
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
+    return 'identifier: {0:s}'.format(self.identifier)
 
 
 factory.Factory.RegisterPathSpec(MountPathSpec)
@@ -51,9 +51,12 @@ class NTFSPathSpec(path_spec.PathSpec):
     self.mft_attribute = mft_attribute
     self.mft_entry = mft_entry
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
     string_parts = []
 
     if self.data_stream:
@@ -65,7 +68,7 @@ class NTFSPathSpec(path_spec.PathSpec):
     if self.mft_entry is not None:
       string_parts.append('MFT entry: {0:d}'.format(self.mft_entry))
 
-    return self._GetComparable(sub_comparable_string=', '.join(string_parts))
+    return ', '.join(string_parts)
 
 
 factory.Factory.RegisterPathSpec(NTFSPathSpec)
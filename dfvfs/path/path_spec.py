@@ -34,6 +34,7 @@ class PathSpec(object):
           ', '.join(kwargs)))
 
     super(PathSpec, self).__init__()
+    self._comparable_cache = None
     self.parent = parent
 
     if not getattr(self, 'TYPE_INDICATOR', None):
@@ -47,32 +48,78 @@ class PathSpec(object):
     """Returns the hash of a path specification."""
     return hash(self.comparable)
 
+  def __setattr__(self, name, value):
+    """Sets an attribute.
+
+    Setting a public attribute invalidates the cached comparable.
+
+    Args:
+      name (str): name of the attribute.
+      value (object): value of the attribute.
+    """
+    if not name.startswith('_'):
+      object.__setattr__(self, '_comparable_cache', None)
+    object.__setattr__(self, name, value)
+
   def _GetComparable(self, sub_comparable_string=''):
     """Retrieves the comparable representation.
 
     This is a convenience function for constructing comparables.
 
+    The comparable is cached and reused as long as the sub comparable string
+    and the comparable of the parent are unchanged. The comparable of the
+    parent is used as prefix, hence parents share their cached comparable
+    with their children.
+
     Args:
       sub_comparable_string (str): sub comparable string.
 
     Returns:
       str: comparable representation of the path specification.
     """
+    parent_comparable = getattr(self.parent, 'comparable', '')
+
+    comparable_cache = self._comparable_cache
+    if (comparable_cache and comparable_cache[0] is parent_comparable and
+        comparable_cache[1] == sub_comparable_string):
+      return comparable_cache[2]
+
     string_parts = []
 
-    string_parts.append(getattr(self.parent, 'comparable', ''))
+    string_parts.append(parent_comparable)
     string_parts.append('type: {0:s}'.format(self.type_indicator))
 
     if sub_comparable_string:
       string_parts.append(', {0:s}'.format(sub_comparable_string))
     string_parts.append('\n')
 
-    return ''.join(string_parts)
+    comparable = ''.join(string_parts)
+    self._comparable_cache = (
+        parent_comparable, sub_comparable_string, comparable)
+
+    return comparable
+
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
+    return ''
 
   @property
   def comparable(self):
     """str: comparable representation of the path specification."""
-    return self._GetComparable()
+    # The cached comparable is invalidated when a public attribute is set and
+    # is only valid as long as the parent returns the same comparable. Since
+    # the same string object is returned, its hash is only calculated once.
+    comparable_cache = self._comparable_cache
+    if comparable_cache and comparable_cache[0] is getattr(
+        self.parent, 'comparable', ''):
+      return comparable_cache[2]
+
+    return self._GetComparable(
+        sub_comparable_string=self._GetSubComparableString())
 
   @property
   def type_indicator(self):
@@ -88,7 +135,7 @@ class PathSpec(object):
     """
     path_spec_dict = {}
     for attribute_name, attribute_value in iter(self.__dict__.items()):
-      if attribute_value is None:
+      if attribute_value is None or attribute_name.startswith('_'):
         continue
 
       if attribute_name == 'parent':
@@ -59,9 +59,12 @@ class SQLiteBlobPathSpec(path_spec.PathSpec):
     self.row_index = row_index
     self.table_name = table_name
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
     string_parts = []
 
     string_parts.append('table name: {0:s}'.format(self.table_name))
@@ -76,7 +79,7 @@ class SQLiteBlobPathSpec(path_spec.PathSpec):
     if self.row_index is not None:
       string_parts.append('row index: {0:d}'.format(self.row_index))
 
-    return self._GetComparable(sub_comparable_string=', '.join(string_parts))
+    return ', '.join(string_parts)
 
 
 factory.Factory.RegisterPathSpec(SQLiteBlobPathSpec)
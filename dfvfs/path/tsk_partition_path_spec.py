@@ -43,9 +43,12 @@ class TSKPartitionPathSpec(path_spec.PathSpec):
     self.part_index = part_index
     self.start_offset = start_offset
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
     string_parts = []
 
     if self.location is not None:
@@ -55,7 +58,7 @@ class TSKPartitionPathSpec(path_spec.PathSpec):
     if self.start_offset is not None:
       string_parts.append('start offset: 0x{0:08x}'.format(self.start_offset))
 
-    return self._GetComparable(sub_comparable_string=', '.join(string_parts))
+    return ', '.join(string_parts)
 
 
 factory.Factory.RegisterPathSpec(TSKPartitionPathSpec)
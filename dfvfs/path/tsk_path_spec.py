@@ -46,9 +46,12 @@ class TSKPathSpec(path_spec.PathSpec):
     self.inode = inode
     self.location = location
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
     string_parts = []
 
     if self.data_stream:
@@ -58,7 +61,7 @@ class TSKPathSpec(path_spec.PathSpec):
     if self.location is not None:
       string_parts.append('location: {0:s}'.format(self.location))
 
-    return self._GetComparable(sub_comparable_string=', '.join(string_parts))
+    return ', '.join(string_parts)
 
 
 factory.Factory.RegisterPathSpec(TSKPathSpec)
@@ -38,9 +38,12 @@ class VShadowPathSpec(path_spec.PathSpec):
     self.location = location
     self.store_index = store_index
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
     string_parts = []
 
     if self.location is not None:
@@ -48,7 +51,7 @@ class VShadowPathSpec(path_spec.PathSpec):
     if self.store_index is not None:
       string_parts.append('store index: {0:d}'.format(self.store_index))
 
-    return self._GetComparable(sub_comparable_string=', '.join(string_parts))
+    return ', '.join(string_parts)
 
 
 factory.Factory.RegisterPathSpec(VShadowPathSpec)
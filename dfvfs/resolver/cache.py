@@ -3,6 +3,9 @@
 
 from __future__ import unicode_literals
 
+import abc
+import collections
+
 from dfvfs.lib import errors
 
 
@@ -44,14 +47,109 @@ class ObjectsCacheValue(object):
     return self._reference_count == 0
 
 
+class ObjectsCacheEvictionPolicy(object):
+  """Resolver objects cache eviction policy interface.
+
+  The eviction policy determines the order in which cached values are
+  considered for eviction when the cache is full.
+  """
+
+  @abc.abstractmethod
+  def AddIdentifier(self, identifier):
+    """Adds an identifier of a newly cached value.
+
+    Args:
+      identifier (str): VFS object identifier.
+    """
+
+  @abc.abstractmethod
+  def Empty(self):
+    """Empties the eviction policy."""
+
+  @abc.abstractmethod
+  def GetEvictionCandidates(self):
+    """Retrieves the identifiers in the order they should be evicted.
+
+    Returns:
+      list[str]: VFS object identifiers, where the first identifier is
+          the preferred eviction candidate.
+    """
+
+  @abc.abstractmethod
+  def RemoveIdentifier(self, identifier):
+    """Removes an identifier of a value that is no longer cached.
+
+    Args:
+      identifier (str): VFS object identifier.
+    """
+
+  @abc.abstractmethod
+  def TouchIdentifier(self, identifier):
+    """Marks the value of an identifier as used.
+
+    Args:
+      identifier (str): VFS object identifier.
+    """
+
+
+class LRUObjectsCacheEvictionPolicy(ObjectsCacheEvictionPolicy):
+  """Least recently used (LRU) resolver objects cache eviction policy."""
+
+  def __init__(self):
+    """Initializes a least recently used eviction policy."""
+    super(LRUObjectsCacheEvictionPolicy, self).__init__()
+    self._identifiers = collections.OrderedDict()
+
+  def AddIdentifier(self, identifier):
+    """Adds an identifier of a newly cached value.
+
+    Args:
+      identifier (str): VFS object identifier.
+    """
+    self._identifiers.pop(identifier, None)
+    self._identifiers[identifier] = True
+
+  def Empty(self):
+    """Empties the eviction policy."""
+    self._identifiers.clear()
+
+  def GetEvictionCandidates(self):
+    """Retrieves the identifiers in the order they should be evicted.
+
+    Returns:
+      list[str]: VFS object identifiers, from least to most recently used.
+    """
+    return list(self._identifiers.keys())
+
+  def RemoveIdentifier(self, identifier):
+    """Removes an identifier of a value that is no longer cached.
+
+    Args:
+      identifier (str): VFS object identifier.
+    """
+    self._identifiers.pop(identifier, None)
+
+  def TouchIdentifier(self, identifier):
+    """Marks the value of an identifier as used.
+
+    Args:
+      identifier (str): VFS object identifier.
+    """
+    # Note that OrderedDict.move_to_end() is not supported by Python 2.
+    if self._identifiers.pop(identifier, None):
+      self._identifiers[identifier] = True
+
+
 class ObjectsCache(object):
   """Resolver object cache."""
 
-  def __init__(self, maximum_number_of_cached_values):
+  def __init__(self, maximum_number_of_cached_values, eviction_policy=None):
     """Initializes the resolver objects cache object.
 
     Args:
       maximum_number_of_cached_values (int): maximum number of cached values.
+      eviction_policy (Optional[ObjectsCacheEvictionPolicy]): eviction policy,
+          where None represents least recently used (LRU).
 
     Raises:
       ValueError: when the maximum number of cached objects is 0 or less.
@@ -61,9 +159,21 @@ class ObjectsCache(object):
           'Invalid maximum number of cached objects value zero or less.')
 
     super(ObjectsCache, self).__init__()
+    self._eviction_policy = eviction_policy or LRUObjectsCacheEvictionPolicy()
+    self._identifiers_by_object_identity = {}
     self._maximum_number_of_cached_values = maximum_number_of_cached_values
     self._values = {}
 
+  @property
+  def maximum_number_of_cached_values(self):
+    """int: maximum number of cached values."""
+    return self._maximum_number_of_cached_values
+
+  @property
+  def number_of_cached_values(self):
+    """int: number of cached values."""
+    return len(self._values)
+
   def CacheObject(self, identifier, vfs_object):
     """Caches a VFS object.
 
@@ -81,17 +191,46 @@ class ObjectsCache(object):
       raise KeyError('Object already cached for identifier: {0:s}'.format(
           identifier))
 
-    if len(self._values) == self._maximum_number_of_cached_values:
+    if self.IsFull():
       raise errors.CacheFullError('Maximum number of cached values reached.')
 
     self._values[identifier] = ObjectsCacheValue(vfs_object)
+    self._identifiers_by_object_identity[id(vfs_object)] = identifier
+    self._eviction_policy.AddIdentifier(identifier)
 
   def Empty(self):
     """Empties the cache.
 
     This method ignores the cache value reference count.
     """
+    self._identifiers_by_object_identity.clear()
     self._values.clear()
+    self._eviction_policy.Empty()
+
+  def EvictObject(self):
+    """Evicts a dereferenced object from the cache.
+
+    The object to evict is determined by the eviction policy. Objects that
+    are still referenced are never evicted. Note that the caller is
+    responsible for closing the evicted object.
+
+    Returns:
+      object: evicted VFS object or None if no dereferenced object is cached.
+
+    Raises:
+      RuntimeError: if the cache value is missing.
+    """
+    for identifier in self._eviction_policy.GetEvictionCandidates():
+      cache_value = self._values.get(identifier, None)
+      if not cache_value:
+        raise RuntimeError('Missing cache value for identifier: {0:s}'.format(
+            identifier))
+
+      if cache_value.IsDereferenced():
+        self.RemoveObject(identifier)
+        return cache_value.vfs_object
+
+    return None
 
   def GetCacheValue(self, identifier):
     """Retrieves the cache value based on the identifier.
@@ -120,14 +259,19 @@ class ObjectsCache(object):
     Raises:
       RuntimeError: if the cache value is missing.
     """
-    for identifier, cache_value in iter(self._values.items()):
-      if not cache_value:
-        raise RuntimeError('Missing cache value.')
+    # The identity of the object is used as key, since it is unique while
+    # the object is cached and does not depend on the object implementing
+    # __eq__ and __hash__.
+    identifier = self._identifiers_by_object_identity.get(
+        id(vfs_object), None)
+    if not identifier:
+      return None, None
 
-      if cache_value.vfs_object == vfs_object:
-        return identifier, cache_value
+    cache_value = self._values.get(identifier, None)
+    if not cache_value:
+      raise RuntimeError('Missing cache value.')
 
-    return None, None
+    return identifier, cache_value
 
   def GetObject(self, identifier):
     """Retrieves a cached object based on the identifier.
@@ -144,6 +288,7 @@ class ObjectsCache(object):
     if not cache_value:
       return None
 
+    self._eviction_policy.TouchIdentifier(identifier)
     return cache_value.vfs_object
 
   def GrabObject(self, identifier):
@@ -168,6 +313,15 @@ class ObjectsCache(object):
           identifier))
 
     cache_value.IncrementReferenceCount()
+    self._eviction_policy.TouchIdentifier(identifier)
+
+  def IsFull(self):
+    """Determines if the cache is full.
+
+    Returns:
+      bool: True if the maximum number of cached values is reached.
+    """
+    return len(self._values) >= self._maximum_number_of_cached_values
 
   def ReleaseObject(self, identifier):
     """Releases a cached object based on the identifier.
@@ -207,7 +361,13 @@ class ObjectsCache(object):
       raise KeyError('Missing cached object for identifier: {0:s}'.format(
           identifier))
 
-    del self._values[identifier]
+    cache_value = self._values.pop(identifier)
+
+    object_identity = id(cache_value.vfs_object)
+    if self._identifiers_by_object_identity.get(
+        object_identity, None) == identifier:
+      del self._identifiers_by_object_identity[object_identity]
+    self._eviction_policy.RemoveIdentifier(identifier)
 
   def SetMaximumNumberOfCachedValues(self, maximum_number_of_cached_values):
     """Sets the maximum number of cached values.
@@ -223,3 +383,144 @@ class ObjectsCache(object):
           'Invalid maximum number of cached objects value zero or less.')
 
     self._maximum_number_of_cached_values = maximum_number_of_cached_values
+
+
+class BlocksCache(object):
+  """Least recently used (LRU) cache of data blocks.
+
+  The cache is bounded by the total size of the cached data blocks. A data
+  block is identified by the identifier of the data it is part of and its
+  offset within that data. A blocks cache can be shared by multiple sources
+  of data, in which case they share the same memory budget.
+  """
+
+  def __init__(self, maximum_size):
+    """Initializes the blocks cache.
+
+    Args:
+      maximum_size (int): maximum number of bytes of data cached, where 0
+          represents no data is cached.
+
+    Raises:
+      ValueError: when the maximum size is less than 0.
+    """
+    if maximum_size < 0:
+      raise ValueError('Invalid maximum size value less than zero.')
+
+    super(BlocksCache, self).__init__()
+    self._blocks = collections.OrderedDict()
+    self._maximum_size = maximum_size
+    self._size = 0
+    self._size_per_identifier = {}
+
+  @property
+  def maximum_size(self):
+    """int: maximum number of bytes of data cached."""
+    return self._maximum_size
+
+  @property
+  def size(self):
+    """int: number of bytes of data cached."""
+    return self._size
+
+  def _RemoveBlock(self, lookup_key):
+    """Removes a data block from the cache.
+
+    Args:
+      lookup_key (tuple[object, int]): identifier of the data the block is
+          part of and offset of the block within the data.
+    """
+    block_data = self._blocks.pop(lookup_key)
+    identifier = lookup_key[0]
+
+    self._size -= len(block_data)
+    self._size_per_identifier[identifier] -= len(block_data)
+    if not self._size_per_identifier[identifier]:
+      del self._size_per_identifier[identifier]
+
+  def Empty(self):
+    """Empties the cache."""
+    self._blocks = collections.OrderedDict()
+    self._size = 0
+    self._size_per_identifier = {}
+
+  def GetBlock(self, identifier, block_offset):
+    """Retrieves a cached data block.
+
+    Args:
+      identifier (object): hashable identifier of the data the block is part
+          of, such as the comparable of a path specification.
+      block_offset (int): offset of the block within the data.
+
+    Returns:
+      bytes: block data or None if not cached.
+    """
+    lookup_key = (identifier, block_offset)
+    block_data = self._blocks.pop(lookup_key, None)
+    if block_data is not None:
+      # Re-insert the block to mark it as most recently used.
+      self._blocks[lookup_key] = block_data
+    return block_data
+
+  def GetDataSize(self, identifier):
+    """Determines the number of bytes cached of specific data.
+
+    Args:
+      identifier (object): hashable identifier of the data.
+
+    Returns:
+      int: number of bytes cached of the data.
+    """
+    return self._size_per_identifier.get(identifier, 0)
+
+  def IsFull(self):
+    """Checks whether the cache is full.
+
+    Returns:
+      bool: True if the cache is full.
+    """
+    return self._size >= self._maximum_size
+
+  def RemoveBlocks(self, identifier):
+    """Removes all the cached data blocks of specific data.
+
+    Args:
+      identifier (object): hashable identifier of the data.
+    """
+    if identifier not in self._size_per_identifier:
+      return
+
+    lookup_keys = [
+        lookup_key for lookup_key in self._blocks
+        if lookup_key[0] == identifier]
+    for lookup_key in lookup_keys:
+      self._RemoveBlock(lookup_key)
+
+  def SetBlock(self, identifier, block_offset, block_data):
+    """Caches a data block.
+
+    The least recently used data blocks are removed from the cache when
+    the maximum size is exceeded. Blocks larger than the maximum size are
+    not cached.
+
+    Args:
+      identifier (object): hashable identifier of the data the block is part
+          of, such as the comparable of a path specification.
+      block_offset (int): offset of the block within the data.
+      block_data (bytes): block data.
+    """
+    lookup_key = (identifier, block_offset)
+    if lookup_key in self._blocks:
+      self._RemoveBlock(lookup_key)
+
+    block_size = len(block_data)
+    if block_size > self._maximum_size:
+      return
+
+    while self._blocks and self._size + block_size > self._maximum_size:
+      self._RemoveBlock(next(iter(self._blocks)))
+
+    self._blocks[lookup_key] = block_data
+    self._size += block_size
+    self._size_per_identifier.setdefault(identifier, 0)
+    self._size_per_identifier[identifier] += block_size
@@ -3,15 +3,31 @@
 
 from __future__ import unicode_literals
 
+from multiprocessing import pool
+
 from dfvfs.resolver import cache
 
 
 class Context(object):
-  """Resolver context."""
+  """Resolver context.
+
+  File-like and file system objects that are no longer referenced are kept
+  open in the context, so they can be reused when the same path specification
+  is opened again. When a cache is full, dereferenced objects are evicted
+  and closed according to the eviction policy.
+  """
+
+  # The default maximum number of bytes of storage media image data cached
+  # for the SleuthKit (TSK).
+  _MAXIMUM_TSK_IMAGE_CACHE_SIZE = 32 * 1024 * 1024
 
   def __init__(
       self, maximum_number_of_file_objects=128,
-      maximum_number_of_file_systems=16):
+      maximum_number_of_file_systems=16, file_object_eviction_policy=None,
+      file_system_eviction_policy=None, stream_metadata_cache=None,
+      maximum_gzip_cache_size=None, maximum_number_of_gzip_threads=None,
+      maximum_number_of_decryption_threads=None,
+      maximum_tsk_image_cache_size=None):
     """Initializes the resolver context object.
 
     Args:
@@ -19,12 +35,149 @@ class Context(object):
           of file-like objects cached in the context.
       maximum_number_of_file_systems (Optional[int]): maximum number
           of file system objects cached in the context.
+      file_object_eviction_policy (Optional[ObjectsCacheEvictionPolicy]):
+          eviction policy of the file-like object cache, where None
+          represents least recently used (LRU).
+      file_system_eviction_policy (Optional[ObjectsCacheEvictionPolicy]):
+          eviction policy of the file system object cache, where None
+          represents least recently used (LRU).
+      stream_metadata_cache (Optional[StreamMetadataCache]): on-disk cache
+          of the metadata of compressed, encoded and encrypted streams, where
+          None represents no such cache is used.
+      maximum_gzip_cache_size (Optional[int]): maximum number of bytes of
+          uncompressed data cached per gzip file, that is shared by the members
+          of the gzip file, where None represents the default of the gzip
+          file-like object.
+      maximum_number_of_gzip_threads (Optional[int]): maximum number of worker
+          threads, shared by the gzip files of the context, used to decompress
+          the members of a gzip file ahead of reading, where 0 represents no
+          worker threads are used and None represents the default of the gzip
+          file-like object.
+      maximum_number_of_decryption_threads (Optional[int]): maximum number of
+          worker threads per encrypted stream used to decrypt large reads,
+          where None or 0 represent no worker threads are used. Worker threads
+          are only used by decrypters that support random-access decryption.
+      maximum_tsk_image_cache_size (Optional[int]): maximum number of bytes of
+          storage media image data cached for the SleuthKit (TSK), that is
+          shared by the TSK file systems and volume systems of the context,
+          where 0 represents no data is cached and None represents the default
+          of 32 MiB.
     """
     super(Context, self).__init__()
     self._file_object_cache = cache.ObjectsCache(
-        maximum_number_of_file_objects)
+        maximum_number_of_file_objects,
+        eviction_policy=file_object_eviction_policy)
     self._file_system_cache = cache.ObjectsCache(
-        maximum_number_of_file_systems)
+        maximum_number_of_file_systems,
+        eviction_policy=file_system_eviction_policy)
+    self._gzip_thread_pool = None
+    self._maximum_gzip_cache_size = maximum_gzip_cache_size
+    self._maximum_number_of_decryption_threads = (
+        maximum_number_of_decryption_threads)
+    self._maximum_number_of_gzip_threads = maximum_number_of_gzip_threads
+    self._stream_metadata_cache = stream_metadata_cache
+
+    if maximum_tsk_image_cache_size is None:
+      maximum_tsk_image_cache_size = self._MAXIMUM_TSK_IMAGE_CACHE_SIZE
+
+    self._maximum_tsk_image_cache_size = maximum_tsk_image_cache_size
+    self._tsk_image_blocks_cache = None
+    if maximum_tsk_image_cache_size > 0:
+      self._tsk_image_blocks_cache = cache.BlocksCache(
+          maximum_tsk_image_cache_size)
+
+  @property
+  def maximum_gzip_cache_size(self):
+    """int: maximum size of the uncompressed data cache per gzip file."""
+    return self._maximum_gzip_cache_size
+
+  @property
+  def maximum_number_of_decryption_threads(self):
+    """int: maximum number of worker threads per encrypted stream."""
+    return self._maximum_number_of_decryption_threads
+
+  @property
+  def maximum_number_of_gzip_threads(self):
+    """int: maximum number of worker threads shared by the gzip files."""
+    return self._maximum_number_of_gzip_threads
+
+  @property
+  def stream_metadata_cache(self):
+    """StreamMetadataCache: on-disk stream metadata cache or None."""
+    return self._stream_metadata_cache
+
+  @property
+  def tsk_image_blocks_cache(self):
+    """BlocksCache: SleuthKit (TSK) image data cache or None if disabled."""
+    return self._tsk_image_blocks_cache
+
+  def _CloseEvictedFileObject(self, file_object):
+    """Closes a file-like object that was evicted from the cache.
+
+    Args:
+      file_object (FileIO): file-like object.
+    """
+    # The file-like object is no longer cached, hence it should not be
+    # released from the context when it is closed.
+    # pylint: disable=protected-access
+    file_object._is_cached = False
+    file_object.close()
+
+  def _CloseEvictedFileSystem(self, file_system):
+    """Closes a file system object that was evicted from the cache.
+
+    Args:
+      file_system (FileSystem): file system object.
+    """
+    # The file system object is no longer cached, hence it should not be
+    # released from the context when it is closed.
+    # pylint: disable=protected-access
+    file_system._is_cached = False
+    file_system.Close()
+
+  def _EvictFileObjects(self, maximum_number_of_file_objects):
+    """Evicts dereferenced file-like objects until the cache has room.
+
+    Args:
+      maximum_number_of_file_objects (int): maximum number of file-like
+          objects that should remain cached.
+
+    Returns:
+      int: number of evicted file-like objects.
+    """
+    number_of_evicted_objects = 0
+    while (self._file_object_cache.number_of_cached_values >
+           maximum_number_of_file_objects):
+      file_object = self._file_object_cache.EvictObject()
+      if not file_object:
+        break
+
+      self._CloseEvictedFileObject(file_object)
+      number_of_evicted_objects += 1
+
+    return number_of_evicted_objects
+
+  def _EvictFileSystems(self, maximum_number_of_file_systems):
+    """Evicts dereferenced file system objects until the cache has room.
+
+    Args:
+      maximum_number_of_file_systems (int): maximum number of file system
+          objects that should remain cached.
+
+    Returns:
+      int: number of evicted file system objects.
+    """
+    number_of_evicted_objects = 0
+    while (self._file_system_cache.number_of_cached_values >
+           maximum_number_of_file_systems):
+      file_system = self._file_system_cache.EvictObject()
+      if not file_system:
+        break
+
+      self._CloseEvictedFileSystem(file_system)
+      number_of_evicted_objects += 1
+
+    return number_of_evicted_objects
 
   def _GetFileSystemCacheIdentifier(self, path_spec):
     """Determines the file system cache identifier for the path specification.
@@ -48,7 +201,13 @@ class Context(object):
     Args:
       path_spec (PathSpec): path specification.
       file_object (FileIO): file-like object.
+
+    Raises:
+      CacheFullError: if the cache is full and none of the cached file-like
+          objects can be evicted.
     """
+    self._EvictFileObjects(
+        self._file_object_cache.maximum_number_of_cached_values - 1)
     self._file_object_cache.CacheObject(path_spec.comparable, file_object)
 
   def CacheFileSystem(self, path_spec, file_system):
@@ -57,14 +216,94 @@ class Context(object):
     Args:
       path_spec (PathSpec): path specification.
       file_system (FileSystem): file system object.
+
+    Raises:
+      CacheFullError: if the cache is full and none of the cached file system
+          objects can be evicted.
     """
+    self._EvictFileSystems(
+        self._file_system_cache.maximum_number_of_cached_values - 1)
     identifier = self._GetFileSystemCacheIdentifier(path_spec)
     self._file_system_cache.CacheObject(identifier, file_system)
 
+  def CreateEmptyCopy(self):
+    """Creates a resolver context with the same settings and no cached objects.
+
+    Note that the eviction policies are not copied, since they track the
+    objects of the caches, hence the copy uses least recently used (LRU)
+    eviction. The stream metadata cache is shared with the copy.
+
+    Returns:
+      Context: resolver context.
+    """
+    return Context(
+        maximum_number_of_file_objects=(
+            self._file_object_cache.maximum_number_of_cached_values),
+        maximum_number_of_file_systems=(
+            self._file_system_cache.maximum_number_of_cached_values),
+        stream_metadata_cache=self._stream_metadata_cache,
+        maximum_gzip_cache_size=self._maximum_gzip_cache_size,
+        maximum_number_of_gzip_threads=self._maximum_number_of_gzip_threads,
+        maximum_number_of_decryption_threads=(
+            self._maximum_number_of_decryption_threads),
+        maximum_tsk_image_cache_size=self._maximum_tsk_image_cache_size)
+
   def Empty(self):
-    """Empties the caches."""
+    """Empties the caches.
+
+    Dereferenced objects kept open by the caches are closed. Note that closing
+    an object can dereference the objects it depends on.
+    """
+    while self._EvictFileSystems(0) or self._EvictFileObjects(0):
+      pass
+
     self._file_object_cache.Empty()
     self._file_system_cache.Empty()
+    if self._tsk_image_blocks_cache:
+      self._tsk_image_blocks_cache.Empty()
+
+    if self._gzip_thread_pool:
+      self._gzip_thread_pool.terminate()
+      self._gzip_thread_pool.join()
+      self._gzip_thread_pool = None
+
+  def EvictFileObject(self, file_object):
+    """Evicts a dereferenced file-like object from the cache and closes it.
+
+    Args:
+      file_object (FileIO): file-like object.
+
+    Returns:
+      bool: True if the file-like object was evicted, False if it is not
+          cached or still referenced.
+    """
+    identifier, cache_value = self._file_object_cache.GetCacheValueByObject(
+        file_object)
+    if not identifier or not cache_value.IsDereferenced():
+      return False
+
+    self._file_object_cache.RemoveObject(identifier)
+    self._CloseEvictedFileObject(file_object)
+    return True
+
+  def EvictFileSystem(self, file_system):
+    """Evicts a dereferenced file system object from the cache and closes it.
+
+    Args:
+      file_system (FileSystem): file system object.
+
+    Returns:
+      bool: True if the file system object was evicted, False if it is not
+          cached or still referenced.
+    """
+    identifier, cache_value = self._file_system_cache.GetCacheValueByObject(
+        file_system)
+    if not identifier or not cache_value.IsDereferenced():
+      return False
+
+    self._file_system_cache.RemoveObject(identifier)
+    self._CloseEvictedFileSystem(file_system)
+    return True
 
   def ForceRemoveFileObject(self, path_spec):
     """Forces the removal of a file-like object based on a path specification.
@@ -79,8 +318,14 @@ class Context(object):
     if not cache_value:
       return False
 
+    file_object = cache_value.vfs_object
     while not cache_value.IsDereferenced():
-      cache_value.vfs_object.close()
+      file_object.close()
+
+    # The dereferenced file-like object is kept open by the cache.
+    if self._file_object_cache.GetCacheValue(path_spec.comparable):
+      self._file_object_cache.RemoveObject(path_spec.comparable)
+      self._CloseEvictedFileObject(file_object)
 
     return True
 
@@ -111,6 +356,26 @@ class Context(object):
 
     return cache_value.reference_count
 
+  def GetGzipThreadPool(self, number_of_threads):
+    """Retrieves the worker thread pool shared by the gzip files.
+
+    The thread pool is created on first use and is terminated when the context
+    is emptied, after which it is created again on next use. Hence callers
+    should retrieve the thread pool every time they need it instead of
+    keeping a reference to it.
+
+    Args:
+      number_of_threads (int): number of worker threads of the thread pool,
+          which is only used when the thread pool is created.
+
+    Returns:
+      multiprocessing.pool.ThreadPool: worker thread pool.
+    """
+    if not self._gzip_thread_pool:
+      self._gzip_thread_pool = pool.ThreadPool(processes=number_of_threads)
+
+    return self._gzip_thread_pool
+
   def GetFileSystem(self, path_spec):
     """Retrieves a file system object defined by path specification.
 
@@ -164,7 +429,8 @@ class Context(object):
       file_object (FileIO): file-like object.
 
     Returns:
-      bool: True if the file-like object can be closed.
+      bool: True if the file-like object can be closed, False if it is still
+          referenced or kept open by the cache.
 
     Raises:
       PathSpecError: if the path specification is incorrect.
@@ -182,7 +448,11 @@ class Context(object):
 
     self._file_object_cache.ReleaseObject(identifier)
 
-    result = cache_value.IsDereferenced()
+    # A dereferenced object is kept open in the cache, unless the cache holds
+    # more objects than allowed.
+    result = cache_value.IsDereferenced() and (
+        self._file_object_cache.number_of_cached_values >
+        self._file_object_cache.maximum_number_of_cached_values)
     if result:
       self._file_object_cache.RemoveObject(identifier)
 
@@ -195,7 +465,8 @@ class Context(object):
       file_system (FileSystem): file system object.
 
     Returns:
-      bool: True if the file system object can be closed.
+      bool: True if the file system object can be closed, False if it is still
+          referenced or kept open by the cache.
 
     Raises:
       PathSpecError: if the path specification is incorrect.
@@ -213,7 +484,11 @@ class Context(object):
 
     self._file_system_cache.ReleaseObject(identifier)
 
-    result = cache_value.IsDereferenced()
+    # A dereferenced object is kept open in the cache, unless the cache holds
+    # more objects than allowed.
+    result = cache_value.IsDereferenced() and (
+        self._file_system_cache.number_of_cached_values >
+        self._file_system_cache.maximum_number_of_cached_values)
     if result:
       self._file_system_cache.RemoveObject(identifier)
 
@@ -228,6 +503,7 @@ class Context(object):
     """
     self._file_object_cache.SetMaximumNumberOfCachedValues(
         maximum_number_of_file_objects)
+    self._EvictFileObjects(maximum_number_of_file_objects)
 
   def SetMaximumNumberOfFileSystems(self, maximum_number_of_file_systems):
     """Sets the maximum number of cached file system objects.
@@ -238,3 +514,4 @@ class Context(object):
     """
     self._file_system_cache.SetMaximumNumberOfCachedValues(
         maximum_number_of_file_systems)
+    self._EvictFileSystems(maximum_number_of_file_systems)
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""The stream metadata cache."""
+
+from __future__ import unicode_literals
+
+import hashlib
+import json
+import numbers
+import os
+import tempfile
+
+from dfvfs.lib import errors
+from dfvfs.resolver import resolver
+
+
+class StreamMetadataCache(object):
+  """On-disk cache of stream metadata.
+
+  Determining the size of a compressed, encoded or encrypted stream requires
+  the entire stream to be read. The stream metadata cache stores such metadata
+  on disk so it can be reused by other resolver contexts and processes that
+  access the same stream.
+
+  Metadata is stored per stream in a JSON file, named after a hash of
+  the stream identifier, so that values of the path specification, such as
+  keys, are not stored in the cache.
+  """
+
+  def __init__(self, path):
+    """Initializes a stream metadata cache.
+
+    Args:
+      path (str): path of the directory that contains the cache files.
+
+    Raises:
+      ValueError: if the path does not exist or is not a directory.
+    """
+    if not os.path.isdir(path):
+      raise ValueError('No such directory: {0:s}'.format(path))
+
+    super(StreamMetadataCache, self).__init__()
+    self._path = path
+
+  def _GetCacheFilePath(self, identifier):
+    """Retrieves the path of the cache file of a stream.
+
+    Args:
+      identifier (str): stream identifier.
+
+    Returns:
+      str: path of the cache file.
+    """
+    identifier_hash = hashlib.sha256(identifier.encode('utf-8')).hexdigest()
+    return os.path.join(self._path, '{0:s}.json'.format(identifier_hash))
+
+  def GetMetadata(self, identifier):
+    """Retrieves the metadata of a stream.
+
+    Args:
+      identifier (str): stream identifier.
+
+    Returns:
+      dict[str, object]: metadata of the stream or None if not available.
+    """
+    cache_file_path = self._GetCacheFilePath(identifier)
+
+    try:
+      with open(cache_file_path, 'rb') as file_object:
+        metadata = json.loads(file_object.read().decode('utf-8'))
+    except (IOError, OSError, UnicodeDecodeError, ValueError):
+      return None
+
+    if not isinstance(metadata, dict):
+      return None
+
+    return metadata
+
+  def GetStreamIdentifier(
+      self, path_spec, parent_file_object, resolver_context):
+    """Retrieves the identifier of a stream.
+
+    The identifier consists of the comparable of the path specification of
+    the stream and the size and modification time of its parent, so that
+    metadata is not reused after the parent has changed. Streams of which
+    the parent has no modification time have no identifier, since the size
+    of the parent alone does not reliably indicate the parent has changed.
+
+    Args:
+      path_spec (PathSpec): path specification of the stream.
+      parent_file_object (FileIO): file-like object of the parent.
+      resolver_context (Context): resolver context.
+
+    Returns:
+      str: stream identifier or None if the stream has no identifier.
+    """
+    modification_time = None
+    try:
+      parent_file_entry = resolver.Resolver.OpenFileEntry(
+          path_spec.parent, resolver_context=resolver_context)
+      if parent_file_entry:
+        modification_time = parent_file_entry.modification_time
+    except (IOError, OSError, errors.Error):
+      pass
+
+    if not modification_time:
+      return None
+
+    return '{0:s}parent size: {1:d}, parent modification time: {2:s}'.format(
+        path_spec.comparable, parent_file_object.get_size(),
+        modification_time.CopyToDateTimeString())
+
+  def GetStreamSize(self, identifier):
+    """Retrieves the size of a stream.
+
+    Args:
+      identifier (str): stream identifier.
+
+    Returns:
+      int: size of the stream or None if not available.
+    """
+    metadata = self.GetMetadata(identifier) or {}
+    stream_size = metadata.get('stream_size', None)
+    if (isinstance(stream_size, bool) or
+        not isinstance(stream_size, numbers.Integral) or stream_size < 0):
+      return None
+
+    return stream_size
+
+  def SetMetadata(self, identifier, metadata):
+    """Sets the metadata of a stream.
+
+    The metadata is written to a temporary file first, so that other processes
+    never read a partially written cache file.
+
+    Args:
+      identifier (str): stream identifier.
+      metadata (dict[str, object]): metadata of the stream.
+
+    Raises:
+      IOError: if the metadata cannot be written.
+      OSError: if the metadata cannot be written.
+    """
+    cache_file_path = self._GetCacheFilePath(identifier)
+    json_string = json.dumps(metadata, sort_keys=True)
+
+    file_descriptor, temporary_file_path = tempfile.mkstemp(
+        dir=self._path, suffix='.tmp')
+    try:
+      with os.fdopen(file_descriptor, 'wb') as file_object:
+        file_object.write(json_string.encode('utf-8'))
+
+      if os.path.exists(cache_file_path):
+        os.remove(cache_file_path)
+      os.rename(temporary_file_path, cache_file_path)
+
+    finally:
+      if os.path.exists(temporary_file_path):
+        os.remove(temporary_file_path)
+
+  def SetStreamSize(self, identifier, stream_size):
+    """Sets the size of a stream.
+
+    Failing to write the metadata is ignored, since the stream metadata cache
+    is optional and should not prevent the stream from being read.
+
+    Args:
+      identifier (str): stream identifier.
+      stream_size (int): size of the stream.
+    """
+    metadata = self.GetMetadata(identifier) or {}
+    metadata['stream_size'] = stream_size
+
+    try:
+      self.SetMetadata(identifier, metadata)
+    except (IOError, OSError):
+      pass
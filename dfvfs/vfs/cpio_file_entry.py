@@ -28,23 +28,15 @@ class CPIODirectory(file_entry.Directory):
     location = getattr(self.path_spec, 'location', None)
 
     if location and location.startswith(self._file_system.PATH_SEPARATOR):
-      cpio_archive_file = self._file_system.GetCPIOArchiveFile()
-      for cpio_archive_file_entry in cpio_archive_file.GetFileEntries(
-          path_prefix=location[1:]):
-
-        path = cpio_archive_file_entry.path
-        if not path:
-          continue
-
-        _, suffix = self._file_system.GetPathSegmentAndSuffix(
-            location[1:], path)
+      member_index = self._file_system.GetArchiveMemberIndex()
+      for name in member_index.GetSubEntryNames(location[1:]):
+        path_spec_location = self._file_system.JoinPath([location, name])
 
-        # Ignore anything that is part of a sub directory or the directory
-        # itself.
-        if suffix or path == location:
+        # Ignore directories that are implied by the paths of the CPIO archive
+        # file entries but have no CPIO archive file entry of their own.
+        if not member_index.GetMember(path_spec_location[1:]):
           continue
 
-        path_spec_location = self._file_system.JoinPath([path])
         yield cpio_path_spec.CPIOPathSpec(
             location=path_spec_location, parent=self.path_spec.parent)
 
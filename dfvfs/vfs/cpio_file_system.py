@@ -3,6 +3,7 @@
 
 from __future__ import unicode_literals
 
+from dfvfs.lib import archive_index
 from dfvfs.lib import cpio
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
@@ -26,6 +27,7 @@ class CPIOFileSystem(file_system.FileSystem):
       encoding (Optional[str]): file entry name encoding.
     """
     super(CPIOFileSystem, self).__init__(resolver_context)
+    self._archive_member_index = None
     self._cpio_archive_file = None
     self._file_object = None
     self.encoding = encoding
@@ -39,6 +41,8 @@ class CPIOFileSystem(file_system.FileSystem):
     self._cpio_archive_file.Close()
     self._cpio_archive_file = None
 
+    self._archive_member_index = None
+
     self._file_object.close()
     self._file_object = None
 
@@ -91,6 +95,28 @@ class CPIOFileSystem(file_system.FileSystem):
 
     return self._cpio_archive_file.FileEntryExistsByPath(location[1:])
 
+  def GetArchiveMemberIndex(self):
+    """Retrieves the archive member index.
+
+    The index is built from the paths of the CPIO archive file entries the
+    first time it is needed. The members of the index are the paths, hence
+    CPIO archive file entries are only created when accessed by
+    GetFileEntryByPathSpec.
+
+    Returns:
+      ArchiveMemberIndex: archive member index.
+    """
+    if not self._archive_member_index:
+      member_index = archive_index.ArchiveMemberIndex(
+          path_separator=self.PATH_SEPARATOR)
+      for path in self._cpio_archive_file.GetFilePaths():
+        if path:
+          member_index.AddMember(path, path)
+
+      self._archive_member_index = member_index
+
+    return self._archive_member_index
+
   def GetCPIOArchiveFile(self):
     """Retrieves the CPIO archive file.
 
@@ -44,6 +44,45 @@ class DataStream(object):
     return True
 
 
+class DirectoryEntry(object):
+  """VFS directory entry.
+
+  A directory entry is a compact record of a sub file entry, that is
+  determined while listing the directory, without the need to open the sub
+  file entry.
+
+  Attributes:
+    entry_type (str): file entry type, such as "directory" or "file", or None
+        if not available.
+    identifier (int): identifier of the file entry within the file system,
+        such as an inode or MFT entry number, or None if not available.
+    is_allocated (bool): True if the file entry is allocated, False if not or
+        None if not available.
+    name (str): name of the directory entry or None if not available.
+    path_spec (PathSpec): path specification of the sub file entry.
+  """
+
+  def __init__(
+      self, path_spec, entry_type=None, identifier=None, is_allocated=None,
+      name=None):
+    """Initializes a directory entry.
+
+    Args:
+      path_spec (PathSpec): path specification of the sub file entry.
+      entry_type (Optional[str]): file entry type.
+      identifier (Optional[int]): identifier of the file entry within the file
+          system.
+      is_allocated (Optional[bool]): True if the file entry is allocated.
+      name (Optional[str]): name of the directory entry.
+    """
+    super(DirectoryEntry, self).__init__()
+    self.entry_type = entry_type
+    self.identifier = identifier
+    self.is_allocated = is_allocated
+    self.name = name
+    self.path_spec = path_spec
+
+
 class Directory(object):
   """VFS directory interface.
 
@@ -74,11 +113,87 @@ class Directory(object):
     """
     return iter(())
 
+  def _ListEntriesGenerator(self):
+    """Retrieves directory entry records.
+
+    Back-ends that can determine the name of a directory entry while listing
+    the directory should override this method. By default the name is
+    determined from the location of the path specification, when available,
+    otherwise the sub file entry is opened.
+
+    Yields:
+      DirectoryEntry: a directory entry.
+    """
+    for path_spec in self._EntriesGenerator():
+      location = getattr(path_spec, 'location', None)
+      if isinstance(location, py2to3.UNICODE_TYPE):
+        name = self._file_system.BasenamePath(location)
+      else:
+        sub_file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+        name = getattr(sub_file_entry, 'name', None)
+
+      yield DirectoryEntry(path_spec, name=name)
+
   @property
   def entries(self):
     """generator[PathSpec]: path specifications of the directory entries."""
     return self._EntriesGenerator()
 
+  def ListEntries(self):
+    """Lists the directory entries.
+
+    Unlike the sub file entries of a file entry, the directory entries are
+    determined without opening the corresponding file entries.
+
+    Returns:
+      generator[DirectoryEntry]: directory entry generator.
+    """
+    return self._ListEntriesGenerator()
+
+
+class DirectoryNameIndex(object):
+  """Index of the path specifications of directory entries by name."""
+
+  def __init__(self):
+    """Initializes a directory name index."""
+    super(DirectoryNameIndex, self).__init__()
+    self._path_specs_by_case_folded_name = {}
+    self._path_specs_by_name = {}
+
+  @property
+  def number_of_entries(self):
+    """int: number of directory entries in the index."""
+    return len(self._path_specs_by_name)
+
+  def AddPathSpec(self, name, path_spec):
+    """Adds the path specification of a directory entry.
+
+    If multiple directory entries have the same (case-folded) name, the first
+    directory entry added is returned by lookups.
+
+    Args:
+      name (str): name of the directory entry.
+      path_spec (PathSpec): path specification of the directory entry.
+    """
+    self._path_specs_by_name.setdefault(name, path_spec)
+    self._path_specs_by_case_folded_name.setdefault(name.lower(), path_spec)
+
+  def GetPathSpecByName(self, name, case_sensitive=True):
+    """Retrieves the path specification of a directory entry by name.
+
+    Args:
+      name (str): name of the directory entry.
+      case_sensitive (Optional[bool]): True if the name is case sensitive.
+
+    Returns:
+      PathSpec: path specification of the directory entry or None if not
+          available.
+    """
+    path_spec = self._path_specs_by_name.get(name, None)
+    if path_spec is None and not case_sensitive:
+      path_spec = self._path_specs_by_case_folded_name.get(name.lower(), None)
+    return path_spec
+
 
 class FileEntry(object):
   """Virtual file entry interface.
@@ -184,6 +299,28 @@ class FileEntry(object):
       Directory: a directory or None.
     """
 
+  def _GetDirectoryNameIndex(self):
+    """Retrieves the name index of the directory.
+
+    The name index is built on first use and cached by the file system.
+
+    Returns:
+      DirectoryNameIndex: name index of the directory.
+    """
+    name_index = self._file_system.GetCachedDirectoryNameIndex(self.path_spec)
+    if name_index is not None:
+      return name_index
+
+    name_index = DirectoryNameIndex()
+
+    for directory_entry in self.ListDirectoryEntries():
+      if directory_entry.name is not None:
+        name_index.AddPathSpec(directory_entry.name, directory_entry.path_spec)
+
+    self._file_system.CacheDirectoryNameIndex(self.path_spec, name_index)
+
+    return name_index
+
   def _GetLink(self):
     """Retrieves the link.
 
@@ -402,18 +539,14 @@ class FileEntry(object):
     Returns:
       FileEntry: a file entry or None if not available.
     """
-    name_lower = name.lower()
-    matching_sub_file_entry = None
+    name_index = self._GetDirectoryNameIndex()
 
-    for sub_file_entry in self.sub_file_entries:
-      if sub_file_entry.name == name:
-        return sub_file_entry
-
-      if not case_sensitive and sub_file_entry.name.lower() == name_lower:
-        if not matching_sub_file_entry:
-          matching_sub_file_entry = sub_file_entry
+    path_spec = name_index.GetPathSpecByName(
+        name, case_sensitive=case_sensitive)
+    if path_spec is None:
+      return None
 
-    return matching_sub_file_entry
+    return self._file_system.GetFileEntryByPathSpec(path_spec)
 
   def GetStat(self):
     """Retrieves information about the file entry.
@@ -557,3 +690,17 @@ class FileEntry(object):
       bool: True if the file entry is virtual.
     """
     return self._is_virtual
+
+  def ListDirectoryEntries(self):
+    """Lists the directory entries without opening the sub file entries.
+
+    Returns:
+      generator[DirectoryEntry]: directory entry generator.
+    """
+    if self._directory is None:
+      self._directory = self._GetDirectory()
+
+    if self._directory is None:
+      return iter(())
+
+    return self._directory.ListEntries()
@@ -4,6 +4,7 @@
 from __future__ import unicode_literals
 
 import abc
+import collections
 
 
 class FileSystem(object):
@@ -16,6 +17,13 @@ class FileSystem(object):
   LOCATION_ROOT = '/'
   PATH_SEPARATOR = '/'
 
+  # True if the name indexes of directories can be cached, which requires
+  # that the directories do not change while the file system is open.
+  _CACHE_DIRECTORY_NAME_INDEXES = True
+
+  # The maximum number of cached name indexes of directories.
+  _MAXIMUM_NUMBER_OF_DIRECTORY_NAME_INDEXES = 64
+
   def __init__(self, resolver_context):
     """Initializes a file system.
 
@@ -27,6 +35,7 @@ class FileSystem(object):
           indicator.
     """
     super(FileSystem, self).__init__()
+    self._directory_name_indexes = collections.OrderedDict()
     self._is_cached = False
     self._is_open = False
     self._path_spec = None
@@ -79,6 +88,27 @@ class FileSystem(object):
     _, _, basename = path.rpartition(self.PATH_SEPARATOR)
     return basename
 
+  def CacheDirectoryNameIndex(self, path_spec, name_index):
+    """Caches the name index of a directory.
+
+    The least recently used name index is removed from the cache when
+    the maximum number of cached name indexes is exceeded.
+
+    Args:
+      path_spec (PathSpec): path specification of the directory.
+      name_index (DirectoryNameIndex): name index of the directory.
+    """
+    if not self._CACHE_DIRECTORY_NAME_INDEXES:
+      return
+
+    lookup_key = path_spec.comparable
+    self._directory_name_indexes.pop(lookup_key, None)
+    self._directory_name_indexes[lookup_key] = name_index
+
+    while (len(self._directory_name_indexes) >
+           self._MAXIMUM_NUMBER_OF_DIRECTORY_NAME_INDEXES):
+      self._directory_name_indexes.popitem(last=False)
+
   def Close(self):
     """Closes the file system.
 
@@ -98,6 +128,7 @@ class FileSystem(object):
       close_file_system = False
 
     if close_file_system:
+      self._directory_name_indexes = collections.OrderedDict()
       self._Close()
       self._is_open = False
       self._path_spec = None
@@ -132,6 +163,22 @@ class FileSystem(object):
       bool: True if the file entry exists.
     """
 
+  def GetCachedDirectoryNameIndex(self, path_spec):
+    """Retrieves a cached name index of a directory.
+
+    Args:
+      path_spec (PathSpec): path specification of the directory.
+
+    Returns:
+      DirectoryNameIndex: name index of the directory or None if not cached.
+    """
+    lookup_key = path_spec.comparable
+    name_index = self._directory_name_indexes.pop(lookup_key, None)
+    if name_index is not None:
+      # Re-insert the name index to mark it as most recently used.
+      self._directory_name_indexes[lookup_key] = name_index
+    return name_index
+
   def GetDataStreamByPathSpec(self, path_spec):
     """Retrieves a data stream for a path specification.
 
@@ -249,6 +296,14 @@ class FileSystem(object):
       PathSpecError: if the path specification is incorrect.
       ValueError: if the path specification or mode is invalid.
     """
+    if self._is_open and self._is_cached and (
+        not path_spec or
+        self._resolver_context.GetFileSystem(path_spec) is not self):
+      # The file system was closed but kept open by the resolver context
+      # and is now reopened with a different path specification.
+      if not self._resolver_context.EvictFileSystem(self):
+        raise IOError('Already open.')
+
     if self._is_open and not self._is_cached:
       raise IOError('Already open.')
 
@@ -201,6 +201,18 @@ class NTFSDirectory(file_entry.Directory):
     Yields:
       NTFSPathSpec: NTFS path specification.
     """
+    for directory_entry in self._ListEntriesGenerator():
+      yield directory_entry.path_spec
+
+  def _ListEntriesGenerator(self):
+    """Retrieves directory entry records.
+
+    The name, MFT entry and type are read from the pyfsntfs sub file entries
+    of the directory, hence no NTFS file entry is created per directory entry.
+
+    Yields:
+      DirectoryEntry: a directory entry.
+    """
     try:
       fsntfs_file_entry = self._file_system.GetNTFSFileEntryByPathSpec(
           self.path_spec)
@@ -211,7 +223,8 @@ class NTFSDirectory(file_entry.Directory):
       location = getattr(self.path_spec, 'location', None)
 
       for fsntfs_sub_file_entry in fsntfs_file_entry.sub_file_entries:
-        directory_entry = fsntfs_sub_file_entry.name
+        name = fsntfs_sub_file_entry.name
+        directory_entry = name
 
         # Ignore references to self or parent.
         if directory_entry in ('.', '..'):
@@ -227,11 +240,24 @@ class NTFSDirectory(file_entry.Directory):
           directory_entry = self._file_system.JoinPath([
               location, directory_entry])
 
-        yield ntfs_path_spec.NTFSPathSpec(
+        path_spec = ntfs_path_spec.NTFSPathSpec(
             location=directory_entry,
             mft_attribute=fsntfs_sub_file_entry.name_attribute_index,
             mft_entry=directory_entry_mft_entry, parent=self.path_spec.parent)
 
+        # pylint: disable=protected-access
+        if NTFSFileEntry._IsLink(fsntfs_sub_file_entry.file_attribute_flags):
+          entry_type = definitions.FILE_ENTRY_TYPE_LINK
+        elif fsntfs_sub_file_entry.has_directory_entries_index():
+          entry_type = definitions.FILE_ENTRY_TYPE_DIRECTORY
+        else:
+          entry_type = definitions.FILE_ENTRY_TYPE_FILE
+
+        yield file_entry.DirectoryEntry(
+            path_spec, entry_type=entry_type,
+            identifier=directory_entry_mft_entry,
+            is_allocated=fsntfs_sub_file_entry.is_allocated(), name=name)
+
 
 class NTFSFileEntry(file_entry.FileEntry):
   """File system file entry that uses pyfsntfs."""
@@ -392,7 +418,8 @@ class NTFSFileEntry(file_entry.FileEntry):
         yield NTFSFileEntry(
             self._resolver_context, self._file_system, path_spec)
 
-  def _IsLink(self, file_attribute_flags):
+  @classmethod
+  def _IsLink(cls, file_attribute_flags):
     """Determines if a file entry is a link.
 
     Args:
@@ -48,19 +48,94 @@ class OSDirectory(file_entry.Directory):
           yield os_path_spec.OSPathSpec(location=directory_entry_location)
 
       except OSError as exception:
-        if exception.errno == errno.EACCES:
-          exception_string = str(exception)
-          if not isinstance(exception_string, py2to3.UNICODE_TYPE):
-            exception_string = py2to3.UNICODE_TYPE(
-                exception_string, errors='replace')
-
-          raise errors.AccessError(
-              'Access to directory denied with error: {0!s}'.format(
-                  exception_string))
-        else:
-          raise errors.BackEndError(
-              'Unable to list directory: {0:s} with error: {1!s}'.format(
-                  location, exception))
+        self._RaiseListDirectoryError(location, exception)
+
+  def _GetDirectoryEntryType(self, scandir_entry):
+    """Determines the file entry type of a directory entry.
+
+    Args:
+      scandir_entry (os.DirEntry): directory entry returned by os.scandir().
+
+    Returns:
+      str: file entry type or None if not available.
+    """
+    # The type is checked without following symbolic links and a symbolic
+    # link is checked first, similar to OSFileEntry.
+    try:
+      if scandir_entry.is_symlink():
+        return definitions.FILE_ENTRY_TYPE_LINK
+      if scandir_entry.is_file(follow_symlinks=False):
+        return definitions.FILE_ENTRY_TYPE_FILE
+      if scandir_entry.is_dir(follow_symlinks=False):
+        return definitions.FILE_ENTRY_TYPE_DIRECTORY
+    except OSError:
+      pass
+
+    return None
+
+  def _ListEntriesGenerator(self):
+    """Retrieves directory entry records.
+
+    On platforms that support os.scandir(), the name, inode and type are
+    determined while listing the directory, hence the directory entries do
+    not need to be stat-ed individually.
+
+    Yields:
+      DirectoryEntry: a directory entry.
+
+    Raises:
+      AccessError: if the access to list the directory was denied.
+      BackEndError: if the directory could not be listed.
+    """
+    scandir = getattr(os, 'scandir', None)
+    location = getattr(self.path_spec, 'location', None)
+    if scandir is None or location is None:
+      for directory_entry in super(OSDirectory, self)._ListEntriesGenerator():
+        yield directory_entry
+      return
+
+    try:
+      for scandir_entry in scandir(location):
+        directory_entry_location = self._file_system.JoinPath([
+            location, scandir_entry.name])
+        path_spec = os_path_spec.OSPathSpec(location=directory_entry_location)
+
+        try:
+          identifier = scandir_entry.inode()
+        except OSError:
+          identifier = None
+
+        yield file_entry.DirectoryEntry(
+            path_spec, entry_type=self._GetDirectoryEntryType(scandir_entry),
+            identifier=identifier, is_allocated=True, name=scandir_entry.name)
+
+    except OSError as exception:
+      self._RaiseListDirectoryError(location, exception)
+
+  def _RaiseListDirectoryError(self, location, exception):
+    """Raises an error for a directory that could not be listed.
+
+    Args:
+      location (str): location of the directory.
+      exception (OSError): exception raised while listing the directory.
+
+    Raises:
+      AccessError: if the access to list the directory was denied.
+      BackEndError: if the directory could not be listed.
+    """
+    if exception.errno == errno.EACCES:
+      exception_string = str(exception)
+      if not isinstance(exception_string, py2to3.UNICODE_TYPE):
+        exception_string = py2to3.UNICODE_TYPE(
+            exception_string, errors='replace')
+
+      raise errors.AccessError(
+          'Access to directory denied with error: {0!s}'.format(
+              exception_string))
+
+    raise errors.BackEndError(
+        'Unable to list directory: {0:s} with error: {1!s}'.format(
+            location, exception))
 
 
 class OSFileEntry(file_entry.FileEntry):
@@ -26,6 +26,10 @@ class OSFileSystem(file_system.FileSystem):
 
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_OS
 
+  # The directories of the operating system can change while the file system
+  # is open, hence their name indexes are not cached.
+  _CACHE_DIRECTORY_NAME_INDEXES = False
+
   def _Close(self):
     """Closes the file system.
 
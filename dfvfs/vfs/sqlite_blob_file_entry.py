@@ -40,6 +40,11 @@ class SQLiteBlobDirectory(file_entry.Directory):
     column_name = getattr(self.path_spec, 'column_name', None)
 
     if table_name and column_name:
+      if self._number_of_entries is None:
+        row_identifiers = self._file_system.GetRowIdentifiers(table_name)
+        if row_identifiers is not None:
+          self._number_of_entries = len(row_identifiers)
+
       if self._number_of_entries is None:
         # Open the first entry to determine how many entries we have.
         # TODO: change this when there is a move this to a central temp file
@@ -181,6 +186,24 @@ class SQLiteBlobFileEntry(file_entry.FileEntry):
 
     return self._number_of_entries
 
+  def GetRowBlobs(self):
+    """Retrieves the blobs of all the rows of the column of the directory.
+
+    Returns:
+      generator[tuple[SQLiteBlobPathSpec, SQLiteBlobFile]]: path
+          specification and file-like object of the blob of a row. The caller
+          is responsible for closing the file-like object.
+
+    Raises:
+      BackEndError: if the file entry is not a directory or the table or
+          column does not exist.
+    """
+    if not self._is_virtual:
+      raise errors.BackEndError('Unsupported file entry not a directory.')
+
+    return self._file_system.GetRowBlobs(
+        self.path_spec.table_name, self.path_spec.column_name)
+
   def GetParentFileEntry(self):
     """Retrieves the parent file entry.
 
@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
+from dfvfs.lib import sqlite_database
 from dfvfs.path import sqlite_blob_path_spec
 from dfvfs.resolver import resolver
 from dfvfs.vfs import sqlite_blob_file_entry
@@ -12,7 +13,11 @@ from dfvfs.vfs import file_system
 
 
 class SQLiteBlobFileSystem(file_system.FileSystem):
-  """Class that implements a file system object using SQLite blob."""
+  """Class that implements a file system object using SQLite blob.
+
+  The SQLite database is opened once per file system, hence it is shared by
+  the SQLite blob file-like objects that refer to the same parent.
+  """
 
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_SQLITE_BLOB
 
@@ -23,8 +28,8 @@ class SQLiteBlobFileSystem(file_system.FileSystem):
       resolver_context (Context): resolver context.
     """
     super(SQLiteBlobFileSystem, self).__init__(resolver_context)
-    self._file_object = None
-    self._number_of_rows = None
+    self._database_object = None
+    self._row_identifiers = {}
 
   def _Close(self):
     """Closes a file system.
@@ -32,9 +37,9 @@ class SQLiteBlobFileSystem(file_system.FileSystem):
     Raises:
       IOError: if the close failed.
     """
-    self._file_object.close()
-    self._file_object = None
-    self._number_of_rows = None
+    self._database_object.Close()
+    self._database_object = None
+    self._row_identifiers = {}
 
   def _Open(self, path_spec, mode='rb'):
     """Opens the file system object defined by path specification.
@@ -57,7 +62,13 @@ class SQLiteBlobFileSystem(file_system.FileSystem):
     file_object = resolver.Resolver.OpenFileObject(
         path_spec.parent, resolver_context=self._resolver_context)
 
-    self._file_object = file_object
+    try:
+      database_object = sqlite_database.SQLiteDatabaseFile()
+      database_object.Open(file_object)
+    finally:
+      file_object.close()
+
+    self._database_object = database_object
 
   def FileEntryExistsByPathSpec(self, path_spec):
     """Determines if a file entry for a path specification exists.
@@ -80,6 +91,14 @@ class SQLiteBlobFileSystem(file_system.FileSystem):
     file_object.close()
     return True
 
+  def GetDatabaseObject(self):
+    """Retrieves the SQLite database object.
+
+    Returns:
+      SQLiteDatabaseFile: SQLite database object.
+    """
+    return self._database_object
+
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
 
@@ -101,6 +120,78 @@ class SQLiteBlobFileSystem(file_system.FileSystem):
     return sqlite_blob_file_entry.SQLiteBlobFileEntry(
         self._resolver_context, self, path_spec)
 
+  def GetRowBlobs(self, table_name, column_name):
+    """Retrieves the blobs of all the rows of a column.
+
+    The row identifiers are enumerated with a single query, hence opening
+    a blob does not require the rows before it to be skipped. Each blob is
+    opened through the resolver, which retrieves its type and size by
+    rowid, since the SQLite database object has a single cursor that is
+    shared by the file-like objects and cannot be kept open while the rows
+    are yielded.
+
+    Args:
+      table_name (str): name of the table.
+      column_name (str): name of the column.
+
+    Yields:
+      tuple[SQLiteBlobPathSpec, SQLiteBlobFile]: path specification and
+          file-like object of the blob of a row. The caller is responsible
+          for closing the file-like object.
+
+    Raises:
+      BackEndError: if the table or column does not exist.
+    """
+    if (not self._database_object.HasTable(table_name) or
+        not self._database_object.HasColumn(table_name, column_name)):
+      raise errors.BackEndError(
+          'Missing table: {0:s} or column: {1:s}'.format(
+              table_name, column_name))
+
+    row_identifiers = self.GetRowIdentifiers(table_name)
+    if row_identifiers is not None:
+      number_of_rows = len(row_identifiers)
+    else:
+      number_of_rows = self._database_object.GetNumberOfRows(table_name)
+
+    for row_index in range(number_of_rows):
+      path_spec = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+          table_name=table_name, column_name=column_name, row_index=row_index,
+          parent=self._path_spec.parent)
+      file_object = resolver.Resolver.OpenFileObject(
+          path_spec, resolver_context=self._resolver_context)
+      yield path_spec, file_object
+
+  def GetRowIdentifiers(self, table_name):
+    """Retrieves the row identifiers in the order of the row indexes.
+
+    The row index of a row corresponds to the position of its row identifier
+    (rowid) in ascending order. The row identifiers are cached per table,
+    hence they are shared by the columns of the table.
+
+    Args:
+      table_name (str): name of the table.
+
+    Returns:
+      list[int]: row identifiers (rowid), where the list index corresponds to
+          the row index, or None if the table has no row identifiers.
+    """
+    lookup_key = table_name.lower()
+    if lookup_key not in self._row_identifiers:
+      # The rows are sorted by rowid, so that the row index does not depend
+      # on the table scan order chosen by the query planner.
+      query = 'SELECT rowid FROM {0:s} ORDER BY rowid'.format(table_name)
+      try:
+        row_identifiers = [
+            row[0] for row in self._database_object.Query(query)]
+      except IOError:
+        # The table has no rowid, for example a "WITHOUT ROWID" table.
+        row_identifiers = None
+
+      self._row_identifiers[lookup_key] = row_identifiers
+
+    return self._row_identifiers[lookup_key]
+
   def GetRootFileEntry(self):
     """Retrieves the root file entry.
 
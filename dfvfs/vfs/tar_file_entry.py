@@ -31,44 +31,9 @@ class TARDirectory(file_entry.Directory):
       # the location string does.
       tar_path = location[1:]
 
-      # Set of top level sub directories that have been yielded.
-      processed_directories = set()
-
-      tar_file = self._file_system.GetTARFile()
-      for tar_info in iter(tar_file.getmembers()):
-        path = tar_info.name
-
-        # Determine if the start of the TAR info name is similar to
-        # the location string. If not the file TAR info refers to is not in
-        # the same directory.
-        if not path or not path.startswith(tar_path):
-          continue
-
-        # Ignore the directory itself.
-        if path == tar_path:
-          continue
-
-        path_segment, suffix = self._file_system.GetPathSegmentAndSuffix(
-            tar_path, path)
-        if not path_segment:
-          continue
-
-        # Sometimes the TAR file lacks directories, therefore we will
-        # provide virtual ones.
-        if suffix:
-          path_spec_location = self._file_system.JoinPath([
-              location, path_segment])
-          is_directory = True
-
-        else:
-          path_spec_location = self._file_system.JoinPath([path])
-          is_directory = tar_info.isdir()
-
-        if is_directory:
-          if path_spec_location in processed_directories:
-            continue
-          processed_directories.add(path_spec_location)
-
+      member_index = self._file_system.GetArchiveMemberIndex()
+      for name in member_index.GetSubEntryNames(tar_path):
+        path_spec_location = self._file_system.JoinPath([location, name])
         yield tar_path_spec.TARPathSpec(
             location=path_spec_location, parent=self.path_spec.parent)
 
@@ -190,9 +155,10 @@ class TARFileEntry(file_entry.FileEntry):
           continue
 
         kwargs = {}
-        try:
-          kwargs['tar_info'] = tar_file.getmember(location[1:])
-        except KeyError:
+        tar_info = self._file_system.GetTARInfoByPathSpec(path_spec)
+        if tar_info:
+          kwargs['tar_info'] = tar_info
+        else:
           kwargs['is_virtual'] = True
 
         yield TARFileEntry(
@@ -266,10 +232,6 @@ class TARFileEntry(file_entry.FileEntry):
       if len(location) == 1:
         return None
 
-      tar_file = self._file_system.GetTARFile()
-      try:
-        self._tar_info = tar_file.getmember(location[1:])
-      except KeyError:
-        pass
+      self._tar_info = self._file_system.GetTARInfoByPathSpec(self.path_spec)
 
     return self._tar_info
@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 import os
 import tarfile
 
+from dfvfs.lib import archive_index
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.path import tar_path_spec
@@ -32,6 +33,7 @@ class TARFileSystem(file_system.FileSystem):
       encoding (Optional[str]): file entry name encoding.
     """
     super(TARFileSystem, self).__init__(resolver_context)
+    self._archive_member_index = None
     self._file_object = None
     self._tar_file = None
     self.encoding = encoding
@@ -45,6 +47,8 @@ class TARFileSystem(file_system.FileSystem):
     self._tar_file.close()
     self._tar_file = None
 
+    self._archive_member_index = None
+
     self._file_object.close()
     self._file_object = None
 
@@ -101,20 +105,10 @@ class TARFileSystem(file_system.FileSystem):
     if len(location) == 1:
       return True
 
-    try:
-      self._tar_file.getmember(location[1:])
-      return True
-    except KeyError:
-      pass
-
-    # Check if location could be a virtual directory.
-    for name in iter(self._tar_file.getnames()):
-      # The TAR info name does not have the leading path separator as
-      # the location string does.
-      if name.startswith(location[1:]):
-        return True
-
-    return False
+    # The TAR info name does not have the leading path separator as
+    # the location string does.
+    member_index = self.GetArchiveMemberIndex()
+    return member_index.PathExists(location[1:])
 
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
@@ -136,14 +130,85 @@ class TARFileSystem(file_system.FileSystem):
           is_virtual=True)
 
     kwargs = {}
-    try:
-      kwargs['tar_info'] = self._tar_file.getmember(location[1:])
-    except KeyError:
+    tar_info = self.GetTARInfoByPathSpec(path_spec)
+    if tar_info:
+      kwargs['tar_info'] = tar_info
+    else:
       kwargs['is_virtual'] = True
 
     return tar_file_entry.TARFileEntry(
         self._resolver_context, self, path_spec, **kwargs)
 
+  def GetArchiveMemberIndex(self):
+    """Retrieves the archive member index.
+
+    The index is built from the TAR info of all members the first time it
+    is needed.
+
+    Returns:
+      ArchiveMemberIndex: archive member index.
+    """
+    if not self._archive_member_index:
+      member_index = archive_index.ArchiveMemberIndex(
+          path_separator=self.PATH_SEPARATOR)
+      for tar_info in self._tar_file.getmembers():
+        member_index.AddMember(
+            tar_info.name, tar_info, is_directory=tar_info.isdir())
+
+      self._archive_member_index = member_index
+
+    return self._archive_member_index
+
+  def GetMemberFileObjects(self):
+    """Retrieves the file-like objects of the regular file members.
+
+    The members are read in archive order in a single pass over a separate
+    instance of the parent file-like object, without seeking backwards. This
+    allows the data of all members of a TAR in a compressed stream to be
+    read with a single decompression pass.
+
+    Note that a file-like object is only valid until the next member is
+    retrieved and can only be read sequentially.
+
+    Yields:
+      tuple[TARPathSpec, file]: path specification and file-like object
+          of a regular file member.
+    """
+    parent_path_spec = self._path_spec.parent
+
+    # A separate resolver context, with the same settings, is used so that
+    # the parent file-like object is not shared with the file system.
+    resolver_context = self._resolver_context.CreateEmptyCopy()
+    file_object = resolver.Resolver.OpenFileObject(
+        parent_path_spec, resolver_context=resolver_context)
+
+    try:
+      file_object.seek(0, os.SEEK_SET)
+
+      # Explicitly tell tarfile to read an uncompressed stream. Compression
+      # should be handled by the file-like object.
+      tar_file = tarfile.open(mode='r|', fileobj=file_object)
+
+      try:
+        for tar_info in tar_file:
+          if not tar_info.isfile():
+            continue
+
+          location = self.JoinPath([tar_info.name])
+          path_spec = tar_path_spec.TARPathSpec(
+              location=location, parent=parent_path_spec)
+
+          yield path_spec, tar_file.extractfile(tar_info)
+
+      finally:
+        tar_file.close()
+
+    finally:
+      file_object.close()
+      # Closing the file-like object keeps it cached in the resolver context,
+      # hence the context is emptied to release the parent file-like objects.
+      resolver_context.Empty()
+
   def GetRootFileEntry(self):
     """Retrieves the root file entry.
 
@@ -184,7 +249,7 @@ class TARFileSystem(file_system.FileSystem):
     if len(location) == 1:
       return None
 
-    try:
-      return self._tar_file.getmember(location[1:])
-    except KeyError:
-      pass
+    # Note that the names of TAR members are stored without a trailing path
+    # separator.
+    member_index = self.GetArchiveMemberIndex()
+    return member_index.GetMember(location[1:].rstrip(self.PATH_SEPARATOR))
@@ -18,6 +18,21 @@ from dfvfs.resolver import resolver
 from dfvfs.vfs import file_entry
 
 
+# TODO: implement support for:
+# pytsk3.TSK_FS_META_TYPE_UNDEF
+# pytsk3.TSK_FS_META_TYPE_SHAD
+# pytsk3.TSK_FS_META_TYPE_WHT
+# pytsk3.TSK_FS_META_TYPE_VIRT
+_TSK_FS_META_TYPE_FILE_ENTRY_TYPES = {
+    int(pytsk3.TSK_FS_META_TYPE_BLK): definitions.FILE_ENTRY_TYPE_DEVICE,
+    int(pytsk3.TSK_FS_META_TYPE_CHR): definitions.FILE_ENTRY_TYPE_DEVICE,
+    int(pytsk3.TSK_FS_META_TYPE_DIR): definitions.FILE_ENTRY_TYPE_DIRECTORY,
+    int(pytsk3.TSK_FS_META_TYPE_FIFO): definitions.FILE_ENTRY_TYPE_PIPE,
+    int(pytsk3.TSK_FS_META_TYPE_LNK): definitions.FILE_ENTRY_TYPE_LINK,
+    int(pytsk3.TSK_FS_META_TYPE_REG): definitions.FILE_ENTRY_TYPE_FILE,
+    int(pytsk3.TSK_FS_META_TYPE_SOCK): definitions.FILE_ENTRY_TYPE_SOCKET}
+
+
 class TSKTime(dfdatetime_interface.DateTimeValues):
   """SleuthKit timestamp.
 
@@ -255,6 +270,21 @@ class TSKDirectory(file_entry.Directory):
     Yields:
       TSKPathSpec: a path specification.
 
+    Raises:
+      BackEndError: if pytsk3 cannot open the directory.
+    """
+    for directory_entry in self._ListEntriesGenerator():
+      yield directory_entry.path_spec
+
+  def _ListEntriesGenerator(self):
+    """Retrieves directory entry records.
+
+    The name, inode and type are read from the directory walk, hence no
+    pytsk3.File object is opened per directory entry.
+
+    Yields:
+      DirectoryEntry: a directory entry.
+
     Raises:
       BackEndError: if pytsk3 cannot open the directory.
     """
@@ -306,6 +336,7 @@ class TSKDirectory(file_entry.Directory):
 
         directory_entry_inode = tsk_directory_entry.info.meta.addr
         directory_entry = None
+        name = None
 
         # Ignore references to self.
         if directory_entry_inode == inode:
@@ -338,16 +369,34 @@ class TSKDirectory(file_entry.Directory):
             if directory_entry in ['.', '..']:
               continue
 
+            name = directory_entry
+
             if location == self._file_system.PATH_SEPARATOR:
               directory_entry = self._file_system.JoinPath([directory_entry])
             else:
               directory_entry = self._file_system.JoinPath([
                   location, directory_entry])
 
-        yield tsk_path_spec.TSKPathSpec(
+        path_spec = tsk_path_spec.TSKPathSpec(
             inode=directory_entry_inode, location=directory_entry,
             parent=self.path_spec.parent)
 
+        # The type is an instance of pytsk3.TSK_FS_META_TYPE_ENUM.
+        tsk_fs_meta_type = getattr(
+            tsk_directory_entry.info.meta, 'type',
+            pytsk3.TSK_FS_META_TYPE_UNDEF)
+        entry_type = _TSK_FS_META_TYPE_FILE_ENTRY_TYPES.get(
+            int(tsk_fs_meta_type), None)
+
+        # The flags are an instance of pytsk3.TSK_FS_META_FLAG_ENUM.
+        flags = getattr(tsk_directory_entry.info.meta, 'flags', 0)
+        is_allocated = bool(int(flags) & pytsk3.TSK_FS_META_FLAG_ALLOC)
+
+        yield file_entry.DirectoryEntry(
+            path_spec, entry_type=entry_type,
+            identifier=directory_entry_inode, is_allocated=is_allocated,
+            name=name)
+
 
 class TSKFileEntry(file_entry.FileEntry):
   """File system file entry that uses pytsk3."""
@@ -458,25 +507,8 @@ class TSKFileEntry(file_entry.FileEntry):
     tsk_fs_meta_type = getattr(
         tsk_file.info.meta, 'type', pytsk3.TSK_FS_META_TYPE_UNDEF)
 
-    if tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_REG:
-      self.entry_type = definitions.FILE_ENTRY_TYPE_FILE
-    elif tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_DIR:
-      self.entry_type = definitions.FILE_ENTRY_TYPE_DIRECTORY
-    elif tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_LNK:
-      self.entry_type = definitions.FILE_ENTRY_TYPE_LINK
-    elif tsk_fs_meta_type in (
-        pytsk3.TSK_FS_META_TYPE_CHR, pytsk3.TSK_FS_META_TYPE_BLK):
-      self.entry_type = definitions.FILE_ENTRY_TYPE_DEVICE
-    elif tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_FIFO:
-      self.entry_type = definitions.FILE_ENTRY_TYPE_PIPE
-    elif tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_SOCK:
-      self.entry_type = definitions.FILE_ENTRY_TYPE_SOCKET
-
-    # TODO: implement support for:
-    # pytsk3.TSK_FS_META_TYPE_UNDEF
-    # pytsk3.TSK_FS_META_TYPE_SHAD
-    # pytsk3.TSK_FS_META_TYPE_WHT
-    # pytsk3.TSK_FS_META_TYPE_VIRT
+    self.entry_type = _TSK_FS_META_TYPE_FILE_ENTRY_TYPES.get(
+        int(tsk_fs_meta_type), None)
 
   def _GetAttributes(self):
     """Retrieves the attributes.
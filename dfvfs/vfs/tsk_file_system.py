@@ -64,7 +64,10 @@ class TSKFileSystem(file_system.FileSystem):
         path_spec.parent, resolver_context=self._resolver_context)
 
     try:
-      tsk_image_object = tsk_image.TSKFileSystemImage(file_object)
+      tsk_image_object = tsk_image.TSKFileSystemImage(
+          file_object,
+          blocks_cache=self._resolver_context.tsk_image_blocks_cache,
+          identifier=path_spec.parent.comparable)
       tsk_file_system = pytsk3.FS_Info(tsk_image_object)
     except:
       file_object.close()
@@ -5,8 +5,10 @@ from __future__ import unicode_literals
 
 import zipfile
 
+from dfvfs.lib import archive_index
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
+from dfvfs.lib import py2to3
 from dfvfs.path import zip_path_spec
 from dfvfs.resolver import resolver
 from dfvfs.vfs import file_system
@@ -31,6 +33,7 @@ class ZipFileSystem(file_system.FileSystem):
       encoding (Optional[str]): encoding of the file entry name.
     """
     super(ZipFileSystem, self).__init__(resolver_context)
+    self._archive_member_index = None
     self._file_object = None
     self._zip_file = None
     self.encoding = encoding
@@ -44,6 +47,8 @@ class ZipFileSystem(file_system.FileSystem):
     self._zip_file.close()
     self._zip_file = None
 
+    self._archive_member_index = None
+
     self._file_object.close()
     self._file_object = None
 
@@ -101,14 +106,14 @@ class ZipFileSystem(file_system.FileSystem):
     except KeyError:
       pass
 
-    # Check if location could be a virtual directory.
-    for name in iter(self._zip_file.namelist()):
-      # The ZIP info name does not have the leading path separator as
-      # the location string does.
-      if name.startswith(location[1:]):
-        return True
+    # Check if location could be a virtual directory. Note that the ZIP info
+    # name does not have the leading path separator as the location string
+    # does.
+    member_index = self.GetArchiveMemberIndex()
+    if location.endswith(self.PATH_SEPARATOR):
+      return member_index.DirectoryExists(location[1:])
 
-    return False
+    return member_index.PathExists(location[1:])
 
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
@@ -138,6 +143,41 @@ class ZipFileSystem(file_system.FileSystem):
     return zip_file_entry.ZipFileEntry(
         self._resolver_context, self, path_spec, **kwargs)
 
+  def GetArchiveMemberIndex(self):
+    """Retrieves the archive member index.
+
+    The index is built from the ZIP info of all members the first time it
+    is needed.
+
+    Returns:
+      ArchiveMemberIndex: archive member index.
+    """
+    if not self._archive_member_index:
+      member_index = archive_index.ArchiveMemberIndex(
+          path_separator=self.PATH_SEPARATOR)
+      for zip_info in self._zip_file.infolist():
+        path = getattr(zip_info, 'filename', None)
+        if path is not None and not isinstance(path, py2to3.UNICODE_TYPE):
+          try:
+            path = path.decode(self.encoding)
+          except UnicodeDecodeError:
+            path = None
+
+        if path:
+          member_index.AddMember(path, zip_info)
+
+      self._archive_member_index = member_index
+
+    return self._archive_member_index
+
+  def GetParentFileObject(self):
+    """Retrieves the file-like object of the ZIP file.
+
+    Returns:
+      FileIO: file-like object of the ZIP file or None.
+    """
+    return self._file_object
+
   def GetRootFileEntry(self):
     """Retrieves the root file entry.
 
@@ -4,6 +4,7 @@
 
 from __future__ import unicode_literals
 
+import os
 import unittest
 
 from dfvfs.analyzer import analyzer
@@ -66,7 +67,39 @@ class AnalyzerTest(shared_test_lib.BaseTestCase):
         definitions.FORMAT_CATEGORY_VOLUME_SYSTEM)
     self.assertIsNotNone(specification_store)
 
-  # TODO: add tests for _GetTypeIndicators
+  @shared_test_lib.skipUnlessHasTestFile(['syslog.tar'])
+  def testGetTypeIndicatorsCache(self):
+    """Tests the type indicators cache of the _GetTypeIndicators function."""
+    test_file = self._GetTestFilePath(['syslog.tar'])
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+    analyzer.Analyzer._FlushCache(definitions.FORMAT_CATEGORIES)
+
+    expected_type_indicators = [definitions.TYPE_INDICATOR_TAR]
+    type_indicators = analyzer.Analyzer.GetArchiveTypeIndicators(path_spec)
+    self.assertEqual(type_indicators, expected_type_indicators)
+
+    cache_key = (
+        definitions.FORMAT_CATEGORY_ARCHIVE, path_spec.comparable,
+        os.path.getsize(test_file))
+    self.assertIn(cache_key, analyzer.Analyzer._type_indicators_cache)
+
+    # Make sure the cached type indicators are returned instead of the file
+    # being scanned again.
+    analyzer.Analyzer._type_indicators_cache[cache_key] = ('bogus', )
+
+    type_indicators = analyzer.Analyzer.GetArchiveTypeIndicators(path_spec)
+    self.assertEqual(type_indicators, ['bogus'])
+
+    type_indicators = analyzer.Analyzer.GetCompressedStreamTypeIndicators(
+        path_spec)
+    self.assertEqual(type_indicators, [])
+
+    analyzer.Analyzer._FlushCache([definitions.FORMAT_CATEGORY_ARCHIVE])
+    self.assertNotIn(cache_key, analyzer.Analyzer._type_indicators_cache)
+
+    type_indicators = analyzer.Analyzer.GetArchiveTypeIndicators(path_spec)
+    self.assertEqual(type_indicators, expected_type_indicators)
 
   def testHelperRegistration(self):
     """Tests the DeregisterHelper and RegisterHelper functions."""
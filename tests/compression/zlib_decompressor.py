@@ -15,6 +15,29 @@ from tests.compression import test_lib
 class ZlibDecompressorTestCase(test_lib.DecompressorTestCase):
   """Tests for the zlib decompressor object."""
 
+  def testCopyState(self):
+    """Tests the CopyState method."""
+    decompressor = zlib_decompressor.ZlibDecompressor()
+
+    compressed_data = (
+        b'x\x9c\x0b\xc9\xc8,V\x00\xa2D\x85\x92\xd4\xe2\x12=\x00)\x97\x05$')
+
+    uncompressed_data, _ = decompressor.Decompress(compressed_data[:8])
+
+    copied_decompressor = decompressor.CopyState()
+    self.assertIsInstance(
+        copied_decompressor, zlib_decompressor.ZlibDecompressor)
+
+    remaining_uncompressed_data, _ = decompressor.Decompress(
+        compressed_data[8:])
+    self.assertEqual(
+        uncompressed_data + remaining_uncompressed_data, b'This is a test.')
+
+    remaining_uncompressed_data, _ = copied_decompressor.Decompress(
+        compressed_data[8:])
+    self.assertEqual(
+        uncompressed_data + remaining_uncompressed_data, b'This is a test.')
+
   def testDecompress(self):
     """Tests the Decompress method."""
     decompressor = zlib_decompressor.ZlibDecompressor()
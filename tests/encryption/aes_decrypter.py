@@ -15,8 +15,8 @@ from tests.encryption import test_lib
 class AESDecrypterTestCase(test_lib.DecrypterTestCase):
   """Tests for the AES decrypter object."""
 
-  _AES_INITIALIZATION_VECTOR = 'This is an IV456'
-  _AES_KEY = 'This is a key123'
+  _AES_INITIALIZATION_VECTOR = b'This is an IV456'
+  _AES_KEY = b'This is a key123'
 
   def testInitialization(self):
     """Tests the initialization method."""
@@ -84,6 +84,46 @@ class AESDecrypterTestCase(test_lib.DecrypterTestCase):
     self.assertEqual(expected_decrypted_data, decrypted_data)
     self.assertEqual(expected_encrypted_data, encrypted_data)
 
+  def testDecryptBlocks(self):
+    """Tests the DecryptBlocks method."""
+    decrypter = aes_decrypter.AESDecrypter(
+        cipher_mode=definitions.ENCRYPTION_MODE_CBC,
+        initialization_vector=self._AES_INITIALIZATION_VECTOR,
+        key=self._AES_KEY)
+
+    self.assertEqual(decrypter.random_access_block_size, 16)
+
+    encrypted_data = (
+        b'2|\x7f\xd7\xff\xbay\xf9\x95?\x81\xc7\xaafV\xceB\x01\xdb8E7\xfe'
+        b'\x92j\xf0\x1d(\xb9\x9f\xad\x13')
+
+    decrypted_data = decrypter.DecryptBlocks(encrypted_data)
+    self.assertEqual(decrypted_data, b'This is secret encrypted text!!!')
+
+    # Test decryption starting at the second block.
+    decrypted_data = decrypter.DecryptBlocks(
+        encrypted_data[16:], preceding_encrypted_block=encrypted_data[:16])
+    self.assertEqual(decrypted_data, b'This is secret encrypted text!!!'[16:])
+
+    # Test that the state of the decrypter is not changed.
+    decrypted_data, _ = decrypter.Decrypt(encrypted_data)
+    self.assertEqual(decrypted_data, b'This is secret encrypted text!!!')
+
+    # Test encrypted data that is not a multiple of the block size.
+    with self.assertRaises(ValueError):
+      decrypter.DecryptBlocks(encrypted_data[:-1])
+
+    # Test cipher mode without random-access decryption.
+    decrypter = aes_decrypter.AESDecrypter(
+        cipher_mode=definitions.ENCRYPTION_MODE_CFB,
+        initialization_vector=self._AES_INITIALIZATION_VECTOR,
+        key=self._AES_KEY)
+
+    self.assertIsNone(decrypter.random_access_block_size)
+
+    with self.assertRaises(ValueError):
+      decrypter.DecryptBlocks(encrypted_data)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -15,8 +15,8 @@ from tests.encryption import test_lib
 class DES3DecrypterTestCase(test_lib.DecrypterTestCase):
   """Tests for the triple DES decrypter object."""
 
-  _DES3_INITIALIZATION_VECTOR = 'This IV!'
-  _DES3_KEY = 'This is a key123'
+  _DES3_INITIALIZATION_VECTOR = b'This IV!'
+  _DES3_KEY = b'This is a key123'
 
   def testInitialization(self):
     """Tests the initialization method."""
@@ -85,6 +85,46 @@ class DES3DecrypterTestCase(test_lib.DecrypterTestCase):
     self.assertEqual(expected_decrypted_data, decrypted_data)
     self.assertEqual(expected_encrypted_data, encrypted_data)
 
+  def testDecryptBlocks(self):
+    """Tests the DecryptBlocks method."""
+    decrypter = des3_decrypter.DES3Decrypter(
+        cipher_mode=definitions.ENCRYPTION_MODE_CBC,
+        initialization_vector=self._DES3_INITIALIZATION_VECTOR,
+        key=self._DES3_KEY)
+
+    self.assertEqual(decrypter.random_access_block_size, 8)
+
+    encrypted_data = (
+        b'e\x86k\t\x01W\xd7d\xe4\xa4\xb3~\x80\xd3\xc3\x7fq{E}:L\n '
+        b'.2\xd1\xcf\x8a\xf1\xa0!')
+
+    decrypted_data = decrypter.DecryptBlocks(encrypted_data)
+    self.assertEqual(decrypted_data, b'This is secret encrypted text!!!')
+
+    # Test decryption starting at the second block.
+    decrypted_data = decrypter.DecryptBlocks(
+        encrypted_data[8:], preceding_encrypted_block=encrypted_data[:8])
+    self.assertEqual(decrypted_data, b'This is secret encrypted text!!!'[8:])
+
+    # Test that the state of the decrypter is not changed.
+    decrypted_data, _ = decrypter.Decrypt(encrypted_data)
+    self.assertEqual(decrypted_data, b'This is secret encrypted text!!!')
+
+    # Test encrypted data that is not a multiple of the block size.
+    with self.assertRaises(ValueError):
+      decrypter.DecryptBlocks(encrypted_data[:-1])
+
+    # Test cipher mode without random-access decryption.
+    decrypter = des3_decrypter.DES3Decrypter(
+        cipher_mode=definitions.ENCRYPTION_MODE_CFB,
+        initialization_vector=self._DES3_INITIALIZATION_VECTOR,
+        key=self._DES3_KEY)
+
+    self.assertIsNone(decrypter.random_access_block_size)
+
+    with self.assertRaises(ValueError):
+      decrypter.DecryptBlocks(encrypted_data)
+
 
 if __name__ == '__main__':
   unittest.main()
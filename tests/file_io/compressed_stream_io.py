@@ -299,6 +299,54 @@ class ZlibCompressedStreamTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testReadInto(self):
+    """Test the readinto functionality."""
+    file_object = compressed_stream_io.CompressedStream(self._resolver_context)
+    file_object.open(path_spec=self._compressed_stream_path_spec)
+
+    self._TestReadIntoFileObject(file_object)
+
+    file_object.close()
+
+  @shared_test_lib.skipUnlessHasTestFile(['syslog'])
+  def testReadWithSeekPoints(self):
+    """Test the read functionality with seek points."""
+    test_file = self._GetTestFilePath(['syslog'])
+    with open(test_file, 'rb') as file_object:
+      expected_data = file_object.read()
+
+    file_object = compressed_stream_io.CompressedStream(self._resolver_context)
+    file_object.open(path_spec=self._compressed_stream_path_spec)
+
+    # pylint: disable=protected-access
+    file_object._COMPRESSED_DATA_BUFFER_SIZE = 16
+    file_object._MAXIMUM_NUMBER_OF_SEEK_POINTS = 4
+    file_object._seek_point_interval = 128
+
+    self.assertEqual(file_object.get_size(), len(expected_data))
+
+    number_of_seek_points = len(file_object._seek_points)
+    self.assertGreater(number_of_seek_points, 1)
+    self.assertLessEqual(
+        number_of_seek_points, file_object._MAXIMUM_NUMBER_OF_SEEK_POINTS)
+
+    # The syslog test file requires more seek points than the maximum, hence
+    # the seek point interval has been increased.
+    self.assertGreater(file_object._seek_point_interval, 128)
+
+    for offset in (1000, 167, 500, 0, 1200, 600):
+      file_object.seek(offset, os.SEEK_SET)
+      self.assertEqual(
+          file_object.read(40), expected_data[offset:offset + 40])
+
+    # Seek points are only recorded once.
+    self.assertEqual(len(file_object._seek_points), number_of_seek_points)
+
+    file_object.seek(0, os.SEEK_SET)
+    self.assertEqual(file_object.read(), expected_data)
+
+    file_object.close()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -85,6 +85,15 @@ class Base16EncodedStreamTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testReadInto(self):
+    """Test the readinto functionality."""
+    file_object = encoded_stream_io.EncodedStream(self._resolver_context)
+    file_object.open(path_spec=self._encoded_stream_path_spec)
+
+    self._TestReadIntoFileObject(file_object)
+
+    file_object.close()
+
 
 @shared_test_lib.skipUnlessHasTestFile(['syslog.base32'])
 class Base32EncodedStreamTest(test_lib.SylogTestCase):
@@ -100,6 +100,39 @@ class AESEncryptedStreamWithKeyChainTest(test_lib.PaddedSyslogTestCase):
 
     file_object.close()
 
+  @shared_test_lib.skipUnlessHasTestFile(['syslog'])
+  def testReadRandomAccess(self):
+    """Test the read functionality with random-access decryption."""
+    test_file = self._GetTestFilePath(['syslog'])
+    with open(test_file, 'rb') as file_object:
+      expected_data = file_object.read()
+
+    expected_data += b'=' * self.padding_size
+
+    resolver_context = context.Context(maximum_number_of_decryption_threads=2)
+    file_object = encrypted_stream_io.EncryptedStream(resolver_context)
+
+    # pylint: disable=protected-access
+    file_object._RANDOM_ACCESS_DATA_BUFFER_SIZE = 32
+    file_object._THREADED_DECRYPTION_DATA_SIZE = 64
+
+    file_object.open(path_spec=self._encrypted_stream_path_spec)
+
+    self.assertEqual(file_object.get_size(), len(expected_data))
+    self.assertEqual(file_object._random_access_block_size, 16)
+
+    for offset in (1000, 167, 500, 0, 1200, 17, 600):
+      file_object.seek(offset, os.SEEK_SET)
+      self.assertEqual(
+          file_object.read(40), expected_data[offset:offset + 40])
+
+    # A large read is decrypted by the worker threads.
+    file_object.seek(5, os.SEEK_SET)
+    self.assertEqual(file_object.read(), expected_data[5:])
+    self.assertIsNotNone(file_object._thread_pool)
+
+    file_object.close()
+
 
 @shared_test_lib.skipUnlessHasTestFile(['syslog.aes'])
 class AESEncryptedStreamTest(test_lib.PaddedSyslogTestCase):
@@ -416,6 +449,15 @@ class RC4EncryptedStreamWithKeyChainTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testReadInto(self):
+    """Test the readinto functionality."""
+    file_object = encrypted_stream_io.EncryptedStream(self._resolver_context)
+    file_object.open(path_spec=self._encrypted_stream_path_spec)
+
+    self._TestReadIntoFileObject(file_object)
+
+    file_object.close()
+
 
 if __name__ == '__main__':
   unittest.main()
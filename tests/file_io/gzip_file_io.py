@@ -114,6 +114,107 @@ class GzipFileTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  @shared_test_lib.skipUnlessHasTestFile(['fsevents_000000000000b208'])
+  def testReadWithMaximumCacheSize(self):
+    """Tests reading with the maximum cache size set in the context."""
+    resolver_context = context.Context(maximum_gzip_cache_size=128 * 1024)
+
+    test_path = self._GetTestFilePath(['fsevents_000000000000b208'])
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    test_gzip_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_GZIP, parent=test_os_path_spec)
+
+    file_object = gzip_file_io.GzipFile(resolver_context)
+    file_object.open(path_spec=test_gzip_path_spec)
+
+    expected_data = file_object.read()
+    self.assertEqual(len(expected_data), 506631)
+
+    # Alternate reads between the members.
+    for offset in (500000, 100, 28530, 300000, 200, 506627):
+      file_object.seek(offset)
+      data = file_object.read(100)
+      self.assertEqual(data, expected_data[offset:offset + 100])
+
+    # pylint: disable=protected-access
+    block_cache = file_object._block_cache
+    self.assertEqual(block_cache.maximum_size, 128 * 1024)
+    self.assertLessEqual(block_cache.size, 128 * 1024)
+
+    file_object.close()
+
+  @shared_test_lib.skipUnlessHasTestFile(['syslog.bgz'])
+  def testReadBGZF(self):
+    """Tests reading a BGZF file that contains multiple gzip members."""
+    test_path = self._GetTestFilePath(['syslog.bgz'])
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    test_gzip_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_GZIP, parent=test_os_path_spec)
+
+    for number_of_threads in (0, 2):
+      resolver_context = context.Context(
+          maximum_number_of_gzip_threads=number_of_threads)
+
+      file_object = gzip_file_io.GzipFile(resolver_context)
+      file_object.open(path_spec=test_gzip_path_spec)
+
+      # pylint: disable=protected-access
+      self.assertEqual(file_object._number_of_threads, number_of_threads)
+
+      self._TestGetSizeFileObject(file_object)
+      self.assertEqual(file_object.operating_systems, [0xff] * 4)
+
+      self._TestReadFileObject(file_object)
+      self._TestSeekFileObject(file_object)
+
+      # Read across member boundaries.
+      file_object.seek(500)
+      data = file_object.read(600)
+      self.assertEqual(len(data), 600)
+
+      file_object.seek(0)
+      self.assertEqual(file_object.read()[500:1100], data)
+
+      if number_of_threads:
+        self.assertIsNotNone(resolver_context._gzip_thread_pool)
+      else:
+        self.assertIsNone(resolver_context._gzip_thread_pool)
+
+      file_object.close()
+
+      resolver_context.Empty()
+      self.assertIsNone(resolver_context._gzip_thread_pool)
+
+  @shared_test_lib.skipUnlessHasTestFile(['syslog.bgz'])
+  def testReadBGZFAfterEmpty(self):
+    """Tests reading a BGZF file after the resolver context was emptied."""
+    test_path = self._GetTestFilePath(['syslog.bgz'])
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    test_gzip_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_GZIP, parent=test_os_path_spec)
+
+    resolver_context = context.Context(maximum_number_of_gzip_threads=2)
+
+    file_object = gzip_file_io.GzipFile(resolver_context)
+    file_object.open(path_spec=test_gzip_path_spec)
+
+    expected_data = file_object.read()
+
+    # Emptying the resolver context terminates the thread pool, which is
+    # created again when the open file-like object is read.
+    # pylint: disable=protected-access
+    resolver_context.Empty()
+    self.assertIsNone(resolver_context._gzip_thread_pool)
+
+    file_object.seek(0)
+    self.assertEqual(file_object.read(), expected_data)
+    self.assertIsNotNone(resolver_context._gzip_thread_pool)
+
+    resolver_context.Empty()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -4,6 +4,10 @@
 
 from __future__ import unicode_literals
 
+import os
+import shutil
+import sqlite3
+import tempfile
 import unittest
 
 from dfvfs.file_io import sqlite_blob_file_io
@@ -55,6 +59,27 @@ class SQLiteBlobFileWithConditionTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testOpenSharedDatabase(self):
+    """Test that file-like objects with the same parent share the database."""
+    file_object1 = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+    file_object1.open(path_spec=self._sqlite_blob_path_spec)
+
+    path_spec = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+        table_name='blobs', column_name='blob', row_index=0,
+        parent=self._sqlite_blob_path_spec.parent)
+    file_object2 = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+    file_object2.open(path_spec=path_spec)
+
+    # pylint: disable=protected-access
+    self.assertIs(
+        file_object1._database_object, file_object2._database_object)
+
+    file_object1.close()
+
+    self._TestReadFileObject(file_object2)
+
+    file_object2.close()
+
 
 @shared_test_lib.skipUnlessHasTestFile(['syslog.db'])
 class SQLiteBlobFileWithIndexTest(test_lib.SylogTestCase):
@@ -96,5 +121,84 @@ class SQLiteBlobFileWithIndexTest(test_lib.SylogTestCase):
     file_object.close()
 
 
+class SQLiteBlobFileWithBlobTest(shared_test_lib.BaseTestCase):
+  """The unit test for a SQLite blob file-like object using a blob value."""
+
+  _BLOB_DATA = b''.join([
+      '{0:04d}'.format(index).encode('ascii') for index in range(4096)])
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._temporary_directory = tempfile.mkdtemp()
+
+    test_file = os.path.join(self._temporary_directory, 'blob.db')
+    connection = sqlite3.connect(test_file)
+    connection.execute(
+        'CREATE TABLE blobs (identifier TEXT, blob BLOB)')
+    connection.execute(
+        'INSERT INTO blobs VALUES (?, ?)',
+        ('myblob', sqlite3.Binary(self._BLOB_DATA)))
+    connection.commit()
+    connection.close()
+
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._sqlite_blob_path_spec = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+        table_name='blobs', column_name='blob',
+        row_condition=('identifier', '==', 'myblob'), parent=path_spec)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._resolver_context.Empty()
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testRead(self):
+    """Test the read functionality."""
+    file_object = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+    file_object.open(path_spec=self._sqlite_blob_path_spec)
+
+    # The blob data is read incrementally.
+    # pylint: disable=protected-access
+    self.assertIsNone(file_object._blob)
+    self.assertIsNotNone(file_object._row_identifier)
+
+    self.assertEqual(file_object.get_size(), len(self._BLOB_DATA))
+
+    file_object.seek(4000, os.SEEK_SET)
+    read_buffer = file_object.read(size=8)
+    self.assertEqual(read_buffer, b'10001001')
+
+    file_object.seek(-4, os.SEEK_END)
+    read_buffer = file_object.read(size=16)
+    self.assertEqual(read_buffer, b'4095')
+
+    file_object.seek(0, os.SEEK_SET)
+    read_buffer = file_object.read()
+    self.assertEqual(read_buffer, self._BLOB_DATA)
+
+    file_object.close()
+
+  def testReadWithoutIncrementalBlobIO(self):
+    """Test the read functionality without incremental blob I/O."""
+    file_object = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+    file_object.open(path_spec=self._sqlite_blob_path_spec)
+
+    # Fall back to reading ranges of the blob with queries.
+    # pylint: disable=protected-access
+    if file_object._blob_object:
+      file_object._blob_object.close()
+      file_object._blob_object = None
+
+    file_object.seek(4000, os.SEEK_SET)
+    read_buffer = file_object.read(size=8)
+    self.assertEqual(read_buffer, b'10001001')
+
+    file_object.seek(-4, os.SEEK_END)
+    read_buffer = file_object.read(size=16)
+    self.assertEqual(read_buffer, b'4095')
+
+    file_object.close()
+
+
 if __name__ == '__main__':
   unittest.main()
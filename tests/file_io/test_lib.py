@@ -316,6 +316,46 @@ class SylogTestCase(shared_test_lib.BaseTestCase):
 
     self.assertEqual(file_object.get_offset(), expected_offset)
 
+  def _TestReadIntoFileObject(self, file_object, base_offset=167):
+    """Runs the read into tests on the file-like object.
+
+    Args:
+      file_object (file): file-like object with the test data.
+      base_offset (Optional[int]): base offset use in the tests.
+    """
+    file_object.seek(base_offset, os.SEEK_SET)
+
+    expected_buffer = (
+        b'Jan 22 07:53:01 myhostname.myhost.com CRON[31051]: (root) CMD '
+        b'(touch /var/run/crond.somecheck)\n')
+
+    read_buffer = bytearray(95)
+    read_count = file_object.readinto(read_buffer)
+
+    self.assertEqual(read_count, 95)
+    self.assertEqual(bytes(read_buffer), expected_buffer)
+    self.assertEqual(file_object.get_offset(), base_offset + 95)
+
+    # Test reading into part of a buffer.
+    file_object.seek(base_offset + 10, os.SEEK_SET)
+
+    read_buffer = bytearray(b'xxxxxxxx')
+    read_count = file_object.readinto(memoryview(read_buffer)[2:7])
+
+    self.assertEqual(read_count, 5)
+    self.assertEqual(bytes(read_buffer), b'xx53:01x')
+
+    # Test reading into a buffer that exceeds the end of the data.
+    file_object.seek(-5, os.SEEK_END)
+
+    read_buffer = bytearray(10)
+    read_count = file_object.readinto(read_buffer)
+
+    self.assertEqual(read_count, 5)
+
+    read_count = file_object.readinto(read_buffer)
+    self.assertEqual(read_count, 0)
+
   def _TestSeekFileObject(self, file_object, base_offset=167):
     """Runs the seek tests on the file-like object.
 
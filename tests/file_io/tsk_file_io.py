@@ -42,6 +42,50 @@ class TSKFileTest(test_lib.ImageFileTestCase):
     """Test the read functionality."""
     self._TestRead(self._os_path_spec)
 
+  def testReadWithReadAheadCache(self):
+    """Test the read functionality with the read-ahead cache."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=self._INODE_PASSWORDS_TXT, location='/passwords.txt',
+        parent=self._os_path_spec)
+    file_object = tsk_file_io.TSKFile(self._resolver_context)
+
+    file_object.open(path_spec=path_spec)
+    file_object.SetReadAheadCache(16, 2)
+
+    read_buffer = file_object.read(size=5)
+    self.assertEqual(read_buffer, b'place')
+    self.assertEqual(file_object.read_ahead_cache_hits, 0)
+    self.assertEqual(file_object.read_ahead_cache_misses, 1)
+
+    read_buffer = file_object.read(size=14)
+    self.assertEqual(read_buffer, b',user,password')
+    self.assertEqual(file_object.read_ahead_cache_hits, 1)
+    self.assertEqual(file_object.read_ahead_cache_misses, 2)
+
+    file_object.seek(0, os.SEEK_SET)
+    read_buffer = file_object.read(size=4)
+    self.assertEqual(read_buffer, b'plac')
+    self.assertEqual(file_object.read_ahead_cache_hits, 2)
+    self.assertEqual(file_object.read_ahead_cache_misses, 2)
+
+    file_object.seek(-6, os.SEEK_END)
+    read_buffer = file_object.read(size=15)
+    self.assertEqual(read_buffer, b'admin\n')
+    self.assertEqual(file_object.read_ahead_cache_hits, 2)
+    self.assertEqual(file_object.read_ahead_cache_misses, 4)
+
+    # Reads of the block size or larger bypass the read-ahead cache.
+    file_object.seek(0, os.SEEK_SET)
+    read_buffer = file_object.read(size=16)
+    self.assertEqual(read_buffer, b'place,user,passw')
+    self.assertEqual(file_object.read_ahead_cache_hits, 2)
+    self.assertEqual(file_object.read_ahead_cache_misses, 4)
+
+    with self.assertRaises(ValueError):
+      file_object.SetReadAheadCache(-1, 2)
+
+    file_object.close()
+
   def testReadADS(self):
     """Test the read functionality on an alternate data stream (ADS)."""
     test_file = self._GetTestFilePath(['vsstest.qcow2'])
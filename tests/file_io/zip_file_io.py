@@ -4,7 +4,11 @@
 
 from __future__ import unicode_literals
 
+import os
+import shutil
+import tempfile
 import unittest
+import zipfile
 
 from dfvfs.file_io import zip_file_io
 from dfvfs.path import os_path_spec
@@ -58,5 +62,104 @@ class ZipFileTest(test_lib.SylogTestCase):
     # TODO: add tests for read > UNCOMPRESSED_DATA_BUFFER_SIZE
 
 
+class ZipFileWithMembersTest(shared_test_lib.BaseTestCase):
+  """The unit test for a zip extracted file-like object of specific members."""
+
+  _DATA = b''.join([
+      '{0:08d}'.format(index).encode('ascii') for index in range(65536)])
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._temporary_directory = tempfile.mkdtemp()
+
+    test_file = os.path.join(self._temporary_directory, 'members.zip')
+    with zipfile.ZipFile(test_file, 'w') as zip_file:
+      zip_file.writestr(
+          'deflated', self._DATA, compress_type=zipfile.ZIP_DEFLATED)
+      zip_file.writestr('stored', self._DATA, compress_type=zipfile.ZIP_STORED)
+
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._resolver_context.Empty()
+    shutil.rmtree(self._temporary_directory, True)
+
+  def _TestRandomAccess(self, file_object):
+    """Runs random access read tests on the file-like object.
+
+    Args:
+      file_object (file): file-like object.
+    """
+    self.assertEqual(file_object.get_size(), len(self._DATA))
+
+    for offset in (400000, 8, 300000, 300004, 0, 524280):
+      file_object.seek(offset, os.SEEK_SET)
+      read_buffer = file_object.read(size=16)
+      self.assertEqual(read_buffer, self._DATA[offset:offset + 16])
+      self.assertEqual(file_object.get_offset(), offset + len(read_buffer))
+
+    file_object.seek(-4, os.SEEK_END)
+    read_buffer = file_object.read(size=16)
+    self.assertEqual(read_buffer, b'5535')
+
+    file_object.seek(0, os.SEEK_SET)
+    read_buffer = file_object.read()
+    self.assertEqual(read_buffer, self._DATA)
+
+  def testReadDeflated(self):
+    """Test the read functionality on a deflate compressed member."""
+    path_spec = zip_path_spec.ZipPathSpec(
+        location='/deflated', parent=self._os_path_spec)
+
+    file_object = zip_file_io.ZipFile(self._resolver_context)
+    # pylint: disable=protected-access
+    file_object._COMPRESSED_DATA_BUFFER_SIZE = 4096
+    file_object._DEFLATE_CHECKPOINT_INTERVAL = 64 * 1024
+    file_object.open(path_spec=path_spec)
+
+    self.assertIsNotNone(file_object._compressed_stream_offset)
+
+    self._TestRandomAccess(file_object)
+
+    self.assertTrue(file_object._deflate_checkpoints)
+
+    file_object.close()
+
+  def testReadDeflatedWithZipfile(self):
+    """Test the read functionality on a deflate compressed member."""
+    path_spec = zip_path_spec.ZipPathSpec(
+        location='/deflated', parent=self._os_path_spec)
+
+    file_object = zip_file_io.ZipFile(self._resolver_context)
+    file_object.open(path_spec=path_spec)
+
+    # Fall back to reading the member with zipfile.
+    # pylint: disable=protected-access
+    file_object._compressed_stream_offset = None
+
+    self._TestRandomAccess(file_object)
+
+    file_object.close()
+
+  def testReadStored(self):
+    """Test the read functionality on a stored member."""
+    path_spec = zip_path_spec.ZipPathSpec(
+        location='/stored', parent=self._os_path_spec)
+
+    file_object = zip_file_io.ZipFile(self._resolver_context)
+    file_object.open(path_spec=path_spec)
+
+    # pylint: disable=protected-access
+    self.assertIsNotNone(file_object._compressed_stream_offset)
+
+    self._TestRandomAccess(file_object)
+
+    self.assertIsNone(file_object._zip_ext_file)
+
+    file_object.close()
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -4,6 +4,7 @@
 
 from __future__ import unicode_literals
 
+import multiprocessing
 import os
 import unittest
 
@@ -15,6 +16,7 @@ from dfvfs.path import os_path_spec
 from dfvfs.path import qcow_path_spec
 from dfvfs.path import tsk_path_spec
 from dfvfs.resolver import context
+from dfvfs.serializer import json_serializer
 from dfvfs.vfs import os_file_system
 from dfvfs.vfs import tsk_file_system
 
@@ -55,6 +57,9 @@ class FindSpecTest(shared_test_lib.BaseTestCase):
 
     find_spec = file_system_searcher.FindSpec(location=['location'])
     self.assertIsNotNone(find_spec)
+    self.assertTrue(find_spec.is_case_sensitive)
+    self.assertFalse(find_spec.is_regex)
+    self.assertEqual(find_spec.location_segments, ['location'])
 
     with self.assertRaises(TypeError):
       find_spec = file_system_searcher.FindSpec(location={})
@@ -62,8 +67,11 @@ class FindSpecTest(shared_test_lib.BaseTestCase):
     find_spec = file_system_searcher.FindSpec(location_glob='loca?ion')
     self.assertIsNotNone(find_spec)
 
-    find_spec = file_system_searcher.FindSpec(location_glob=['loca?ion'])
+    find_spec = file_system_searcher.FindSpec(
+        case_sensitive=False, location_glob=['loca?ion'])
     self.assertIsNotNone(find_spec)
+    self.assertFalse(find_spec.is_case_sensitive)
+    self.assertTrue(find_spec.is_regex)
 
     with self.assertRaises(TypeError):
       find_spec = file_system_searcher.FindSpec(location_glob={})
@@ -290,6 +298,158 @@ class FindSpecTest(shared_test_lib.BaseTestCase):
     self.assertEqual(find_spec._number_of_location_segments, 6)
 
 
+class FindSpecsMatcherTest(shared_test_lib.BaseTestCase):
+  """Tests for the find specifications matcher."""
+
+  # pylint: disable=protected-access
+
+  def _CreateTestFileSystem(self):
+    """Create a file system for testing.
+
+    Returns:
+      FakeFileSystem: file system for testing.
+    """
+    file_system_builder = fake_file_system_builder.FakeFileSystemBuilder()
+
+    test_path = '/usr/lib/python2.7/site-packages/dfvfs/__init__.py'
+    file_system_builder.AddFile(test_path, b'# -*- coding: utf-8 -*-')
+
+    return file_system_builder.file_system
+
+  def _CreateTestMatcher(self, file_system):
+    """Create a find specifications matcher for testing.
+
+    Args:
+      file_system (FileSystem): file system.
+
+    Returns:
+      FindSpecsMatcher: find specifications matcher for testing.
+    """
+    find_specs = [
+        file_system_searcher.FindSpec(
+            location='/usr/lib/python2.7/site-packages/dfvfs/__init__.py'),
+        file_system_searcher.FindSpec(
+            case_sensitive=False,
+            location_glob='/USR/LIB/python*/site-packages'),
+        file_system_searcher.FindSpec(
+            file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE],
+            location_regex='/usr/lib/.*/site-packages/dfvfs/.*'),
+        file_system_searcher.FindSpec(location_regex='/usr/bo[g')]
+
+    for find_spec in find_specs:
+      find_spec.PrepareMatches(file_system)
+
+    return file_system_searcher.FindSpecsMatcher(find_specs)
+
+  def testGetLiteralSegment(self):
+    """Test the _GetLiteralSegment() function."""
+    matcher = file_system_searcher.FindSpecsMatcher([])
+
+    literal_segment = matcher._GetLiteralSegment('site\\-packages')
+    self.assertEqual(literal_segment, 'site-packages')
+
+    literal_segment = matcher._GetLiteralSegment('__init__\\.py')
+    self.assertEqual(literal_segment, '__init__.py')
+
+    literal_segment = matcher._GetLiteralSegment('python.*')
+    self.assertIsNone(literal_segment)
+
+    literal_segment = matcher._GetLiteralSegment('\\d+')
+    self.assertIsNone(literal_segment)
+
+    literal_segment = matcher._GetLiteralSegment('bogus\\')
+    self.assertIsNone(literal_segment)
+
+  def testGetSubNodes(self):
+    """Test the GetSubNodes() function."""
+    file_system = self._CreateTestFileSystem()
+    matcher = self._CreateTestMatcher(file_system)
+
+    nodes = matcher.GetRootNodes()
+    self.assertEqual(len(nodes), 1)
+
+    # The case sensitive and case insensitive usr segments are separate nodes.
+    nodes = matcher.GetSubNodes(nodes, 'usr')
+    self.assertEqual(len(nodes), 2)
+
+    nodes = matcher.GetSubNodes(nodes, 'lib')
+    self.assertEqual(len(nodes), 2)
+
+    # python2.7 matches a literal, a glob and a regular expression segment.
+    nodes = matcher.GetSubNodes(nodes, 'python2.7')
+    self.assertEqual(len(nodes), 3)
+
+    nodes = matcher.GetSubNodes(nodes, 'site-packages')
+    self.assertEqual(len(nodes), 3)
+
+    test_nodes = matcher.GetSubNodes(nodes, 'bogus')
+    self.assertEqual(test_nodes, [])
+
+    nodes = matcher.GetSubNodes(nodes, 'dfvfs')
+    self.assertEqual(len(nodes), 2)
+
+    nodes = matcher.GetSubNodes(nodes, '__init__.py')
+    self.assertEqual(len(nodes), 2)
+
+    nodes = matcher.GetSubNodes(matcher.GetRootNodes(), 'USR')
+    self.assertEqual(len(nodes), 1)
+
+  def testHasSubNodes(self):
+    """Test the HasSubNodes() function."""
+    file_system = self._CreateTestFileSystem()
+    matcher = self._CreateTestMatcher(file_system)
+
+    nodes = matcher.GetRootNodes()
+    self.assertTrue(matcher.HasSubNodes(nodes))
+
+    for name in ('usr', 'lib', 'python2.7', 'site-packages', 'dfvfs'):
+      nodes = matcher.GetSubNodes(nodes, name)
+
+    self.assertTrue(matcher.HasSubNodes(nodes))
+
+    nodes = matcher.GetSubNodes(nodes, '__init__.py')
+    self.assertFalse(matcher.HasSubNodes(nodes))
+
+    find_specs = [file_system_searcher.FindSpec()]
+    matcher = file_system_searcher.FindSpecsMatcher(find_specs)
+
+    self.assertTrue(matcher.MatchesAnyLocation())
+    self.assertTrue(matcher.HasSubNodes([]))
+
+  def testGetMatchingFindSpecs(self):
+    """Test the GetMatchingFindSpecs() function."""
+    file_system = self._CreateTestFileSystem()
+    matcher = self._CreateTestMatcher(file_system)
+
+    nodes = matcher.GetRootNodes()
+    for name in ('usr', 'lib', 'python2.7', 'site-packages'):
+      nodes = matcher.GetSubNodes(nodes, name)
+
+    path_spec = fake_path_spec.FakePathSpec(
+        location='/usr/lib/python2.7/site-packages')
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+
+    find_specs = matcher.GetMatchingFindSpecs(file_entry, nodes)
+    self.assertEqual(len(find_specs), 1)
+
+    for name in ('dfvfs', '__init__.py'):
+      nodes = matcher.GetSubNodes(nodes, name)
+
+    path_spec = fake_path_spec.FakePathSpec(
+        location='/usr/lib/python2.7/site-packages/dfvfs/__init__.py')
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+
+    find_specs = matcher.GetMatchingFindSpecs(file_entry, nodes)
+    self.assertEqual(len(find_specs), 2)
+
+    path_spec = fake_path_spec.FakePathSpec(
+        location='/usr/lib/python2.7/site-packages/dfvfs')
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+
+    find_specs = matcher.GetMatchingFindSpecs(file_entry, nodes)
+    self.assertEqual(len(find_specs), 1)
+
+
 @shared_test_lib.skipUnlessHasTestFile(['password.txt'])
 @shared_test_lib.skipUnlessHasTestFile(['vsstest.qcow2'])
 class FileSystemSearcherTest(shared_test_lib.BaseTestCase):
@@ -526,6 +686,7 @@ class FileSystemSearcherTest(shared_test_lib.BaseTestCase):
         self._GetTestFilePath(['syslog.base16']),
         self._GetTestFilePath(['syslog.base32']),
         self._GetTestFilePath(['syslog.base64']),
+        self._GetTestFilePath(['syslog.bgz']),
         self._GetTestFilePath(['syslog.bin.cpio']),
         self._GetTestFilePath(['syslog.blowfish']),
         self._GetTestFilePath(['syslog.bz2']),
@@ -578,6 +739,7 @@ class FileSystemSearcherTest(shared_test_lib.BaseTestCase):
         self._GetTestFilePath(['syslog.base16']),
         self._GetTestFilePath(['syslog.base32']),
         self._GetTestFilePath(['syslog.base64']),
+        self._GetTestFilePath(['syslog.bgz']),
         self._GetTestFilePath(['syslog.bin.cpio']),
         self._GetTestFilePath(['syslog.blowfish']),
         self._GetTestFilePath(['syslog.bz2']),
@@ -611,6 +773,85 @@ class FileSystemSearcherTest(shared_test_lib.BaseTestCase):
     test_relative_path = searcher.GetRelativePath(first_path_spec)
     self.assertEqual(test_relative_path, expected_relative_path)
 
+  def testFindInParallel(self):
+    """Test the Find() function with multiple processes."""
+    searcher = file_system_searcher.FileSystemSearcher(
+        self._tsk_file_system, self._qcow_path_spec)
+
+    find_spec = file_system_searcher.FindSpec(
+        file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE])
+    expected_locations = sorted([
+        getattr(path_spec, 'location', '')
+        for path_spec in searcher.Find(find_specs=[find_spec])])
+
+    find_spec = file_system_searcher.FindSpec(
+        file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE])
+    path_spec_generator = searcher.Find(
+        find_specs=[find_spec], number_of_workers=2)
+    self.assertIsNotNone(path_spec_generator)
+
+    locations = []
+    for path_spec in path_spec_generator:
+      self.assertEqual(path_spec.parent, self._qcow_path_spec)
+      locations.append(getattr(path_spec, 'location', ''))
+
+    self.assertEqual(len(locations), 24)
+    self.assertEqual(sorted(locations), expected_locations)
+
+    # Find the file entries with a location.
+    find_spec1 = file_system_searcher.FindSpec(
+        location='/$Extend/$RmMetadata')
+    find_spec2 = file_system_searcher.FindSpec(
+        location=['$Extend', '$RmMetadata', '$TxfLog', '$TxfLog.blf'])
+    find_spec3 = file_system_searcher.FindSpec(
+        location='/PASSWORD.TXT')
+    path_spec_generator = searcher.Find(
+        find_specs=[find_spec1, find_spec2, find_spec3], number_of_workers=2)
+
+    expected_locations = [
+        '/$Extend/$RmMetadata',
+        '/$Extend/$RmMetadata/$TxfLog/$TxfLog.blf']
+
+    locations = [
+        getattr(path_spec, 'location', '') for path_spec in path_spec_generator]
+    self.assertEqual(sorted(locations), expected_locations)
+
+
+@shared_test_lib.skipUnlessHasTestFile(['syslog'])
+class FindProcessTest(shared_test_lib.BaseTestCase):
+  """Tests for the find process."""
+
+  # pylint: disable=protected-access
+
+  def testRunWithError(self):
+    """Test the run function with a sub tree that cannot be searched."""
+    test_file = self._GetTestFilePath(['syslog'])
+    os_path_spec_object = os_path_spec.OSPathSpec(location=test_file)
+    mount_point = tsk_path_spec.TSKPathSpec(
+        location='/', parent=os_path_spec_object)
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location='/bogus', parent=os_path_spec_object)
+
+    find_spec = file_system_searcher.FindSpec(location='/bogus')
+    matcher = file_system_searcher.FindSpecsMatcher([find_spec])
+
+    task_queue = multiprocessing.Queue()
+    result_queue = multiprocessing.Queue()
+
+    task_queue.put((
+        json_serializer.JsonPathSpecSerializer.WriteSerialized(path_spec),
+        'bogus'))
+    task_queue.put(None)
+
+    find_process = file_system_searcher._FindProcess(
+        json_serializer.JsonPathSpecSerializer.WriteSerialized(mount_point),
+        matcher, task_queue, result_queue)
+    find_process.run()
+
+    serialized_path_spec, error_string = result_queue.get()
+    self.assertIsNone(serialized_path_spec)
+    self.assertIsNotNone(error_string)
+
 
 if __name__ == '__main__':
   unittest.main()
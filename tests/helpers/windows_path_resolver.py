@@ -143,6 +143,90 @@ class WindowsPathResolverTest(shared_test_lib.BaseTestCase):
     path_spec = path_resolver.ResolvePath(windows_path)
     self.assertIsNone(path_spec)
 
+  def testResolvePathWithPrefixesCache(self):
+    """Test the resolve path function with the prefixes cache."""
+    # pylint: disable=protected-access
+    path_resolver = windows_path_resolver.WindowsPathResolver(
+        self._tsk_file_system, self._qcow_path_spec)
+
+    expected_path = (
+        '/System Volume Information/{3808876b-c176-4e48-b7ae-04046e6cc752}')
+
+    windows_path = (
+        'C:\\System Volume Information'
+        '\\{3808876b-c176-4e48-b7ae-04046e6cc752}')
+    path_spec = path_resolver.ResolvePath(windows_path)
+    self.assertIsNotNone(path_spec)
+    self.assertEqual(path_spec.location, expected_path)
+    self.assertEqual(len(path_resolver._prefixes_cache), 2)
+
+    cached_path_spec, _ = path_resolver._prefixes_cache[(
+        'System Volume Information', '{3808876b-c176-4e48-b7ae-04046e6cc752}')]
+    self.assertEqual(cached_path_spec, path_spec)
+
+    path_spec = path_resolver.ResolvePath(windows_path)
+    self.assertIsNotNone(path_spec)
+    self.assertEqual(path_spec.location, expected_path)
+    self.assertEqual(len(path_resolver._prefixes_cache), 2)
+
+    # The sub file entry is resolved from the cached path specification of
+    # the parent directory.
+    expected_path = (
+        '/System Volume Information/{600f0b69-5bdf-11e3-9d6c-005056c00008}'
+        '{3808876b-c176-4e48-b7ae-04046e6cc752}')
+
+    windows_path = (
+        'C:\\System Volume Information'
+        '\\{600f0b69-5bdf-11e3-9d6c-005056c00008}'
+        '{3808876b-c176-4e48-b7ae-04046e6cc752}')
+    path_spec = path_resolver.ResolvePath(windows_path)
+    self.assertIsNotNone(path_spec)
+    self.assertEqual(path_spec.location, expected_path)
+    self.assertEqual(len(path_resolver._prefixes_cache), 3)
+
+    windows_path = 'C:\\System Volume Information\\bogus'
+    path_spec = path_resolver.ResolvePath(windows_path)
+    self.assertIsNone(path_spec)
+    self.assertEqual(len(path_resolver._prefixes_cache), 4)
+
+    cached_value = path_resolver._prefixes_cache[(
+        'System Volume Information', 'bogus')]
+    self.assertIsNone(cached_value)
+
+    windows_path = 'C:\\System Volume Information\\bogus\\file.txt'
+    path_spec = path_resolver.ResolvePath(windows_path)
+    self.assertIsNone(path_spec)
+    self.assertEqual(len(path_resolver._prefixes_cache), 4)
+
+    windows_path = 'C:\\System Volume Information\\..\\SYSLOG.GZ'
+    path_spec = path_resolver.ResolvePath(windows_path)
+    self.assertIsNotNone(path_spec)
+    self.assertEqual(path_spec.location, '/syslog.gz')
+
+  def testResolvePaths(self):
+    """Test the resolve paths function."""
+    path_resolver = windows_path_resolver.WindowsPathResolver(
+        self._tsk_file_system, self._qcow_path_spec)
+
+    windows_paths = [
+        '\\SYSLOG.GZ',
+        'C:\\System Volume Information\\bogus',
+        'C:\\System Volume Information'
+        '\\{3808876b-c176-4e48-b7ae-04046e6cc752}',
+        'SYSLOG.GZ']
+
+    path_specs = path_resolver.ResolvePaths(iter(windows_paths))
+    self.assertEqual(len(path_specs), 4)
+
+    self.assertIsNotNone(path_specs[0])
+    self.assertEqual(path_specs[0].location, '/syslog.gz')
+    self.assertIsNone(path_specs[1])
+    self.assertIsNotNone(path_specs[2])
+    self.assertEqual(
+        path_specs[2].location,
+        '/System Volume Information/{3808876b-c176-4e48-b7ae-04046e6cc752}')
+    self.assertIsNone(path_specs[3])
+
   def testResolvePathWithEnvironmentVariable(self):
     """Test the resolve path function with environment variable expansion."""
     path_resolver = windows_path_resolver.WindowsPathResolver(
@@ -183,6 +267,15 @@ class WindowsPathResolverTest(shared_test_lib.BaseTestCase):
     self.assertIsNotNone(path_spec)
     self.assertEqual(path_spec.location, expected_path)
 
+    path_resolver.SetEnvironmentVariable('Test', 'C:\\testdir_os')
+
+    expected_path = self._GetTestFilePath(['testdir_os', 'file1.txt'])
+
+    windows_path = '%Test%\\file1.txt'
+    path_spec = path_resolver.ResolvePath(windows_path)
+    self.assertIsNotNone(path_spec)
+    self.assertEqual(path_spec.location, expected_path)
+
 
 if __name__ == '__main__':
   unittest.main()
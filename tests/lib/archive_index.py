@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the archive member index."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from dfvfs.lib import archive_index
+
+from tests import test_lib as shared_test_lib
+
+
+class ArchiveMemberIndexTest(shared_test_lib.BaseTestCase):
+  """Tests for the archive member index."""
+
+  def _CreateTestIndex(self):
+    """Creates an archive member index for testing.
+
+    Returns:
+      ArchiveMemberIndex: archive member index.
+    """
+    member_index = archive_index.ArchiveMemberIndex()
+    member_index.AddMember('a_directory/', 'member1')
+    member_index.AddMember('a_directory/a_file', 'member2')
+    member_index.AddMember('another_directory', 'member3', is_directory=True)
+    member_index.AddMember('missing/sub_directory/another_file', 'member4')
+    member_index.AddMember('syslog', 'member5')
+    member_index.AddMember('syslog', 'member6')
+    return member_index
+
+  def testDirectoryExists(self):
+    """Test the DirectoryExists function."""
+    member_index = self._CreateTestIndex()
+
+    self.assertTrue(member_index.DirectoryExists(''))
+    self.assertTrue(member_index.DirectoryExists('a_directory'))
+    self.assertTrue(member_index.DirectoryExists('a_directory/'))
+    self.assertTrue(member_index.DirectoryExists('another_directory'))
+    self.assertTrue(member_index.DirectoryExists('missing'))
+    self.assertTrue(member_index.DirectoryExists('missing/sub_directory'))
+
+    self.assertFalse(member_index.DirectoryExists('a_directory/a_file'))
+    self.assertFalse(member_index.DirectoryExists('syslog'))
+    self.assertFalse(member_index.DirectoryExists('bogus'))
+
+  def testGetMember(self):
+    """Test the GetMember function."""
+    member_index = self._CreateTestIndex()
+
+    self.assertEqual(member_index.GetMember('a_directory/'), 'member1')
+    self.assertEqual(member_index.GetMember('syslog'), 'member6')
+
+    self.assertIsNone(member_index.GetMember('a_directory'))
+    self.assertIsNone(member_index.GetMember('missing'))
+
+  def testGetSubEntryNames(self):
+    """Test the GetSubEntryNames function."""
+    member_index = self._CreateTestIndex()
+
+    names = member_index.GetSubEntryNames('')
+    self.assertEqual(
+        names, ['a_directory', 'another_directory', 'missing', 'syslog'])
+
+    names = member_index.GetSubEntryNames('a_directory')
+    self.assertEqual(names, ['a_file'])
+
+    names = member_index.GetSubEntryNames('/missing/')
+    self.assertEqual(names, ['sub_directory'])
+
+    names = member_index.GetSubEntryNames('another_directory')
+    self.assertEqual(names, [])
+
+    names = member_index.GetSubEntryNames('bogus')
+    self.assertEqual(names, [])
+
+  def testPathExists(self):
+    """Test the PathExists function."""
+    member_index = self._CreateTestIndex()
+
+    self.assertTrue(member_index.PathExists(''))
+    self.assertTrue(member_index.PathExists('a_directory'))
+    self.assertTrue(member_index.PathExists('a_directory/a_file'))
+    self.assertTrue(member_index.PathExists('missing/sub_directory'))
+    self.assertTrue(member_index.PathExists('syslog'))
+
+    self.assertFalse(member_index.PathExists('sys'))
+    self.assertFalse(member_index.PathExists('a_directory/bogus'))
+    self.assertFalse(member_index.PathExists('bogus/a_file'))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -94,6 +94,64 @@ class CPIOArchiveFileTest(shared_test_lib.BaseTestCase):
 
       file_io_object.close()
 
+  def testReadFileEntryHeaderValues(self):
+    """Tests the _ReadFileEntryHeaderValues function."""
+    test_file = cpio.CPIOArchiveFile()
+    test_file.file_format = 'newc'
+
+    header_data = (
+        b'07070101D0B1D1000081B4000003E8000003E80000000155654FC1000004DF'
+        b'000000FD0000000300000000000000000000000700000000')
+    header_values = test_file._ReadFileEntryHeaderValues(header_data)
+    self.assertEqual(header_values, (
+        0x01d0b1d1, 0o100664, 1000, 1000, 1432702913, 7, 1247))
+
+    # Values that cannot be decoded at once, such as values with leading
+    # white space, require the slower per value decoding.
+    header_data = (
+        b'070701 1D0B1D1000081B4000003E8000003E80000000155654FC1000004DF'
+        b'000000FD0000000300000000000000000000000700000000')
+    header_values = test_file._ReadFileEntryHeaderValues(header_data)
+    self.assertIsNone(header_values)
+
+  @shared_test_lib.skipUnlessHasTestFile(['syslog.bin.cpio'])
+  @shared_test_lib.skipUnlessHasTestFile(['syslog.crc.cpio'])
+  @shared_test_lib.skipUnlessHasTestFile(['syslog.newc.cpio'])
+  @shared_test_lib.skipUnlessHasTestFile(['syslog.odc.cpio'])
+  def testReadFileEntryValues(self):
+    """Tests the _ReadFileEntryValues function."""
+    test_files = [
+        ('bin-little-endian', 'syslog.bin.cpio'),
+        ('crc', 'syslog.crc.cpio'),
+        ('newc', 'syslog.newc.cpio'),
+        ('odc', 'syslog.odc.cpio')]
+
+    for file_format, filename in test_files:
+      test_file = cpio.CPIOArchiveFile()
+      test_file.file_format = file_format
+
+      test_file_path = self._GetTestFilePath([filename])
+      with open(test_file_path, 'rb') as file_object:
+        file_io_object = file_object_io.FileObjectIO(
+            None, file_object=file_object)
+        file_io_object.open()
+
+        file_offset = 0
+        for expected_path in ('syslog', 'TRAILER!!!'):
+          expected_file_entry = test_file._ReadFileEntry(
+              file_io_object, file_offset)
+
+          path, file_entry_values = test_file._ReadFileEntryValues(
+              file_io_object, file_offset)
+          self.assertEqual(path, expected_path)
+
+          file_entry = test_file._CreateFileEntry(path, file_entry_values)
+          self.assertEqual(file_entry.__dict__, expected_file_entry.__dict__)
+
+          file_offset += file_entry.size
+
+        file_io_object.close()
+
   @shared_test_lib.skipUnlessHasTestFile(['syslog.bin.cpio'])
   def testReadFileEntriesOnBinary(self):
     """Tests the _ReadFileEntries function on binary format."""
@@ -157,6 +215,32 @@ class CPIOArchiveFileTest(shared_test_lib.BaseTestCase):
 
       file_io_object.close()
 
+  @shared_test_lib.skipUnlessHasTestFile(['syslog.bin.cpio'])
+  def testGetFilePathsOnBinary(self):
+    """Tests the GetFilePaths function on binary format."""
+    test_file = cpio.CPIOArchiveFile()
+
+    test_file_path = self._GetTestFilePath(['syslog.bin.cpio'])
+    with open(test_file_path, 'rb') as file_object:
+      file_io_object = file_object_io.FileObjectIO(
+          None, file_object=file_object)
+      file_io_object.open()
+
+      test_file.Open(file_io_object)
+
+      paths = list(test_file.GetFilePaths())
+      self.assertEqual(paths, ['syslog'])
+
+      paths = list(test_file.GetFilePaths(path_prefix='bogus'))
+      self.assertEqual(paths, [])
+
+      test_file.Close()
+
+      paths = list(test_file.GetFilePaths())
+      self.assertEqual(paths, [])
+
+      file_io_object.close()
+
   @shared_test_lib.skipUnlessHasTestFile(['syslog.bin.cpio'])
   def testGetFileEntryByPathOnBinary(self):
     """Tests the GetFileEntryByPath function on binary format."""
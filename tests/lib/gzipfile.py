@@ -10,9 +10,194 @@ from __future__ import unicode_literals
 
 import unittest
 
+from dfvfs.lib import definitions
+from dfvfs.lib import gzipfile
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+from tests import test_lib as shared_test_lib
+
 
 # TODO: add tests for _GzipDecompressorState
-# TODO: add tests for GzipMember
+
+
+class TestGzipMember(gzipfile.GzipMember):
+  """Gzip member with small cache and access point intervals for testing."""
+
+  _ACCESS_POINT_INTERVAL = 128
+
+  _MAXIMUM_NUMBER_OF_ACCESS_POINTS = 4
+
+  _UNCOMPRESSED_DATA_BLOCK_SIZE = 32
+
+  _UNCOMPRESSED_DATA_CACHE_SIZE = 128
+
+
+@shared_test_lib.skipUnlessHasTestFile(['syslog.gz'])
+@shared_test_lib.skipUnlessHasTestFile(['syslog'])
+class GzipMemberTest(shared_test_lib.BaseTestCase):
+  """Tests for a gzip member."""
+
+  # pylint: disable=protected-access
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_path = self._GetTestFilePath(['syslog.gz'])
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+
+    self._file_object = resolver.Resolver.OpenFileObject(
+        test_os_path_spec, resolver_context=self._resolver_context)
+
+    self._maximum_read_size = gzipfile._GzipDecompressorState._MAXIMUM_READ_SIZE
+    gzipfile._GzipDecompressorState._MAXIMUM_READ_SIZE = 16
+
+    test_path = self._GetTestFilePath(['syslog'])
+    with open(test_path, 'rb') as file_object:
+      self._expected_data = file_object.read()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    gzipfile._GzipDecompressorState._MAXIMUM_READ_SIZE = (
+        self._maximum_read_size)
+
+    self._file_object.close()
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    member = TestGzipMember(self._file_object, 0, 0)
+
+    self.assertEqual(
+        member.uncompressed_data_size, len(self._expected_data))
+    self.assertEqual(member.original_filename, 'syslog.1')
+    self.assertEqual(member.member_start_offset, 0)
+    self.assertEqual(member.member_end_offset, self._file_object.get_size())
+
+  def testAccessPoints(self):
+    """Tests the access points."""
+    member = TestGzipMember(self._file_object, 0, 0)
+
+    self.assertGreater(len(member._access_points), 1)
+    self.assertLessEqual(
+        len(member._access_points), member._MAXIMUM_NUMBER_OF_ACCESS_POINTS)
+    self.assertEqual(
+        len(member._access_points), len(member._access_points_offsets))
+
+    # The syslog test file requires more access points than the maximum,
+    # hence the interval between the access points has been increased.
+    self.assertGreater(
+        member._access_point_interval, member._ACCESS_POINT_INTERVAL)
+
+    for index, access_point in enumerate(member._access_points):
+      access_point_offset = member._access_points_offsets[index]
+      self.assertEqual(access_point.uncompressed_offset, access_point_offset)
+      if index > 0:
+        self.assertGreaterEqual(
+            access_point_offset - member._access_points_offsets[index - 1],
+            member._access_point_interval)
+
+    self.assertIsNone(member._GetAccessPoint(0))
+
+    access_point = member._GetAccessPoint(member.uncompressed_data_size)
+    self.assertIs(access_point, member._access_points[-1])
+
+  def testReadAtOffset(self):
+    """Tests the ReadAtOffset function."""
+    member = TestGzipMember(self._file_object, 0, 0)
+
+    for offset in (1000, 167, 500, 0, 1200, 600):
+      data = member.ReadAtOffset(offset, 40)
+      self.assertEqual(data, self._expected_data[offset:offset + len(data)])
+      self.assertGreater(len(data), 0)
+
+    # Reading backwards resumes decompression from an access point.
+    member.FlushCache()
+    self.assertEqual(member.GetCacheSize(), 0)
+
+    member.ReadAtOffset(1200, 10)
+    data = member.ReadAtOffset(680, 10)
+    self.assertEqual(data, self._expected_data[680:690])
+
+    access_point = member._GetAccessPoint(680)
+    self.assertIsNotNone(access_point)
+    self.assertGreaterEqual(member._uncompressed_data_offset, 680)
+
+    # The block cache holds multiple blocks of the member.
+    self.assertGreater(member.GetCacheSize(), 32)
+    self.assertLessEqual(member.GetCacheSize(), 128)
+
+    block_data = member._block_cache.GetBlock(member, 1184)
+    self.assertEqual(block_data, self._expected_data[1184:1216])
+
+    # The last block of the member is smaller than the block size.
+    data = member.ReadAtOffset(1240)
+    self.assertEqual(data, self._expected_data[1240:])
+
+    data = member.ReadAtOffset(member.uncompressed_data_size)
+    self.assertEqual(data, b'')
+
+    with self.assertRaises(ValueError):
+      member.ReadAtOffset(-1)
+
+    with self.assertRaises(ValueError):
+      member.ReadAtOffset(0, size=-1)
+
+
+@shared_test_lib.skipUnlessHasTestFile(['syslog.bgz'])
+@shared_test_lib.skipUnlessHasTestFile(['syslog'])
+class BGZFGzipMemberTest(shared_test_lib.BaseTestCase):
+  """Tests for a BGZF gzip member."""
+
+  # pylint: disable=protected-access
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_path = self._GetTestFilePath(['syslog.bgz'])
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+
+    self._file_object = resolver.Resolver.OpenFileObject(
+        test_os_path_spec, resolver_context=self._resolver_context)
+
+    test_path = self._GetTestFilePath(['syslog'])
+    with open(test_path, 'rb') as file_object:
+      self._expected_data = file_object.read()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._file_object.close()
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    member = gzipfile.GzipMember(self._file_object, 0, 0)
+
+    self.assertEqual(member.uncompressed_data_size, 512)
+    self.assertIsNotNone(member._bgzf_member_size)
+    self.assertEqual(member.member_end_offset, member._bgzf_member_size)
+
+    # The member data is not decompressed to determine the member size.
+    self.assertEqual(member._decompressor_state.uncompressed_offset, 0)
+    self.assertEqual(member.GetCacheSize(), 0)
+
+    data = member.ReadAtOffset(100, 20)
+    self.assertEqual(data, self._expected_data[100:120])
+
+  def testDecompressData(self):
+    """Tests the DecompressData and CacheUncompressedData functions."""
+    member = gzipfile.GzipMember(self._file_object, 0, 0)
+
+    compressed_data = member.ReadCompressedData()
+    uncompressed_data = gzipfile.GzipMember.DecompressData(compressed_data)
+    self.assertEqual(uncompressed_data, self._expected_data[:512])
+
+    member.CacheUncompressedData(uncompressed_data)
+    self.assertEqual(member.GetCacheSize(), 512)
+
+    data = member.ReadAtOffset(500)
+    self.assertEqual(data, self._expected_data[500:512])
 
 
 if __name__ == '__main__':
@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 
 import unittest
 
+from dfvfs.path import location_path_spec
 from dfvfs.path import path_spec
 
 from tests.path import test_lib
@@ -26,6 +27,12 @@ class TestPathSpec(path_spec.PathSpec):
     self.attribute = 'MyAttribute'
 
 
+class TestLocationPathSpec(location_path_spec.LocationPathSpec):
+  """Location-based path specification for testing."""
+
+  TYPE_INDICATOR = 'test'
+
+
 class PathSpecTest(test_lib.PathSpecTestCase):
   """Tests for the VFS path specification interface."""
 
@@ -52,6 +59,40 @@ class PathSpecTest(test_lib.PathSpecTestCase):
 
     self.assertEqual(test_path_spec.comparable, 'type: test\n')
 
+  def testComparableCache(self):
+    """Tests that the comparable property is cached."""
+    parent_path_spec = TestPathSpec()
+    test_path_spec = TestPathSpec(parent=parent_path_spec)
+
+    test_comparable = test_path_spec.comparable
+    self.assertEqual(test_comparable, 'type: test\ntype: test\n')
+    self.assertIs(test_path_spec.comparable, test_comparable)
+    self.assertEqual(hash(test_path_spec), hash(test_comparable))
+
+    test_path_spec.parent = test_lib.TestPathSpec()
+    self.assertEqual(test_path_spec.comparable, 'type: TEST\ntype: test\n')
+
+  def testComparableCacheInvalidation(self):
+    """Tests that the cached comparable is invalidated on change."""
+    parent_path_spec = test_lib.TestPathSpec()
+    test_path_spec = TestLocationPathSpec(
+        location='/1', parent=parent_path_spec)
+    self.assertEqual(
+        test_path_spec.comparable, 'type: TEST\ntype: test, location: /1\n')
+
+    test_path_spec.location = '/2'
+    self.assertEqual(
+        test_path_spec.comparable, 'type: TEST\ntype: test, location: /2\n')
+
+    path_spec_with_parent = TestLocationPathSpec(
+        location='/3', parent=test_path_spec)
+    self.assertEqual(path_spec_with_parent.comparable, (
+        'type: TEST\ntype: test, location: /2\ntype: test, location: /3\n'))
+
+    test_path_spec.location = '/4'
+    self.assertEqual(path_spec_with_parent.comparable, (
+        'type: TEST\ntype: test, location: /4\ntype: test, location: /3\n'))
+
   def testTypeIndicator(self):
     """Tests the type_indicator property."""
     test_path_spec = TestPathSpec()
@@ -15,6 +15,28 @@ class TestVFSObject(object):
   """Test VFS object."""
 
 
+class ComparisonCountingVFSObject(object):
+  """VFS object that counts the number of times it is compared.
+
+  Attributes:
+    number_of_comparisons (int): number of times any of the objects of this
+        class was compared.
+  """
+
+  number_of_comparisons = 0
+
+  def __eq__(self, other):
+    """Determines if the object is equal to another object."""
+    ComparisonCountingVFSObject.number_of_comparisons += 1
+    return self is other
+
+  def __ne__(self, other):
+    """Determines if the object is not equal to another object."""
+    return not self.__eq__(other)
+
+  __hash__ = object.__hash__
+
+
 class ObjectsCacheValueTest(unittest.TestCase):
   """Tests for the resolver objects cache value."""
 
@@ -50,6 +72,31 @@ class ObjectsCacheValueTest(unittest.TestCase):
       cache_value.DecrementReferenceCount()
 
 
+class LRUObjectsCacheEvictionPolicyTest(unittest.TestCase):
+  """Tests for the least recently used objects cache eviction policy."""
+
+  def testGetEvictionCandidates(self):
+    """Tests the GetEvictionCandidates function."""
+    eviction_policy = cache.LRUObjectsCacheEvictionPolicy()
+
+    eviction_policy.AddIdentifier('1')
+    eviction_policy.AddIdentifier('2')
+    eviction_policy.AddIdentifier('3')
+    self.assertEqual(eviction_policy.GetEvictionCandidates(), ['1', '2', '3'])
+
+    eviction_policy.TouchIdentifier('1')
+    self.assertEqual(eviction_policy.GetEvictionCandidates(), ['2', '3', '1'])
+
+    eviction_policy.TouchIdentifier('bogus')
+    self.assertEqual(eviction_policy.GetEvictionCandidates(), ['2', '3', '1'])
+
+    eviction_policy.RemoveIdentifier('3')
+    self.assertEqual(eviction_policy.GetEvictionCandidates(), ['2', '1'])
+
+    eviction_policy.Empty()
+    self.assertEqual(eviction_policy.GetEvictionCandidates(), [])
+
+
 class ObjectsCacheTest(unittest.TestCase):
   """Tests for the resolver objects cache."""
 
@@ -110,6 +157,34 @@ class ObjectsCacheTest(unittest.TestCase):
     cache_object.Empty()
     self.assertEqual(len(cache_object._values), 0)
 
+  def testEvictObject(self):
+    """Tests the EvictObject method."""
+    cache_object = cache.ObjectsCache(2)
+
+    cache_object.CacheObject(self._path_spec.comparable, self._vfs_object)
+
+    path_spec = fake_path_spec.FakePathSpec(location='2')
+    vfs_object = TestVFSObject()
+    cache_object.CacheObject(path_spec.comparable, vfs_object)
+    self.assertTrue(cache_object.IsFull())
+
+    cache_object.GrabObject(self._path_spec.comparable)
+    cache_object.GrabObject(path_spec.comparable)
+
+    evicted_object = cache_object.EvictObject()
+    self.assertIsNone(evicted_object)
+
+    cache_object.ReleaseObject(self._path_spec.comparable)
+    cache_object.ReleaseObject(path_spec.comparable)
+
+    # The first object is the least recently used.
+    cache_object.GetObject(path_spec.comparable)
+
+    evicted_object = cache_object.EvictObject()
+    self.assertEqual(evicted_object, self._vfs_object)
+    self.assertFalse(cache_object.IsFull())
+    self.assertIsNone(cache_object.GetObject(self._path_spec.comparable))
+
   def testGetObject(self):
     """Tests the GetObject method."""
     cache_object = cache.ObjectsCache(1)
@@ -132,6 +207,41 @@ class ObjectsCacheTest(unittest.TestCase):
     self.assertEqual(identifier, self._path_spec.comparable)
     self.assertEqual(cache_value.vfs_object, self._vfs_object)
 
+  def testGetCacheValueByObjectPerformance(self):
+    """Tests that GetCacheValueByObject does not scan the cached values."""
+    number_of_values = 10000
+    cache_object = cache.ObjectsCache(number_of_values)
+
+    vfs_objects = []
+    for index in range(number_of_values):
+      path_spec = fake_path_spec.FakePathSpec(
+          location='/{0:d}'.format(index))
+      vfs_object = ComparisonCountingVFSObject()
+      cache_object.CacheObject(path_spec.comparable, vfs_object)
+      vfs_objects.append((path_spec.comparable, vfs_object))
+
+    ComparisonCountingVFSObject.number_of_comparisons = 0
+
+    for expected_identifier, vfs_object in vfs_objects:
+      identifier, cache_value = cache_object.GetCacheValueByObject(vfs_object)
+      self.assertEqual(identifier, expected_identifier)
+      self.assertIs(cache_value.vfs_object, vfs_object)
+
+    # A linear scan would require in the order of number_of_values squared
+    # comparisons.
+    self.assertEqual(ComparisonCountingVFSObject.number_of_comparisons, 0)
+
+    identifier, cache_value = cache_object.GetCacheValueByObject(
+        ComparisonCountingVFSObject())
+    self.assertIsNone(identifier)
+    self.assertIsNone(cache_value)
+
+    cache_object.RemoveObject(vfs_objects[0][0])
+    identifier, cache_value = cache_object.GetCacheValueByObject(
+        vfs_objects[0][1])
+    self.assertIsNone(identifier)
+    self.assertIsNone(cache_value)
+
   def testGrabAndRelease(self):
     """Tests the GrabObject and ReleaseObject methods."""
     cache_object = cache.ObjectsCache(1)
@@ -159,5 +269,105 @@ class ObjectsCacheTest(unittest.TestCase):
     self.assertEqual(cache_value._reference_count, 0)
 
 
+class BlocksCacheTest(unittest.TestCase):
+  """Tests for the blocks cache."""
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    blocks_cache = cache.BlocksCache(16)
+    self.assertEqual(blocks_cache.maximum_size, 16)
+    self.assertEqual(blocks_cache.size, 0)
+
+    with self.assertRaises(ValueError):
+      cache.BlocksCache(-1)
+
+  def testEmpty(self):
+    """Tests the Empty function."""
+    blocks_cache = cache.BlocksCache(16)
+
+    blocks_cache.SetBlock('data1', 0, b'0123')
+    self.assertEqual(blocks_cache.size, 4)
+
+    blocks_cache.Empty()
+    self.assertEqual(blocks_cache.size, 0)
+    self.assertIsNone(blocks_cache.GetBlock('data1', 0))
+
+  def testGetAndSetBlock(self):
+    """Tests the GetBlock and SetBlock functions."""
+    blocks_cache = cache.BlocksCache(12)
+
+    blocks_cache.SetBlock('data1', 0, b'0123')
+    blocks_cache.SetBlock('data1', 4, b'4567')
+    blocks_cache.SetBlock('data2', 0, b'abcd')
+    self.assertEqual(blocks_cache.size, 12)
+
+    self.assertEqual(blocks_cache.GetBlock('data1', 0), b'0123')
+    self.assertEqual(blocks_cache.GetBlock('data2', 0), b'abcd')
+    self.assertIsNone(blocks_cache.GetBlock('data2', 4))
+
+    # The least recently used block is removed when the cache is full.
+    blocks_cache.SetBlock('data2', 4, b'efgh')
+    self.assertEqual(blocks_cache.size, 12)
+    self.assertIsNone(blocks_cache.GetBlock('data1', 4))
+    self.assertEqual(blocks_cache.GetBlock('data1', 0), b'0123')
+
+    # Replacing a block does not change the size of the cache.
+    blocks_cache.SetBlock('data2', 4, b'EFGH')
+    self.assertEqual(blocks_cache.size, 12)
+    self.assertEqual(blocks_cache.GetBlock('data2', 4), b'EFGH')
+
+    # A block larger than the maximum size is not cached.
+    blocks_cache.SetBlock('data3', 0, b'0123456789abcdef')
+    self.assertEqual(blocks_cache.size, 12)
+    self.assertIsNone(blocks_cache.GetBlock('data3', 0))
+
+  def testGetDataSize(self):
+    """Tests the GetDataSize function."""
+    blocks_cache = cache.BlocksCache(12)
+
+    blocks_cache.SetBlock('data1', 0, b'0123')
+    blocks_cache.SetBlock('data1', 4, b'4567')
+    blocks_cache.SetBlock('data2', 0, b'abcd')
+    self.assertEqual(blocks_cache.GetDataSize('data1'), 8)
+    self.assertEqual(blocks_cache.GetDataSize('data2'), 4)
+    self.assertEqual(blocks_cache.GetDataSize('data3'), 0)
+
+    # The size of the data is updated when a block is removed.
+    blocks_cache.SetBlock('data2', 4, b'efgh')
+    self.assertEqual(blocks_cache.GetDataSize('data1'), 4)
+    self.assertEqual(blocks_cache.GetDataSize('data2'), 8)
+
+  def testIsFull(self):
+    """Tests the IsFull function."""
+    blocks_cache = cache.BlocksCache(8)
+    self.assertFalse(blocks_cache.IsFull())
+
+    blocks_cache.SetBlock('data1', 0, b'0123')
+    self.assertFalse(blocks_cache.IsFull())
+
+    blocks_cache.SetBlock('data1', 4, b'4567')
+    self.assertTrue(blocks_cache.IsFull())
+
+  def testRemoveBlocks(self):
+    """Tests the RemoveBlocks function."""
+    data1_identifier = object()
+    data2_identifier = object()
+
+    blocks_cache = cache.BlocksCache(12)
+
+    blocks_cache.SetBlock(data1_identifier, 0, b'0123')
+    blocks_cache.SetBlock(data2_identifier, 0, b'abcd')
+    blocks_cache.SetBlock(data1_identifier, 4, b'4567')
+
+    blocks_cache.RemoveBlocks(data1_identifier)
+    self.assertEqual(blocks_cache.size, 4)
+    self.assertEqual(blocks_cache.GetDataSize(data1_identifier), 0)
+    self.assertIsNone(blocks_cache.GetBlock(data1_identifier, 0))
+    self.assertEqual(blocks_cache.GetBlock(data2_identifier, 0), b'abcd')
+
+    blocks_cache.RemoveBlocks(data1_identifier)
+    self.assertEqual(blocks_cache.size, 4)
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -7,6 +7,7 @@ from __future__ import unicode_literals
 import unittest
 
 from dfvfs.file_io import fake_file_io
+from dfvfs.lib import errors
 from dfvfs.path import fake_path_spec
 from dfvfs.resolver import context
 from dfvfs.vfs import fake_file_system
@@ -41,7 +42,10 @@ class ContextTest(unittest.TestCase):
     self.assertEqual(len(resolver_context._file_object_cache._values), 1)
 
     resolver_context.ReleaseFileObject(file_object)
-    self.assertEqual(len(resolver_context._file_object_cache._values), 0)
+    self.assertEqual(len(resolver_context._file_object_cache._values), 1)
+
+    reference_count = resolver_context.GetFileObjectReferenceCount(path_spec)
+    self.assertEqual(reference_count, 0)
 
   def testCacheFileSystem(self):
     """Tests the cache file system object functionality."""
@@ -69,7 +73,150 @@ class ContextTest(unittest.TestCase):
     self.assertEqual(len(resolver_context._file_system_cache._values), 1)
 
     resolver_context.ReleaseFileSystem(file_system)
-    self.assertEqual(len(resolver_context._file_system_cache._values), 0)
+    self.assertEqual(len(resolver_context._file_system_cache._values), 1)
+
+    reference_count = resolver_context.GetFileSystemReferenceCount(path_spec)
+    self.assertEqual(reference_count, 0)
+
+  def testEvictFileObjects(self):
+    """Tests the eviction of dereferenced file-like objects."""
+    resolver_context = context.Context(maximum_number_of_file_objects=2)
+
+    path_spec1 = fake_path_spec.FakePathSpec(location='/file1.txt')
+    file_object1 = fake_file_io.FakeFile(resolver_context, b'data1')
+    file_object1.open(path_spec=path_spec1)
+
+    path_spec2 = fake_path_spec.FakePathSpec(location='/file2.txt')
+    file_object2 = fake_file_io.FakeFile(resolver_context, b'data2')
+    file_object2.open(path_spec=path_spec2)
+
+    path_spec3 = fake_path_spec.FakePathSpec(location='/file3.txt')
+    file_object3 = fake_file_io.FakeFile(resolver_context, b'data3')
+
+    with self.assertRaises(errors.CacheFullError):
+      file_object3.open(path_spec=path_spec3)
+
+    file_object3 = fake_file_io.FakeFile(resolver_context, b'data3')
+
+    file_object1.close()
+    file_object2.close()
+
+    # Reuse the second file-like object so that the first one is the least
+    # recently used.
+    self.assertEqual(resolver_context.GetFileObject(path_spec2), file_object2)
+
+    file_object3.open(path_spec=path_spec3)
+
+    # pylint: disable=protected-access
+    self.assertEqual(len(resolver_context._file_object_cache._values), 2)
+    self.assertIsNone(resolver_context.GetFileObject(path_spec1))
+    self.assertFalse(file_object1._is_open)
+    self.assertTrue(file_object2._is_open)
+
+    resolver_context.Empty()
+    self.assertEqual(len(resolver_context._file_object_cache._values), 0)
+    self.assertFalse(file_object2._is_open)
+    self.assertTrue(file_object3._is_open)
+
+  def testCreateEmptyCopy(self):
+    """Tests the CreateEmptyCopy function."""
+    resolver_context = context.Context(
+        maximum_number_of_file_objects=2, maximum_number_of_file_systems=3,
+        maximum_gzip_cache_size=1024, maximum_number_of_gzip_threads=0,
+        maximum_number_of_decryption_threads=4,
+        maximum_tsk_image_cache_size=0)
+
+    path_spec = fake_path_spec.FakePathSpec(location='/file.txt')
+    file_object = fake_file_io.FakeFile(resolver_context, b'data')
+    file_object.open(path_spec=path_spec)
+
+    context_copy = resolver_context.CreateEmptyCopy()
+    self.assertIsNot(context_copy, resolver_context)
+    self.assertIsNone(context_copy.GetFileObject(path_spec))
+
+    # pylint: disable=protected-access
+    self.assertEqual(
+        context_copy._file_object_cache.maximum_number_of_cached_values, 2)
+    self.assertEqual(
+        context_copy._file_system_cache.maximum_number_of_cached_values, 3)
+    self.assertEqual(context_copy.maximum_gzip_cache_size, 1024)
+    self.assertEqual(context_copy.maximum_number_of_gzip_threads, 0)
+    self.assertEqual(context_copy.maximum_number_of_decryption_threads, 4)
+    self.assertIsNone(context_copy.stream_metadata_cache)
+    self.assertIsNone(context_copy.tsk_image_blocks_cache)
+
+    resolver_context.Empty()
+
+  def testGetGzipThreadPool(self):
+    """Tests the GetGzipThreadPool function."""
+    resolver_context = context.Context()
+
+    thread_pool = resolver_context.GetGzipThreadPool(2)
+    self.assertIsNotNone(thread_pool)
+    self.assertIs(resolver_context.GetGzipThreadPool(4), thread_pool)
+
+    resolver_context.Empty()
+
+    # pylint: disable=protected-access
+    self.assertIsNone(resolver_context._gzip_thread_pool)
+
+  def testReuseFileObject(self):
+    """Tests the reuse of a dereferenced file-like object."""
+    resolver_context = context.Context()
+
+    path_spec = fake_path_spec.FakePathSpec(location='/file.txt')
+    file_object = fake_file_io.FakeFile(resolver_context, b'data')
+    file_object.open(path_spec=path_spec)
+    file_object.seek(2)
+    file_object.close()
+
+    file_object.open(path_spec=path_spec)
+    self.assertEqual(file_object.get_offset(), 0)
+    self.assertEqual(resolver_context.GetFileObjectReferenceCount(path_spec), 1)
+    file_object.close()
+
+    # Reopening with another path specification closes the dereferenced
+    # file-like object.
+    other_path_spec = fake_path_spec.FakePathSpec(location='/other.txt')
+    file_object.open(path_spec=other_path_spec)
+    self.assertIsNone(resolver_context.GetFileObject(path_spec))
+    self.assertEqual(
+        resolver_context.GetFileObject(other_path_spec), file_object)
+
+  def testSetMaximumNumberOfFileObjects(self):
+    """Tests the SetMaximumNumberOfFileObjects function."""
+    resolver_context = context.Context()
+
+    for index in range(3):
+      path_spec = fake_path_spec.FakePathSpec(
+          location='/file{0:d}.txt'.format(index))
+      file_object = fake_file_io.FakeFile(resolver_context, b'data')
+      file_object.open(path_spec=path_spec)
+      file_object.close()
+
+    resolver_context.SetMaximumNumberOfFileObjects(1)
+
+    # pylint: disable=protected-access
+    self.assertEqual(len(resolver_context._file_object_cache._values), 1)
+
+    path_spec = fake_path_spec.FakePathSpec(location='/file2.txt')
+    self.assertIsNotNone(resolver_context.GetFileObject(path_spec))
+
+  def testTSKImageBlocksCache(self):
+    """Tests the tsk_image_blocks_cache property."""
+    resolver_context = context.Context()
+    self.assertEqual(
+        resolver_context.tsk_image_blocks_cache.maximum_size,
+        32 * 1024 * 1024)
+
+    resolver_context.tsk_image_blocks_cache.SetBlock('data', 0, b'')
+    resolver_context.Empty()
+    self.assertIsNone(
+        resolver_context.tsk_image_blocks_cache.GetBlock('data', 0))
+
+    resolver_context = context.Context(maximum_tsk_image_cache_size=0)
+    self.assertIsNone(resolver_context.tsk_image_blocks_cache)
+    resolver_context.Empty()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the stream metadata cache."""
+
+from __future__ import unicode_literals
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from dfvfs.file_io import compressed_stream_io
+from dfvfs.lib import definitions
+from dfvfs.path import compressed_stream_path_spec
+from dfvfs.path import os_path_spec
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+from dfvfs.resolver import stream_metadata_cache
+
+from tests import test_lib as shared_test_lib
+
+
+class StreamMetadataCacheTest(shared_test_lib.BaseTestCase):
+  """Tests for the stream metadata cache."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    cache = stream_metadata_cache.StreamMetadataCache(
+        self._temporary_directory)
+    self.assertIsNotNone(cache)
+
+    path = os.path.join(self._temporary_directory, 'bogus')
+    with self.assertRaises(ValueError):
+      stream_metadata_cache.StreamMetadataCache(path)
+
+  def testGetAndSetStreamSize(self):
+    """Tests the GetStreamSize and SetStreamSize functions."""
+    cache = stream_metadata_cache.StreamMetadataCache(
+        self._temporary_directory)
+
+    self.assertIsNone(cache.GetStreamSize('identifier'))
+
+    cache.SetStreamSize('identifier', 1247)
+    self.assertEqual(cache.GetStreamSize('identifier'), 1247)
+
+    cache.SetMetadata('identifier', {'stream_size': 'bogus'})
+    self.assertIsNone(cache.GetStreamSize('identifier'))
+
+    # The identifier should not be stored in the cache.
+    for filename in os.listdir(self._temporary_directory):
+      self.assertNotIn('identifier', filename)
+
+  @shared_test_lib.skipUnlessHasTestFile(['syslog.zlib'])
+  def testGetStreamIdentifier(self):
+    """Tests the GetStreamIdentifier function."""
+    cache = stream_metadata_cache.StreamMetadataCache(
+        self._temporary_directory)
+    resolver_context = context.Context(stream_metadata_cache=cache)
+
+    test_file = self._GetTestFilePath(['syslog.zlib'])
+    test_os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    test_path_spec = compressed_stream_path_spec.CompressedStreamPathSpec(
+        compression_method=definitions.COMPRESSION_METHOD_ZLIB,
+        parent=test_os_path_spec)
+
+    parent_file_object = resolver.Resolver.OpenFileObject(
+        test_os_path_spec, resolver_context=resolver_context)
+
+    identifier = cache.GetStreamIdentifier(
+        test_path_spec, parent_file_object, resolver_context)
+    self.assertIsNotNone(identifier)
+    self.assertIn('parent size: 519', identifier)
+
+    parent_file_object.close()
+
+    # A stream of which the parent has no modification time has no identifier.
+    parent_path_spec = test_path_spec
+    test_path_spec = compressed_stream_path_spec.CompressedStreamPathSpec(
+        compression_method=definitions.COMPRESSION_METHOD_ZLIB,
+        parent=parent_path_spec)
+
+    parent_file_object = resolver.Resolver.OpenFileObject(
+        parent_path_spec, resolver_context=resolver_context)
+
+    identifier = cache.GetStreamIdentifier(
+        test_path_spec, parent_file_object, resolver_context)
+    self.assertIsNone(identifier)
+
+    parent_file_object.close()
+
+  @shared_test_lib.skipUnlessHasTestFile(['syslog.zlib'])
+  def testCompressedStream(self):
+    """Tests the stream metadata cache with a compressed stream."""
+    cache = stream_metadata_cache.StreamMetadataCache(
+        self._temporary_directory)
+
+    test_file = self._GetTestFilePath(['syslog.zlib'])
+    test_os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    test_path_spec = compressed_stream_path_spec.CompressedStreamPathSpec(
+        compression_method=definitions.COMPRESSION_METHOD_ZLIB,
+        parent=test_os_path_spec)
+
+    resolver_context = context.Context(stream_metadata_cache=cache)
+    file_object = compressed_stream_io.CompressedStream(resolver_context)
+    file_object.open(path_spec=test_path_spec)
+
+    # pylint: disable=protected-access
+    self.assertIsNone(file_object._uncompressed_stream_size)
+    self.assertEqual(file_object.get_size(), 1247)
+
+    file_object.close()
+
+    self.assertEqual(len(os.listdir(self._temporary_directory)), 1)
+
+    resolver_context = context.Context(stream_metadata_cache=cache)
+    file_object = compressed_stream_io.CompressedStream(resolver_context)
+    file_object.open(path_spec=test_path_spec)
+
+    self.assertEqual(file_object._uncompressed_stream_size, 1247)
+    self.assertEqual(file_object.get_size(), 1247)
+
+    file_object.close()
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -92,6 +92,67 @@ class DirectoryTest(shared_test_lib.BaseTestCase):
 
     self.assertEqual(list(test_directory.entries), [])
 
+  def testListEntries(self):
+    """Tests the ListEntries function."""
+    test_directory = file_entry.Directory(self._file_system, self._path_spec)
+
+    self.assertEqual(list(test_directory.ListEntries()), [])
+
+
+class DirectoryEntryTest(shared_test_lib.BaseTestCase):
+  """Tests the VFS directory entry."""
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    path_spec = fake_path_spec.FakePathSpec(location='/file.txt')
+    directory_entry = file_entry.DirectoryEntry(path_spec, name='file.txt')
+
+    self.assertIsNone(directory_entry.entry_type)
+    self.assertIsNone(directory_entry.identifier)
+    self.assertIsNone(directory_entry.is_allocated)
+    self.assertEqual(directory_entry.name, 'file.txt')
+    self.assertEqual(directory_entry.path_spec, path_spec)
+
+
+class DirectoryNameIndexTest(shared_test_lib.BaseTestCase):
+  """Tests the VFS directory name index."""
+
+  def testAddPathSpec(self):
+    """Tests the AddPathSpec function."""
+    name_index = file_entry.DirectoryNameIndex()
+    self.assertEqual(name_index.number_of_entries, 0)
+
+    path_spec = fake_path_spec.FakePathSpec(location='/file.txt')
+    name_index.AddPathSpec('file.txt', path_spec)
+    self.assertEqual(name_index.number_of_entries, 1)
+
+    name_index.AddPathSpec('file.txt', path_spec)
+    self.assertEqual(name_index.number_of_entries, 1)
+
+  def testGetPathSpecByName(self):
+    """Tests the GetPathSpecByName function."""
+    name_index = file_entry.DirectoryNameIndex()
+
+    first_path_spec = fake_path_spec.FakePathSpec(location='/File.txt')
+    name_index.AddPathSpec('File.txt', first_path_spec)
+    second_path_spec = fake_path_spec.FakePathSpec(location='/FILE.TXT')
+    name_index.AddPathSpec('FILE.TXT', second_path_spec)
+
+    path_spec = name_index.GetPathSpecByName('File.txt')
+    self.assertEqual(path_spec, first_path_spec)
+
+    path_spec = name_index.GetPathSpecByName('FILE.TXT')
+    self.assertEqual(path_spec, second_path_spec)
+
+    path_spec = name_index.GetPathSpecByName('file.txt')
+    self.assertIsNone(path_spec)
+
+    path_spec = name_index.GetPathSpecByName('file.txt', case_sensitive=False)
+    self.assertEqual(path_spec, first_path_spec)
+
+    path_spec = name_index.GetPathSpecByName('bogus', case_sensitive=False)
+    self.assertIsNone(path_spec)
+
 
 class FileEntryTest(shared_test_lib.BaseTestCase):
   """Tests the VFS file entry interface."""
@@ -293,6 +354,14 @@ class FileEntryTest(shared_test_lib.BaseTestCase):
     sub_file_entry = test_file_entry.GetSubFileEntryByName('bogus')
     self.assertIsNone(sub_file_entry)
 
+  def testListDirectoryEntries(self):
+    """Tests the ListDirectoryEntries function."""
+    test_file_entry = TestFileEntry(
+        self._resolver_context, self._file_system, self._path_spec)
+
+    directory_entries = list(test_file_entry.ListDirectoryEntries())
+    self.assertEqual(directory_entries, [])
+
   def testGetStat(self):
     """Tests the GetStat function."""
     test_file_entry = TestFileEntry(
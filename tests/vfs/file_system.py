@@ -6,7 +6,9 @@ from __future__ import unicode_literals
 
 import unittest
 
+from dfvfs.path import fake_path_spec
 from dfvfs.resolver import context
+from dfvfs.vfs import file_entry
 from dfvfs.vfs import file_system
 
 from tests import test_lib as shared_test_lib
@@ -23,6 +25,8 @@ class TestFileSystem(file_system.FileSystem):
 class FileSystemTest(shared_test_lib.BaseTestCase):
   """Tests the VFS file system object interface."""
 
+  # pylint: disable=protected-access
+
   def setUp(self):
     """Sets up the needed objects used throughout the test."""
     self._resolver_context = context.Context()
@@ -32,6 +36,37 @@ class FileSystemTest(shared_test_lib.BaseTestCase):
     with self.assertRaises(ValueError):
       file_system.FileSystem(self._resolver_context)
 
+  def testCacheDirectoryNameIndex(self):
+    """Tests the CacheDirectoryNameIndex function."""
+    test_file_system = TestFileSystem(self._resolver_context)
+    test_file_system._MAXIMUM_NUMBER_OF_DIRECTORY_NAME_INDEXES = 2
+
+    path_spec1 = fake_path_spec.FakePathSpec(location='/dir1')
+    path_spec2 = fake_path_spec.FakePathSpec(location='/dir2')
+    path_spec3 = fake_path_spec.FakePathSpec(location='/dir3')
+
+    name_index1 = file_entry.DirectoryNameIndex()
+    name_index2 = file_entry.DirectoryNameIndex()
+    name_index3 = file_entry.DirectoryNameIndex()
+
+    test_file_system.CacheDirectoryNameIndex(path_spec1, name_index1)
+    test_file_system.CacheDirectoryNameIndex(path_spec2, name_index2)
+
+    # Mark the first name index as most recently used.
+    name_index = test_file_system.GetCachedDirectoryNameIndex(path_spec1)
+    self.assertEqual(name_index, name_index1)
+
+    test_file_system.CacheDirectoryNameIndex(path_spec3, name_index3)
+
+    name_index = test_file_system.GetCachedDirectoryNameIndex(path_spec1)
+    self.assertEqual(name_index, name_index1)
+
+    name_index = test_file_system.GetCachedDirectoryNameIndex(path_spec2)
+    self.assertIsNone(name_index)
+
+    name_index = test_file_system.GetCachedDirectoryNameIndex(path_spec3)
+    self.assertEqual(name_index, name_index3)
+
   # TODO: add tests for type_indicator property.
   # TODO: add tests for _Close function.
   # TODO: add tests for _Open function.
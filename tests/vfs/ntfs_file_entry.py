@@ -569,6 +569,41 @@ class NTFSFileEntryTest(shared_test_lib.BaseTestCase):
     self.assertIsNotNone(file_entry)
     self.assertFalse(file_entry.IsVirtual())
 
+  def testListDirectoryEntries(self):
+    """Test the ListDirectoryEntries function."""
+    path_spec = ntfs_path_spec.NTFSPathSpec(
+        location='\\', parent=self._qcow_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    directory_entries = {
+        directory_entry.name: directory_entry
+        for directory_entry in file_entry.ListDirectoryEntries()}
+
+    expected_names = [
+        '$AttrDef', '$BadClus', '$Bitmap', '$Boot', '$Extend', '$LogFile',
+        '$MFT', '$MFTMirr', '$Secure', '$UpCase', '$Volume', 'another_file',
+        'password.txt', 'syslog.gz', 'System Volume Information']
+    self.assertEqual(sorted(directory_entries.keys()), sorted(expected_names))
+
+    directory_entry = directory_entries['System Volume Information']
+    self.assertEqual(
+        directory_entry.entry_type, definitions.FILE_ENTRY_TYPE_DIRECTORY)
+    self.assertEqual(directory_entry.identifier, 36)
+    self.assertTrue(directory_entry.is_allocated)
+    self.assertEqual(directory_entry.path_spec.mft_entry, 36)
+    self.assertEqual(
+        directory_entry.path_spec.location, '\\System Volume Information')
+
+    directory_entry = directory_entries['password.txt']
+    self.assertEqual(
+        directory_entry.entry_type, definitions.FILE_ENTRY_TYPE_FILE)
+
+    sub_file_entry = self._file_system.GetFileEntryByPathSpec(
+        directory_entry.path_spec)
+    self.assertEqual(sub_file_entry.name, 'password.txt')
+    self.assertEqual(sub_file_entry.entry_type, directory_entry.entry_type)
+
   def testSubFileEntries(self):
     """Test the sub file entries properties."""
     path_spec = ntfs_path_spec.NTFSPathSpec(
@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 
 import unittest
 
+from dfvfs.lib import definitions
 from dfvfs.path import os_path_spec
 from dfvfs.resolver import context
 from dfvfs.vfs import os_file_entry
@@ -110,6 +111,35 @@ class OSFileEntryTest(shared_test_lib.BaseTestCase):
     self.assertFalse(file_entry.IsPipe())
     self.assertFalse(file_entry.IsSocket())
 
+  def testListDirectoryEntries(self):
+    """Test the ListDirectoryEntries function."""
+    file_entry = self._file_system.GetFileEntryByPathSpec(self._os_path_spec)
+    self.assertIsNotNone(file_entry)
+
+    directory_entries = {
+        directory_entry.name: directory_entry
+        for directory_entry in file_entry.ListDirectoryEntries()}
+
+    expected_names = [
+        'file1.txt', 'file2.txt', 'file3.txt', 'file4.txt', 'file5.txt',
+        'subdir1']
+    self.assertEqual(sorted(directory_entries.keys()), expected_names)
+
+    directory_entry = directory_entries['subdir1']
+    self.assertEqual(
+        directory_entry.path_spec.location,
+        self._file_system.JoinPath([self._os_path_spec.location, 'subdir1']))
+
+    sub_file_entry = self._file_system.GetFileEntryByPathSpec(
+        directory_entry.path_spec)
+    self.assertEqual(sub_file_entry.name, 'subdir1')
+
+    self.assertEqual(
+        directory_entry.entry_type, definitions.FILE_ENTRY_TYPE_DIRECTORY)
+    self.assertEqual(
+        directory_entries['file1.txt'].entry_type,
+        definitions.FILE_ENTRY_TYPE_FILE)
+
   def testSubFileEntries(self):
     """Test the sub file entries iteration functionality."""
     file_entry = self._file_system.GetFileEntryByPathSpec(self._os_path_spec)
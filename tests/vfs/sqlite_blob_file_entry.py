@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 
 import unittest
 
+from dfvfs.lib import errors
 from dfvfs.path import sqlite_blob_path_spec
 from dfvfs.path import os_path_spec
 from dfvfs.resolver import context
@@ -83,6 +84,26 @@ class SQLiteBlobFileEntryTest(shared_test_lib.BaseTestCase):
 
     self.assertEqual(parent_file_entry.name, 'myblobs.blobs')
 
+  def testGetRowBlobs(self):
+    """Tests the GetRowBlobs function."""
+    file_entry = self._file_system.GetFileEntryByPathSpec(
+        self._sqlite_blob_path_spec_directory)
+    self.assertIsNotNone(file_entry)
+
+    row_indexes = []
+    for path_spec, file_object in file_entry.GetRowBlobs():
+      row_indexes.append(path_spec.row_index)
+      file_object.close()
+
+    self.assertEqual(row_indexes, [0, 1, 2, 3])
+
+    file_entry = self._file_system.GetFileEntryByPathSpec(
+        self._sqlite_blob_path_spec)
+    self.assertIsNotNone(file_entry)
+
+    with self.assertRaises(errors.BackEndError):
+      file_entry.GetRowBlobs()
+
   def testGetStat(self):
     """Tests the GetStat function."""
     file_entry = self._file_system.GetFileEntryByPathSpec(
@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 
 import unittest
 
+from dfvfs.lib import errors
 from dfvfs.path import sqlite_blob_path_spec
 from dfvfs.path import os_path_spec
 from dfvfs.resolver import context
@@ -96,6 +97,46 @@ class SQLiteBlobFileSystemTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+  def testGetRowBlobs(self):
+    """Tests the GetRowBlobs function."""
+    file_system = sqlite_blob_file_system.SQLiteBlobFileSystem(
+        self._resolver_context)
+    file_system.Open(self._sqlite_blob_path_spec)
+
+    row_indexes = []
+    for path_spec, file_object in file_system.GetRowBlobs('myblobs', 'blobs'):
+      try:
+        row_indexes.append(path_spec.row_index)
+
+        data = file_object.read()
+        self.assertEqual(len(data), file_object.get_size())
+      finally:
+        file_object.close()
+
+    self.assertEqual(row_indexes, [0, 1, 2, 3])
+
+    with self.assertRaises(errors.BackEndError):
+      list(file_system.GetRowBlobs('bogus', 'blobs'))
+
+    file_system.Close()
+
+  def testGetRowIdentifiers(self):
+    """Tests the GetRowIdentifiers function."""
+    file_system = sqlite_blob_file_system.SQLiteBlobFileSystem(
+        self._resolver_context)
+    file_system.Open(self._sqlite_blob_path_spec)
+
+    row_identifiers = file_system.GetRowIdentifiers('myblobs')
+    self.assertEqual(row_identifiers, [1, 2, 3, 4])
+
+    # The row identifiers are cached per table.
+    self.assertIs(file_system.GetRowIdentifiers('MyBlobs'), row_identifiers)
+
+    row_identifiers = file_system.GetRowIdentifiers('bogus')
+    self.assertIsNone(row_identifiers)
+
+    file_system.Close()
+
 
 if __name__ == '__main__':
   unittest.main()
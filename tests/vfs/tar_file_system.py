@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 
 import unittest
 
+from dfvfs.path import gzip_path_spec
 from dfvfs.path import os_path_spec
 from dfvfs.path import tar_path_spec
 from dfvfs.resolver import context
@@ -51,6 +52,10 @@ class TARFileSystemTest(shared_test_lib.BaseTestCase):
         location='/bogus', parent=self._os_path_spec)
     self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
 
+    path_spec = tar_path_spec.TARPathSpec(
+        location='/sys', parent=self._os_path_spec)
+    self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
+
     file_system.Close()
 
     # Test on a tar file that has missing directory entries.
@@ -120,6 +125,79 @@ class TARFileSystemTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+  def testGetMemberFileObjects(self):
+    """Test the GetMemberFileObjects function."""
+    file_system = tar_file_system.TARFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open(self._tar_path_spec)
+
+    members = []
+    for path_spec, file_object in file_system.GetMemberFileObjects():
+      self.assertEqual(path_spec.parent, self._os_path_spec)
+      members.append((path_spec.location, len(file_object.read())))
+
+    self.assertEqual(members, [('/syslog', 1247)])
+
+    file_system.Close()
+
+  @shared_test_lib.skipUnlessHasTestFile(['missing_directory_entries.tar'])
+  def testGetMemberFileObjectsWithMissingDirectoryEntries(self):
+    """Test the GetMemberFileObjects function with missing directories."""
+    test_file = self._GetTestFilePath(['missing_directory_entries.tar'])
+    test_file_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = tar_path_spec.TARPathSpec(
+        location='/', parent=test_file_path_spec)
+
+    file_system = tar_file_system.TARFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open(path_spec)
+
+    members = []
+    for path_spec, file_object in file_system.GetMemberFileObjects():
+      data = file_object.read()
+
+      file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+      self.assertIsNotNone(file_entry)
+
+      file_object = file_entry.GetFileObject()
+      self.assertEqual(data, file_object.read())
+      file_object.close()
+
+      members.append(path_spec.location)
+
+    expected_members = [
+        '/File System/Recordings/AssetManifest.plist',
+        '/Non Missing Directory Entry/test_file.txt']
+    self.assertEqual(members, expected_members)
+
+    file_system.Close()
+
+  @shared_test_lib.skipUnlessHasTestFile(['syslog.tgz'])
+  def testGetMemberFileObjectsWithCompressedStream(self):
+    """Test the GetMemberFileObjects function on a compressed stream."""
+    test_file = self._GetTestFilePath(['syslog.tgz'])
+    test_file_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    gzip_file_path_spec = gzip_path_spec.GzipPathSpec(
+        parent=test_file_path_spec)
+    path_spec = tar_path_spec.TARPathSpec(
+        location='/', parent=gzip_file_path_spec)
+
+    file_system = tar_file_system.TARFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open(path_spec)
+
+    members = []
+    for path_spec, file_object in file_system.GetMemberFileObjects():
+      self.assertEqual(path_spec.parent, gzip_file_path_spec)
+      members.append((path_spec.location, len(file_object.read())))
+
+    self.assertEqual(members, [('/syslog', 1247)])
+
+    file_system.Close()
+
   def testGetRootFileEntry(self):
     """Test the get root file entry functionality."""
     file_system = tar_file_system.TARFileSystem(self._resolver_context)
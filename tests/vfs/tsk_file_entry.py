@@ -8,6 +8,7 @@ import unittest
 
 import pytsk3
 
+from dfvfs.lib import definitions
 from dfvfs.path import os_path_spec
 from dfvfs.path import qcow_path_spec
 from dfvfs.path import tsk_path_spec
@@ -212,6 +213,28 @@ class TSKFileEntryTestExt2(shared_test_lib.BaseTestCase):
     self.assertEqual(stat_object.mtime, 1337961563)
     self.assertFalse(hasattr(stat_object, 'mtime_nano'))
 
+  def testGetSubFileEntryByName(self):
+    """Tests the GetSubFileEntryByName function."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location='/', parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName('passwords.txt')
+    self.assertIsNotNone(sub_file_entry)
+    self.assertEqual(sub_file_entry.name, 'passwords.txt')
+
+    sub_file_entry = file_entry.GetSubFileEntryByName('PASSWORDS.TXT')
+    self.assertIsNone(sub_file_entry)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName(
+        'PASSWORDS.TXT', case_sensitive=False)
+    self.assertIsNotNone(sub_file_entry)
+    self.assertEqual(sub_file_entry.name, 'passwords.txt')
+
+    sub_file_entry = file_entry.GetSubFileEntryByName('bogus')
+    self.assertIsNone(sub_file_entry)
+
   def testIsFunctions(self):
     """Tests the Is? functions."""
     test_location = '/a_directory/another_file'
@@ -264,6 +287,42 @@ class TSKFileEntryTestExt2(shared_test_lib.BaseTestCase):
     self.assertFalse(file_entry.IsPipe())
     self.assertFalse(file_entry.IsSocket())
 
+  def testListDirectoryEntries(self):
+    """Tests the ListDirectoryEntries function."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location='/', parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    directory_entries = {
+        directory_entry.name: directory_entry
+        for directory_entry in file_entry.ListDirectoryEntries()}
+
+    expected_names = [
+        '$OrphanFiles', 'a_directory', 'a_link', 'lost+found', 'passwords.txt']
+    self.assertEqual(sorted(directory_entries.keys()), expected_names)
+
+    directory_entry = directory_entries['a_directory']
+    self.assertEqual(
+        directory_entry.entry_type, definitions.FILE_ENTRY_TYPE_DIRECTORY)
+    self.assertEqual(directory_entry.identifier, 12)
+    self.assertTrue(directory_entry.is_allocated)
+    self.assertEqual(directory_entry.path_spec.inode, 12)
+    self.assertEqual(directory_entry.path_spec.location, '/a_directory')
+
+    directory_entry = directory_entries['a_link']
+    self.assertEqual(
+        directory_entry.entry_type, definitions.FILE_ENTRY_TYPE_LINK)
+
+    directory_entry = directory_entries['passwords.txt']
+    self.assertEqual(
+        directory_entry.entry_type, definitions.FILE_ENTRY_TYPE_FILE)
+
+    sub_file_entry = self._file_system.GetFileEntryByPathSpec(
+        directory_entry.path_spec)
+    self.assertEqual(sub_file_entry.name, 'passwords.txt')
+    self.assertEqual(sub_file_entry.entry_type, directory_entry.entry_type)
+
   def testSubFileEntries(self):
     """Tests the number_of_sub_file_entries and sub_file_entries properties."""
     path_spec = tsk_path_spec.TSKPathSpec(
@@ -35,6 +35,30 @@ class TSKFileSystemTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+  def testOpenWithTSKImageBlocksCache(self):
+    """Test the open functionality with the TSK image blocks cache."""
+    blocks_cache = self._resolver_context.tsk_image_blocks_cache
+    self.assertEqual(blocks_cache.size, 0)
+
+    file_system = tsk_file_system.TSKFileSystem(self._resolver_context)
+    file_system.Open(self._tsk_path_spec)
+
+    # Opening the file system reads the superblock and root directory.
+    cache_size = blocks_cache.size
+    self.assertGreater(cache_size, 0)
+
+    file_entry = file_system.GetFileEntryByPathSpec(self._tsk_path_spec)
+    self.assertIsNotNone(file_entry)
+
+    file_system.Close()
+
+    # A file system with the same parent reuses the cached data.
+    file_system = tsk_file_system.TSKFileSystem(self._resolver_context)
+    file_system.Open(self._tsk_path_spec)
+    self.assertEqual(blocks_cache.size, cache_size)
+
+    file_system.Close()
+
   def testFileEntryExistsByPathSpec(self):
     """Test the file entry exists by path specification functionality."""
     file_system = tsk_file_system.TSKFileSystem(self._resolver_context)
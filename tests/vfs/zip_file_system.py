@@ -51,6 +51,10 @@ class ZIPFileSystemTest(shared_test_lib.BaseTestCase):
         location='/bogus', parent=self._os_path_spec)
     self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
 
+    path_spec = zip_path_spec.ZipPathSpec(
+        location='/sys', parent=self._os_path_spec)
+    self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
+
     file_system.Close()
 
     # Test on a zip file that has missing directory entries.